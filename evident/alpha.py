@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+"""alpha diversity metrics computed for all the samples of a table at once
+
+The metrics take a samples x OTUs scipy sparse matrix of counts (see
+evident.util.biom_table_to_csr) and return one value per sample, the same
+value the metric of the same name in qiime.alpha_diversity returns; the
+phylogenetic metrics also take the OTU ids and the tree.
+"""
+
+from numpy import (arange, asarray, bincount, diff, errstate, log, ones,
+    repeat, zeros)
+from scipy.sparse import csr_matrix, issparse, vstack
+
+from evident.tree import as_array_tree
+
+
+def _as_counts(counts):
+    """Return counts as a float csr_matrix without explicit zeros"""
+    counts = csr_matrix(counts, dtype=float)
+    counts.eliminate_zeros()
+    return counts
+
+def _row_reduce(counts, values):
+    """Sum values, one per entry of counts.data, for each row of counts"""
+    rows = repeat(arange(counts.shape[0]), diff(counts.indptr))
+    return bincount(rows, weights=values, minlength=counts.shape[0])
+
+def _totals(counts):
+    return asarray(counts.sum(1)).ravel()
+
+def observed_species(counts):
+    """Number of OTUs observed in each sample"""
+    return diff(counts.indptr).astype(float)
+
+def singles(counts):
+    """Number of OTUs observed once in each sample"""
+    return _row_reduce(counts, counts.data == 1)
+
+def doubles(counts):
+    """Number of OTUs observed twice in each sample"""
+    return _row_reduce(counts, counts.data == 2)
+
+def chao1(counts):
+    """Bias corrected Chao1, observed + singles*(singles-1)/(2*(doubles+1))"""
+    s = singles(counts)
+    return observed_species(counts) + s*(s-1)/(2*(doubles(counts)+1))
+
+def _frequencies(counts):
+    """Return the frequency of each entry of counts.data in its sample"""
+    totals = _totals(counts)
+    return counts.data/repeat(totals, diff(counts.indptr))
+
+def shannon(counts):
+    """Shannon entropy in bits, -sum(p*log2(p))"""
+    freqs = _frequencies(counts)
+    return -_row_reduce(counts, freqs*log(freqs))/log(2)
+
+def dominance(counts):
+    """Dominance, sum(p^2)"""
+    freqs = _frequencies(counts)
+    return _row_reduce(counts, freqs*freqs)
+
+def simpson(counts):
+    """Simpson's index, 1 - dominance"""
+    return 1 - dominance(counts)
+
+def goods_coverage(counts):
+    """Good's coverage, 1 - singles/sequences"""
+    with errstate(divide='ignore', invalid='ignore'):
+        return 1 - singles(counts)/_totals(counts)
+
+def faith_pd(counts, otu_ids, tree):
+    """Faith's phylogenetic diversity, qiime's PD_whole_tree
+
+    The length of the branches between the root and the OTUs of each sample.
+    The presence of the OTUs of all the samples goes up to the root in one
+    sparse product with the paths of the observed OTUs (see
+    ArrayTree.ancestors), then the lengths of the reached branches are added.
+    As in qiime the OTUs that are not in the tree are ignored.
+    """
+    tree = as_array_tree(tree)
+    in_tree = [i for i in (diff(counts.tocsc().indptr) > 0).nonzero()[0]
+        if otu_ids[i] in tree.tip_index]
+    if not in_tree:
+        return zeros(counts.shape[0])
+    paths = tree.ancestors(tree.tip_nodes([otu_ids[i] for i in in_tree]))
+    presence = counts[:, in_tree].T.tocsr()
+    presence.data = ones(len(presence.data))
+    node_presence = paths*presence
+    node_presence.data = ones(len(node_presence.data))
+    lengths = tree.lengths.copy()
+    lengths[-1] = 0. # the branch above the root is not part of the tree
+    return node_presence.T*lengths
+
+# metric name (as in qiime.alpha_diversity) to function of the counts
+NONPHYLOGENETIC_ALPHA_METRICS = {
+    'observed_species': observed_species,
+    'singles': singles,
+    'doubles': doubles,
+    'chao1': chao1,
+    'shannon': shannon,
+    'dominance': dominance,
+    'simpson': simpson,
+    'goods_coverage': goods_coverage,
+}
+
+# metric name to function of the counts, the OTU ids and the tree
+PHYLOGENETIC_ALPHA_METRICS = {
+    'pd_whole_tree': faith_pd,
+}
+
+# names qiime gives to the metrics that are not the name of the function
+_QIIME_NAMES = {'pd_whole_tree': 'PD_whole_tree'}
+
+def is_native_alpha_metric(metric):
+    """Return True if the metric is computed by alpha_diversity"""
+    return metric.lower() in NONPHYLOGENETIC_ALPHA_METRICS or \
+        metric.lower() in PHYLOGENETIC_ALPHA_METRICS
+
+def alpha_metric_name(metric):
+    """Return the name of the metric in qiime's alpha diversity files"""
+    return _QIIME_NAMES.get(metric.lower(), metric.lower())
+
+def alpha_diversity(counts, metrics, otu_ids=None, tree=None):
+    """Calculate alpha diversity metrics for all the samples of a table
+
+    Inputs:
+    counts: samples x OTUs scipy sparse matrix or numpy array, or a list of
+    them (i. e. a stack of rarefied tables) that are processed as one table
+    metrics: list of metric names, case insensitive as in qiime
+    otu_ids: list of OTU identifiers, the cols of counts; only used by the
+    phylogenetic metrics
+    tree: tree object or ArrayTree for the phylogenetic metrics
+
+    Output:
+    numpy array with one row per sample (of every table in the list, in
+    order) and one col per metric
+    """
+    if isinstance(counts, (list, tuple)):
+        counts = vstack([c if issparse(c) else csr_matrix(c) for c in counts])
+    counts = _as_counts(counts)
+    result = zeros((counts.shape[0], len(metrics)))
+    for i, metric in enumerate(metrics):
+        name = metric.lower()
+        if name in NONPHYLOGENETIC_ALPHA_METRICS:
+            result[:, i] = NONPHYLOGENETIC_ALPHA_METRICS[name](counts)
+        elif name in PHYLOGENETIC_ALPHA_METRICS:
+            if tree is None or otu_ids is None:
+                raise ValueError, "The metric %s needs a tree and the OTU " \
+                    "ids" % metric
+            result[:, i] = PHYLOGENETIC_ALPHA_METRICS[name](counts, otu_ids,
+                tree)
+        else:
+            raise ValueError, "Unknown alpha diversity metric %s, try one " \
+                "of: %s" % (metric, ', '.join(sorted(
+                NONPHYLOGENETIC_ALPHA_METRICS.keys() +
+                PHYLOGENETIC_ALPHA_METRICS.keys())))
+    return result
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+"""persistent cache of distance matrices shared by all the apache workers
+
+The matrices are stored condensed (see evident.distances.to_condensed).
+"""
+
+from os import environ, listdir, makedirs, remove, rename, utime, getpid
+from os.path import exists, getmtime, getsize, join
+from hashlib import sha1
+
+from numpy import asarray, bincount, load, repeat, save
+from numpy.random import RandomState
+
+from qiime.rarefaction import get_rare_data
+
+from evident.distances import (beta_distmat, distance_matrix,
+    list_known_metrics, to_condensed, to_square)
+from evident.rarefy import rarefy_biom_table
+
+# the directory and the size of the cache can be set from the environment
+DEFAULT_CACHE_DIR = environ.get('EVIDENT_CACHE_DIR', '/tmp/e-vident-cache')
+DEFAULT_CACHE_BYTES = int(environ.get('EVIDENT_CACHE_BYTES', 1024**3))
+
+# part of the keys, changed when the computed distances change so the old
+# entries are never returned; 2: UniFrac uses the branches up to the root
+KEY_VERSION = 2
+
+
+class DistanceMatrixCache(object):
+    """Distance matrices stored as .npy files and loaded memory-mapped
+
+    Each entry is identified by the study, the rarefaction depth, the seed
+    of the random number generator, the metric and the sample ids; the least
+    recently used entries are removed when the files exceed max_bytes. The
+    modification time of the files is the last time they were used so the
+    order is shared by all the processes using the same directory.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR,
+                 max_bytes=DEFAULT_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        if not exists(cache_dir):
+            try:
+                makedirs(cache_dir)
+            except OSError:
+                # another process created it
+                pass
+
+    def key(self, study, depth, seed, metric, sample_ids):
+        """Return the identifier of an entry, the order of the ids is ignored
+        """
+        samples = sha1('\t'.join(sorted(sample_ids))).hexdigest()
+        return sha1('%d\t%s\t%d\t%s\t%s\t%s' % (KEY_VERSION, study, depth,
+            seed, metric, samples)).hexdigest()
+
+    def _paths(self, key):
+        return join(self.cache_dir, key + '.npy'), join(self.cache_dir,
+            key + '.ids')
+
+    def get(self, key):
+        """Return the sample ids and the read-only condensed distmat of key or
+        None"""
+        matrix_fp, ids_fp = self._paths(key)
+        try:
+            distmat = load(matrix_fp, mmap_mode='r')
+            sample_ids = open(ids_fp, 'U').read().split('\n')
+            utime(matrix_fp, None)
+        except (IOError, OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return sample_ids, distmat
+
+    def put(self, key, sample_ids, distmat):
+        """Store an entry, writing to temporary files that are then renamed so
+        other processes never read incomplete files
+
+        Square distmats are condensed before being stored.
+        """
+        distmat = asarray(distmat)
+        if distmat.ndim == 2:
+            distmat = to_condensed(distmat)
+        matrix_fp, ids_fp = self._paths(key)
+        suffix = '.%d.tmp' % getpid()
+        open(ids_fp + suffix, 'w').write('\n'.join(sample_ids))
+        save(open(matrix_fp + suffix, 'wb'), distmat)
+        rename(ids_fp + suffix, ids_fp)
+        rename(matrix_fp + suffix, matrix_fp)
+        self.evict()
+
+    def get_or_compute(self, study, depth, seed, metric, sample_ids,
+                       compute):
+        """Return the entry or compute it with compute() and store it
+
+        compute must return the (sample_ids, distmat) pair to store, the
+        distmat is always returned condensed.
+        """
+        key = self.key(study, depth, seed, metric, sample_ids)
+        result = self.get(key)
+        if result is None:
+            sample_ids, distmat = compute()
+            distmat = asarray(distmat)
+            if distmat.ndim == 2:
+                distmat = to_condensed(distmat)
+            self.put(key, sample_ids, distmat)
+            result = sample_ids, distmat
+        return result
+
+    def size(self):
+        """Return the number of bytes used by the entries"""
+        return sum([getsize(join(self.cache_dir, f))
+            for f in listdir(self.cache_dir) if f.endswith(('.npy', '.ids'))])
+
+    def evict(self):
+        """Remove the least recently used entries until under max_bytes"""
+        entries = []
+        for f in listdir(self.cache_dir):
+            if not f.endswith('.npy'):
+                continue
+            matrix_fp, ids_fp = self._paths(f[:-4])
+            try:
+                entries.append((getmtime(matrix_fp), getsize(matrix_fp) +
+                    getsize(ids_fp), matrix_fp, ids_fp))
+            except OSError:
+                continue
+        entries.sort()
+        total = sum([e[1] for e in entries])
+        while entries and total > self.max_bytes:
+            mtime, size, matrix_fp, ids_fp = entries.pop(0)
+            for fp in (matrix_fp, ids_fp):
+                try:
+                    remove(fp)
+                except OSError:
+                    pass
+            total -= size
+
+    def stats(self):
+        """Return a dict with the hits, misses and bytes used"""
+        return {'hits': self.hits, 'misses': self.misses,
+            'bytes': self.size()}
+
+_default_cache = None
+
+def get_default_cache():
+    """Return the cache of this process in DEFAULT_CACHE_DIR"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = DistanceMatrixCache()
+    return _default_cache
+
+def _subsample_f(random_state):
+    """Return a subsample_f for qiime's get_rare_data that draws with
+    random_state, the same draws cogent's subsample does with the global
+    numpy generator"""
+    def subsample(counts, n):
+        if counts.sum() <= n:
+            return counts
+        observed = counts.nonzero()[0]
+        sequences = repeat(observed, counts[observed].astype(int))
+        return bincount(random_state.permutation(sequences)[:n],
+            minlength=len(counts)).astype(float)
+    return subsample
+
+def rarefied_distmat(biom_table, depth, metric, tree, seed, study=None,
+                     cache=None, condensed=False, rarefied=None):
+    """Distance matrix of biom_table rarefied to depth, cached when possible
+
+    Inputs:
+    biom_table: biom table object, rarefied with evident.rarefy or with
+    qiime's get_rare_data for the metrics evident.distances doesn't compute
+    depth: number of sequences per sample
+    metric: name of the beta diversity metric, see evident.distances
+    tree: tree object for the phylogenetic metrics
+    seed: seed of the random number generator, the same seed gives the same
+    rarefaction; with None nothing is cached
+    study: name of the study, with None nothing is cached
+    cache: DistanceMatrixCache
+    condensed: if True return the condensed float32 distmat
+    rarefied: function without arguments returning the counts, sample ids and
+    OTU ids of biom_table already rarefied to depth with seed (see
+    evident.subsampling), called instead of rarefying again when the distmat
+    isn't cached
+
+    Output:
+    sample_ids: list of sample ids, identifies the cols/rows of the distmat
+    distmat: numpy array with the distances
+    """
+    def compute():
+        if metric in list_known_metrics():
+            if rarefied is not None:
+                counts, sample_ids, otu_ids = rarefied()
+            else:
+                counts, sample_ids, otu_ids = rarefy_biom_table(biom_table,
+                    depth, seed)
+            return sample_ids, distance_matrix(counts, otu_ids, metric, tree,
+                condensed=True)
+        return beta_distmat(get_rare_data(biom_table, depth,
+            subsample_f=_subsample_f(RandomState(seed))), metric, tree,
+            condensed=True)
+
+    if study is None or seed is None or cache is None:
+        sample_ids, distmat = compute()
+    else:
+        sample_ids, distmat = cache.get_or_compute(study, depth, seed, metric,
+            biom_table.SampleIds, compute)
+    return sample_ids, distmat if condensed else to_square(distmat)
@@ -11,28 +11,94 @@ __maintainer__ = "Will Van Treuren"
 __email__ = "wdwvt1@gmail.com"
 __status__ = "Development"
 
-from numpy import arange, eye, nan, zeros
-from qiime.beta_diversity import single_object_beta
-from qiime.parse import parse_distmat
+from numpy import (array, asarray, diag, errstate, eye, nan, newaxis, ones,
+    outer, sqrt, triu, where, zeros)
+from numpy.ma import average, masked_invalid
+from scipy.sparse import csr_matrix
+from evident.distances import (beta_distmat, condensed_take,
+    condensed_upper_rows, permute_condensed, to_condensed)
 from numpy.ma import masked_array
 from numpy.ma.core import MaskedConstant
-from itertools import combinations
+
+class SampleIndex(object):
+    """Map sample ids to their rows/cols in a distmat, built once per distmat.
+    Notes:
+     sample_ids - list of ids, identifies the cols/rows of the distmat.
+     covering - optional dict of treatment:[ids], e.g. the output of
+     treatment_covering; the index arrays of each treatment are precomputed.
+     An instance can be passed as marginal_ids to between_treatments_dist,
+     treatment_dist and within_treatment_dist, so that the position of each
+     sample is a dict lookup instead of a scan of the marginal ids.
+    """
+
+    def __init__(self, sample_ids, covering=None):
+        self.sample_ids = list(sample_ids)
+        self.positions = dict([(s, i) for i, s in enumerate(self.sample_ids)])
+        self._groups = {}
+        self.treatment_indices = {}
+        if covering is not None:
+            for t, group in covering.iteritems():
+                self.treatment_indices[t] = self.group_indices(group)
+
+    def __len__(self):
+        return len(self.sample_ids)
+
+    def matches(self, sample_ids):
+        """Return True if sample_ids are the cols/rows this index was built on.
+        """
+        return self.sample_ids == list(sample_ids)
+
+    def group_indices(self, group):
+        """Return an int array with the positions of the ids in group."""
+        key = tuple(group)
+        try:
+            return self._groups[key]
+        except KeyError:
+            indices = array([self.positions[i] for i in group], dtype=int)
+            self._groups[key] = indices
+            return indices
+
+    def treatment_labels(self, covering, treatments):
+        """Return int array with the position in treatments of each sample.
+        Notes:
+         covering - dict of treatment:[ids], e.g. the one the index was built
+         with.
+         treatments - list of keys of covering, sets the label of each group.
+         samples that are in none of the treatments are labeled with -1.
+        """
+        labels = -ones(len(self.sample_ids), dtype=int)
+        for i, t in enumerate(treatments):
+            labels[self.group_indices(covering[t])] = i
+        return labels
+
+def _as_sample_index(marginal_ids):
+    """Return marginal_ids as a SampleIndex, building one if needed."""
+    if isinstance(marginal_ids, SampleIndex):
+        return marginal_ids
+    return SampleIndex(marginal_ids)
+
+def _block(distmat, rows, cols):
+    """Return the rows x cols block of a square or condensed (1d) distmat."""
+    if distmat.ndim == 1:
+        return condensed_take(distmat, rows, cols)
+    return distmat.take(rows,0).take(cols,1)
 
 def between_treatments_dist(group_t1, group_t2, marginal_ids, distmat):
     """Calculate avg dist, se between treatment 1 and treatment 2 sample groups.
     Notes:
      group_t1 - list of ids found in marginal ids.
      group_t2 - list of ids found in marginal ids. 
-     marginal_ids - list of ids, identifies the cols/rows of the distmat.
-     distmat - symmetric hollow array, dist between samples.
+     marginal_ids - list of ids or SampleIndex, identifies the cols/rows of the
+     distmat.
+     distmat - symmetric hollow array, dist between samples, or its condensed
+     version (see evident.distances.to_condensed).
      This function calculates the average distance between all samples in 
      group_t1 and all samples in group_t2. 
     """
-    if type(marginal_ids)!=list:
-        marginal_ids = list(marginal_ids)
-    g1 = [marginal_ids.index(i) for i in group_t1]
-    g2 = [marginal_ids.index(i) for i in group_t2]
-    d = distmat.take(g1,0).take(g2,1)
+    marginal_ids = _as_sample_index(marginal_ids)
+    g1 = marginal_ids.group_indices(group_t1)
+    g2 = marginal_ids.group_indices(group_t2)
+    d = _block(distmat, g1, g2)
     return d.mean(), d.std()/d.size
 
 def treatment_dist(group, marginal_ids, distmat):
@@ -40,8 +106,9 @@ def treatment_dist(group, marginal_ids, distmat):
     Notes:
      group - list, group of samples to calc intersample dist of.
      distmat - symmetric hollow 2d numpy array, dist between samples listed in 
-     marginal_ids in order of marginal_ids.
-     marginal_ids - list, identifies the cols/rows of the distmat.
+     marginal_ids in order of marginal_ids, or its condensed version.
+     marginal_ids - list or SampleIndex, identifies the cols/rows of the
+     distmat.
      formula:
      B = set(marginal_ids)-set(group) # ids in the distmat that arent in group
      s = sample id in group
@@ -49,11 +116,11 @@ def treatment_dist(group, marginal_ids, distmat):
      summation(dist(s,k))/[len(B)*len(group)]
      excludes dist to self D(i,i) from averages.
     """
-    if type(marginal_ids)!=list:
-        marginal_ids = list(marginal_ids)
-    mdi = list(arange(len(marginal_ids))) # marginal indices indexes in dm
-    group_indices = [marginal_ids.index(i) for i in group]
-    r = distmat[group_indices,:].take(list(set(mdi)-set(group_indices)),1)
+    marginal_ids = _as_sample_index(marginal_ids)
+    group_indices = marginal_ids.group_indices(group)
+    others = ones(len(marginal_ids), dtype=bool) # columns not in the group
+    others[group_indices] = False
+    r = _block(distmat, group_indices, others.nonzero()[0])
     return r.mean(), r.std()/r.size
 
 def within_treatment_dist(group, marginal_ids, distmat):
@@ -61,14 +128,14 @@ def within_treatment_dist(group, marginal_ids, distmat):
     Notes:
      group - list, group of samples to calc intersample dist of.
      distmat - symmetric hollow 2d numpy array, dist between samples listed in 
-     marginal_ids in order of marginal_ids.
-     marginal_ids - list, identifies the cols/rows of the distmat.
+     marginal_ids in order of marginal_ids, or its condensed version.
+     marginal_ids - list or SampleIndex, identifies the cols/rows of the
+     distmat.
      excludes dist to self D(i,i) from averages.
     """
-    if type(marginal_ids)!=list:
-        marginal_ids = list(marginal_ids)
-    group_indices = [marginal_ids.index(i) for i in group]
-    r = distmat.take(group_indices,0).take(group_indices,1)
+    marginal_ids = _as_sample_index(marginal_ids)
+    group_indices = marginal_ids.group_indices(group)
+    r = _block(distmat, group_indices, group_indices)
     num_comps = float(r.size - r.shape[0]) # r is square, r.shape[0]=r.shape[1]
     # unsure about the se calculation -- we are trying to calculate the
     # standard error of this hollow symmetric distmat. however, because of its
@@ -80,6 +147,120 @@ def within_treatment_dist(group, marginal_ids, distmat):
         se = nan 
     return r.sum()/num_comps, se
 
+def group_distance_summary(labels, distmat, num_groups=None, condensed=False):
+    """Calc the sums, counts and means of distmat for all pairs of groups.
+    Notes:
+     labels - 1d int array, the group of each col/row of distmat. negative
+     labels mark samples that are in no group, these only count towards the 
+     to-all distances.
+     distmat - symmetric hollow 2d numpy array, dist between samples, or a 3d
+     array (iterations x n x n) with one such distmat per iteration.
+     num_groups - int, number of groups, defaults to labels.max()+1.
+     condensed - bool, distmat is a condensed distmat (see 
+     evident.distances.to_condensed) or a 2d array (iterations x condensed 
+     length) with one per iteration. condensed distmats are processed a few 
+     rows at a time, the square distmat is never built.
+     The block sums are computed for all groups at once as H'DH and H'(D*D)H 
+     where H is the one-hot encoding of labels, so no sub-block of the distmat
+     is copied. As in within_treatment_dist the dist to self D(i,i) is excluded
+     from the counts of the diagonal blocks.
+    Output:
+     dict with TxT arrays 'sums', 'sumsq', 'counts' and 'means', where [i][j] 
+     are the dists between groups i and j, and length T arrays 'to_all_sums', 
+     'to_all_sumsq', 'to_all_counts' and 'to_all_means' with the dists between
+     each group and all the samples outside of it. when distmat is a stack
+     every array but the counts has a leading iterations axis.
+    """
+    labels = array(labels, dtype=int)
+    if num_groups is None:
+        num_groups = labels.max()+1
+    n = len(labels)
+    grouped = (labels >= 0).nonzero()[0]
+    onehot = csr_matrix((ones(len(grouped)), (grouped, labels[grouped])),
+        shape=(n, num_groups))
+    sizes = array(onehot.sum(0)).ravel()
+
+    single = asarray(distmat).ndim == (1 if condensed else 2)
+    stack = asarray(distmat)
+    if single:
+        stack = stack[newaxis]
+    sums = zeros((len(stack), num_groups, num_groups))
+    sumsq = zeros((len(stack), num_groups, num_groups))
+    to_all_sums = zeros((len(stack), num_groups))
+    to_all_sumsq = zeros((len(stack), num_groups))
+    # each distmat is symmetric so (H'D)' is DH, the products cost O(n^2)
+    # whatever the number of groups as H is sparse
+    for i, dm in enumerate(stack):
+        if condensed:
+            # with U the upper triangle D = U + U', so H'DH = H'UH + (H'UH)'
+            # and the row sums of D are the row plus the col sums of U
+            upper_rows = zeros((num_groups, n))
+            squared_rows = zeros((num_groups, n))
+            row_sums, row_sumsq = zeros(n), zeros(n)
+            for start, rows in condensed_upper_rows(dm):
+                end = start+len(rows)
+                block = onehot[start:end].T
+                upper_rows += block*rows
+                squared_rows += block*(rows*rows)
+                row_sums[start:end] += rows.sum(1)
+                row_sums += rows.sum(0)
+                row_sumsq[start:end] += (rows*rows).sum(1)
+                row_sumsq += (rows*rows).sum(0)
+            sums[i] = onehot.T*upper_rows.T
+            sums[i] += sums[i].T
+            sumsq[i] = onehot.T*squared_rows.T
+            sumsq[i] += sumsq[i].T
+            to_all_sums[i] = onehot.T*row_sums
+            to_all_sumsq[i] = onehot.T*row_sumsq
+        else:
+            group_rows = onehot.T*dm
+            squared_rows = onehot.T*(dm*dm)
+            sums[i] = onehot.T*group_rows.T
+            sumsq[i] = onehot.T*squared_rows.T
+            to_all_sums[i] = group_rows.sum(1)
+            to_all_sumsq[i] = squared_rows.sum(1)
+    counts = outer(sizes, sizes) - diag(sizes)
+    # a group to all other samples is its full rows minus its diagonal block
+    to_all_sums -= sums.diagonal(0, 1, 2)
+    to_all_sumsq -= sumsq.diagonal(0, 1, 2)
+    to_all_counts = sizes*(n-sizes)
+
+    with errstate(divide='ignore', invalid='ignore'):
+        means = sums/counts
+        to_all_means = to_all_sums/to_all_counts
+    summary = {'sums':sums, 'sumsq':sumsq, 'means':means,
+        'to_all_sums':to_all_sums, 'to_all_sumsq':to_all_sumsq,
+        'to_all_means':to_all_means}
+    if single:
+        summary = dict([(k, v[0]) for k, v in summary.iteritems()])
+    summary['counts'] = counts
+    summary['to_all_counts'] = to_all_counts
+    return summary
+
+def _summary_to_treatment_dists(summary):
+    """Make bt_wi_m, bt_wi_se and ta_m_se out of a group_distance_summary.
+    Notes:
+     the standard errors are the std of the block over the number of dists in
+     the block, the way between_treatments_dist, treatment_dist and 
+     within_treatment_dist compute them. groups without any dists (e.g. within
+     a group of a single sample) get nan. a summary of a stack of distmats
+     gives arrays with a leading iterations axis.
+    """
+    with errstate(divide='ignore', invalid='ignore'):
+        var = summary['sumsq']/summary['counts'] - summary['means']**2
+        var[var < 0] = 0. # round off of the sums of squares
+        se = sqrt(var)/summary['counts']
+        ta_var = summary['to_all_sumsq']/summary['to_all_counts'] - \
+            summary['to_all_means']**2
+        ta_var[ta_var < 0] = 0.
+        ta_se = sqrt(ta_var)/summary['to_all_counts']
+    upper = triu(ones(summary['counts'].shape, dtype=bool))
+    bt_wi_m = where(upper, summary['means'], 0.)
+    bt_wi_se = where(upper, se, 0.)
+    ta_m_se = zeros(ta_se.shape + (2,))
+    ta_m_se[...,0], ta_m_se[...,1] = summary['to_all_means'], ta_se
+    return bt_wi_m, bt_wi_se, ta_m_se
+
 def treatment_covering(sids, category, mf):
     """Return dict of treatment to sample id list for sample id in sids.
     Notes:
@@ -95,9 +276,13 @@ def treatment_covering(sids, category, mf):
     # flat_sids = sum(sids,[])
     # treatments = list(set([mf[i][category] for i in flat_sids]))
     treatments = list(set([mf[i][category] for i in sids]))
-    return {t:[i for i in sids if mf[i][category]==t] for t in treatments}
+    covering = {t:[] for t in treatments}
+    for i in sids: # single pass over sids, keeps their order in each list
+        covering[mf[i][category]].append(i)
+    return covering
 
-def compare_treatment_dists(chosen_samples, category, mf, bt, m, tr):
+def compare_treatment_dists(chosen_samples, category, mf, bt, m, tr,
+    sample_index=None, condensed=False):
     """Calculate avg between, within, and to-all distances for chosen_samples.
     Notes: 
      chosen_samples is a list of lists of ids that collectively have some amount
@@ -114,6 +299,11 @@ def compare_treatment_dists(chosen_samples, category, mf, bt, m, tr):
      bt - biom table containing at least all samples contained in the mf.
      m - str, metric to used for beta diversity calculation. 
      tr - tree object, containing at least all nodes in bt.
+     sample_index - SampleIndex of the distmat computed from bt, optional. it
+     is reused when it matches the samples of the distmat, otherwise a new one
+     is built.
+     condensed - bool, compute the distmat as a condensed float32 vector, a
+     quarter of the memory of the square distmat.
     Output:
      A list of marginals that are the treatments of the groups, i.e. ['HF','LF']
      bt_wi_m - a 2d upper triangular array that has the average distances
@@ -124,26 +314,95 @@ def compare_treatment_dists(chosen_samples, category, mf, bt, m, tr):
      the first col is the average distance between that treatment and all others
      and the second col is the se. 
     """
-    dm = single_object_beta(bt, m, tr) #make the sample-sample distance matrix
-    samples, data = parse_distmat(dm) #parse dm which is list of strs
+    #make the sample-sample distmat
+    samples, data = beta_distmat(bt, m, tr, condensed)
     tc = treatment_covering(chosen_samples, category, mf)
+    if sample_index is None or not sample_index.matches(samples):
+        sample_index = SampleIndex(samples, tc)
     output_marginals = tc.keys()
-    # make 3 arrays for output, between-within means, between-within ses, 
-    # to-all means and ses,
-    bt_wi_m = zeros((len(output_marginals),len(output_marginals)))
-    bt_wi_se = zeros((len(output_marginals),len(output_marginals)))
-    ta_m_se = zeros((len(output_marginals),2))
-    for i,t in enumerate(output_marginals): # calculate within and to-all
-        ta_m_se[i][0], ta_m_se[i][1] = treatment_dist(tc[t], samples, data)
-        bt_wi_m[i][i], bt_wi_se[i][i] = within_treatment_dist(tc[t], samples,
-            data)
-    for t1, t2 in combinations(output_marginals, 2): #calculate between dists
-        t1_ind = output_marginals.index(t1)
-        t2_ind = output_marginals.index(t2)
-        bt_wi_m[t1_ind][t2_ind], bt_wi_se[t1_ind][t2_ind] = \
-            between_treatments_dist(tc[t1], tc[t2], samples, data)
+    summary = group_distance_summary(
+        sample_index.treatment_labels(tc, output_marginals), data,
+        len(output_marginals), condensed)
+    bt_wi_m, bt_wi_se, ta_m_se = _summary_to_treatment_dists(summary)
     return output_marginals, bt_wi_m, bt_wi_se, ta_m_se
 
+def make_distmat_stack(biom_tables, m, tr, condensed=False):
+    """Make a 3d array with the distmat of each of the biom_tables.
+    Inputs:
+     biom_tables - list of biom tables with the same samples, e.g. iterations
+     of rarefaction of the same table.
+     m - str, metric to used for beta diversity calculation.
+     tr - tree object, containing at least all nodes in the tables.
+     condensed - bool, stack condensed float32 distmats, see stack_distmats.
+    Output:
+     samples - list of ids, identifies the cols/rows of every distmat.
+     stack - 3d array (iterations x samples x samples), distmats are arranged
+     in the order of samples.
+    """
+    return stack_distmats([beta_distmat(bt, m, tr, condensed)
+        for bt in biom_tables], condensed)
 
+def stack_distmats(distmats, condensed=False):
+    """Make a 3d array from (ids, distmat) pairs with the same samples.
+    Inputs:
+     distmats - list of (ids, distmat) tuples, e.g. from beta_distmat or
+     evident.cache.rarefied_distmat.
+     condensed - bool, the distmats are condensed or are to be condensed.
+    Output:
+     samples - list of ids, identifies the cols/rows of every distmat.
+     stack - 3d array (iterations x samples x samples), distmats are arranged
+     in the order of samples. if condensed a 2d float32 array (iterations x 
+     condensed length) instead.
+    """
+    samples, stack = None, []
+    for ids, data in distmats:
+        if condensed and data.ndim == 2:
+            data = to_condensed(data)
+        if samples is None:
+            samples = SampleIndex(ids)
+        elif not samples.matches(ids):
+            if sorted(ids) != sorted(samples.sample_ids):
+                raise ValueError, "The tables don't have the same samples"
+            order = SampleIndex(ids).group_indices(samples.sample_ids)
+            if condensed:
+                data = permute_condensed(data, order)
+            else:
+                data = data.take(order,0).take(order,1)
+        stack.append(data)
+    return samples.sample_ids, array(stack)
 
-
+def batch_compare_treatment_dists(chosen_samples, category, mf, samples,
+    dm_stack, sample_index=None, condensed=False):
+    """Calc avg between, within, and to-all distances over a distmat stack.
+    Notes:
+     the statistics of compare_treatment_dists for every iteration in one
+     call, plus their average over iterations. nans (e.g. within a group of a 
+     single sample) are masked while averaging so they don't pollute all 
+     iterations, entries that are nan in every iteration stay nan.
+    Inputs:
+     chosen_samples - list of ids. e.g. [sam1,sam7,sam3,sam6,..]
+     category - str, field in mf.
+     mf - parsed mapping file, dict of sample_id:metadata.
+     samples - list of ids, identifies the cols/rows of every distmat.
+     dm_stack - 3d array (iterations x samples x samples), e.g. the output of
+     make_distmat_stack.
+     sample_index - SampleIndex of samples, optional.
+     condensed - bool, dm_stack is a 2d stack of condensed distmats.
+    Output:
+     A list of marginals that are the treatments of the groups, i.e. ['HF','LF']
+     per_iteration - tuple with the bt_wi_m, bt_wi_se and ta_m_se (see 
+     compare_treatment_dists) of each iteration, stacked on the first axis.
+     averages - tuple with bt_wi_m, bt_wi_se and ta_m_se averaged over the
+     iterations.
+    """
+    tc = treatment_covering(chosen_samples, category, mf)
+    if sample_index is None or not sample_index.matches(samples):
+        sample_index = SampleIndex(samples, tc)
+    output_marginals = tc.keys()
+    summary = group_distance_summary(
+        sample_index.treatment_labels(tc, output_marginals), dm_stack,
+        len(output_marginals), condensed)
+    per_iteration = _summary_to_treatment_dists(summary)
+    averages = tuple([average(masked_invalid(r), 0).filled(nan)
+        for r in per_iteration])
+    return output_marginals, per_iteration, averages
@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+"""beta diversity metrics computed for all the pairs of samples at once
+
+The metrics are registered with the names qiime.beta_diversity uses and
+operate on a samples x OTUs scipy sparse matrix (see
+evident.util.biom_table_to_csr), returning a square numpy distance matrix.
+
+A distance matrix can also be kept condensed: the upper triangle, without the
+diagonal, ordered by rows in a float32 vector (as scipy's pdist does), that
+takes a quarter of the memory of the square float64 matrix.
+"""
+
+from numpy import (arange, asarray, bincount, broadcast_arrays, diff, errstate,
+    float32, maximum, minimum, repeat, sqrt, triu_indices, zeros)
+from scipy.sparse import csr_matrix, diags
+
+from qiime.beta_diversity import single_object_beta
+from qiime.parse import parse_distmat
+
+from evident.unifrac import unweighted_unifrac
+from evident.util import biom_table_to_csr
+
+
+CONDENSED_DTYPE = float32
+
+def condensed_size(num_samples):
+    """Return the length of the condensed distmat of num_samples samples"""
+    return num_samples*(num_samples-1)//2
+
+def condensed_num_samples(size):
+    """Return the number of samples of a condensed distmat of length size"""
+    num_samples = int(round((1 + sqrt(1 + 8*size))/2))
+    if condensed_size(num_samples) != size:
+        raise ValueError, "%d is not the length of a condensed distmat" % size
+    return num_samples
+
+def condensed_index(rows, cols, num_samples):
+    """Return the position in the condensed distmat of the (rows, cols) dists
+
+    rows and cols are ints or int arrays, the order of each pair is ignored and
+    the pairs must not be on the diagonal.
+    """
+    rows, cols = asarray(rows), asarray(cols)
+    first, second = minimum(rows, cols), maximum(rows, cols)
+    return num_samples*first - first*(first+1)//2 + second - first - 1
+
+def to_condensed(distmat, dtype=CONDENSED_DTYPE):
+    """Return the condensed version of a square distmat"""
+    distmat = asarray(distmat)
+    return distmat[triu_indices(len(distmat), 1)].astype(dtype)
+
+def condensed_take(condensed, rows, cols):
+    """Return the len(rows) x len(cols) float block of a condensed distmat
+
+    The dists to self are 0, as in the square distmat.
+    """
+    num_samples = condensed_num_samples(len(condensed))
+    rows, cols = asarray(rows)[:, None], asarray(cols)[None, :]
+    self_dists = rows == cols
+    index = condensed_index(rows, cols, num_samples)
+    index[self_dists] = 0
+    block = asarray(condensed, dtype=float).take(index) if len(condensed) \
+        else zeros(index.shape)
+    block[self_dists] = 0.
+    return block
+
+def condensed_rows(condensed, rows_per_block=None):
+    """Yield (start, block), consecutive rows of a condensed distmat
+
+    Each block is the float rows [start, start+len(block)) of the square
+    distmat, so a condensed distmat can be processed a few rows at a time
+    without building the square matrix.
+    """
+    num_samples = condensed_num_samples(len(condensed))
+    if rows_per_block is None:
+        rows_per_block = max(1, 2**20//max(num_samples, 1))
+    cols = arange(num_samples)
+    for start in xrange(0, num_samples, rows_per_block):
+        rows = arange(start, min(start+rows_per_block, num_samples))
+        yield start, condensed_take(condensed, rows, cols)
+
+def condensed_upper_rows(condensed, rows_per_block=None):
+    """Yield (start, block), consecutive rows of the upper triangle
+
+    As condensed_rows, but only the dists right of the diagonal are filled,
+    the rest of each block is 0; each row is a contiguous slice of the
+    condensed distmat, so this is much faster than condensed_rows.
+    """
+    num_samples = condensed_num_samples(len(condensed))
+    if rows_per_block is None:
+        rows_per_block = max(1, 2**20//max(num_samples, 1))
+    for start in xrange(0, num_samples, rows_per_block):
+        end = min(start+rows_per_block, num_samples)
+        block = zeros((end-start, num_samples))
+        for row in xrange(start, end):
+            offset = condensed_index(row, row+1, num_samples)
+            block[row-start, row+1:] = condensed[offset:
+                offset+num_samples-row-1]
+        yield start, block
+
+def to_square(condensed):
+    """Return the square float distmat of a condensed distmat"""
+    num_samples = condensed_num_samples(len(condensed))
+    return condensed_take(condensed, arange(num_samples), arange(num_samples))
+
+def permute_condensed(condensed, order):
+    """Return the condensed distmat of the samples in order"""
+    rows, cols = triu_indices(len(order), 1)
+    order = asarray(order)
+    return asarray(condensed).take(condensed_index(order[rows], order[cols],
+        condensed_num_samples(len(condensed))))
+
+def _row_sums(counts):
+    return asarray(counts.sum(1)).ravel()
+
+def _safe_ratio(numerator, denominator):
+    """Divide element-wise, 0 where the denominator is 0 (i. e. empty rows)"""
+    numerator, denominator = broadcast_arrays(numerator, denominator)
+    with errstate(divide='ignore', invalid='ignore'):
+        ratio = numerator/denominator
+    ratio[denominator == 0] = 0.
+    return ratio
+
+def pairwise_minimum_sums(counts):
+    """Return the sum of the element-wise minimum of all pairs of rows
+
+    min(a, b) is only non-zero where both rows are, so for each row only the
+    non-zero entries of the OTUs it has are visited.
+    """
+    counts = csr_matrix(counts, dtype=float)
+    counts.eliminate_zeros()
+    per_otu = counts.T.tocsr()
+    num_samples = counts.shape[0]
+    sums = zeros((num_samples, num_samples))
+    for i in xrange(num_samples):
+        start, end = counts.indptr[i], counts.indptr[i+1]
+        others = per_otu[counts.indices[start:end]]
+        mins = minimum(others.data, repeat(counts.data[start:end],
+            diff(others.indptr)))
+        sums[i] = bincount(others.indices, weights=mins,
+            minlength=num_samples)
+    return sums
+
+def _gram_distances(rows):
+    """Euclidean distances between all pairs of rows from their dot products
+    """
+    gram = asarray((rows*rows.T).todense())
+    norms = gram.diagonal()
+    squared = norms[:, None] + norms[None, :] - 2*gram
+    squared[squared < 0] = 0.
+    distances = sqrt(squared)
+    distances.flat[::len(distances)+1] = 0.
+    return distances
+
+def _scale_rows(counts, factors):
+    return diags(factors, 0) * counts
+
+def dist_euclidean(counts):
+    """Euclidean distance, sqrt(sum((a-b)^2))"""
+    return _gram_distances(csr_matrix(counts, dtype=float))
+
+def dist_manhattan(counts):
+    """Manhattan distance, sum(|a-b|) = sum(a) + sum(b) - 2*sum(min(a,b))"""
+    totals = _row_sums(counts)
+    distances = totals[:, None] + totals[None, :] - \
+        2*pairwise_minimum_sums(counts)
+    distances.flat[::len(distances)+1] = 0.
+    return distances
+
+def dist_bray_curtis(counts):
+    """Bray-Curtis dissimilarity, sum(|a-b|)/sum(a+b)"""
+    totals = _row_sums(counts)
+    union = totals[:, None] + totals[None, :]
+    return _safe_ratio(union - 2*pairwise_minimum_sums(counts), union)
+
+def dist_kulczynski(counts):
+    """Kulczynski distance, 1 - (sum(min(a,b))/sum(a) + sum(min(a,b))/sum(b))/2
+    """
+    totals = _row_sums(counts)
+    shared = pairwise_minimum_sums(counts)
+    distances = 1 - (_safe_ratio(shared, totals[:, None]) +
+        _safe_ratio(shared, totals[None, :]))/2
+    distances.flat[::len(distances)+1] = 0.
+    return distances
+
+def dist_chord(counts):
+    """Chord distance, euclidean distance of the rows scaled to unit length"""
+    counts = csr_matrix(counts, dtype=float)
+    norms = sqrt(_row_sums(counts.multiply(counts)))
+    return _gram_distances(_scale_rows(counts, _safe_ratio(1., norms)))
+
+def dist_hellinger(counts):
+    """Hellinger distance, euclidean distance of sqrt of the proportions"""
+    counts = csr_matrix(counts, dtype=float)
+    proportions = _scale_rows(counts, _safe_ratio(1., _row_sums(counts)))
+    proportions.data = sqrt(proportions.data)
+    return _gram_distances(proportions)
+
+def _shared_presence(counts):
+    """Return the number of OTUs of each row and shared by each pair of rows
+    """
+    presence = csr_matrix(counts, dtype=float)
+    presence.data = (presence.data > 0).astype(float)
+    presence.eliminate_zeros()
+    shared = asarray((presence*presence.T).todense())
+    return shared.diagonal().copy(), shared
+
+def binary_dist_jaccard(counts):
+    """Binary Jaccard distance, 1 - shared/(a + b - shared) OTUs"""
+    observed, shared = _shared_presence(counts)
+    union = observed[:, None] + observed[None, :] - shared
+    return _safe_ratio(union - shared, union)
+
+def binary_dist_sorensen_dice(counts):
+    """Binary Sorensen-Dice distance, 1 - 2*shared/(a + b) OTUs"""
+    observed, shared = _shared_presence(counts)
+    total = observed[:, None] + observed[None, :]
+    return _safe_ratio(total - 2*shared, total)
+
+# metric name (as in qiime.beta_diversity) to function of the counts
+NONPHYLOGENETIC_METRICS = {
+    'euclidean': dist_euclidean,
+    'manhattan': dist_manhattan,
+    'bray_curtis': dist_bray_curtis,
+    'kulczynski': dist_kulczynski,
+    'chord': dist_chord,
+    'hellinger': dist_hellinger,
+    'binary_jaccard': binary_dist_jaccard,
+    'binary_sorensen_dice': binary_dist_sorensen_dice,
+}
+
+# metric name to function of the counts, the OTU ids and the tree
+PHYLOGENETIC_METRICS = {
+    'unifrac': unweighted_unifrac,
+    'unweighted_unifrac': unweighted_unifrac,
+}
+
+def list_known_metrics():
+    """Return the names of the metrics computed natively"""
+    return sorted(NONPHYLOGENETIC_METRICS.keys() + PHYLOGENETIC_METRICS.keys())
+
+def distance_matrix(counts, otu_ids, metric, tree=None, condensed=False):
+    """Calculate the distance matrix of a samples x OTUs matrix
+
+    Inputs:
+    counts: samples x OTUs numpy array or scipy sparse matrix
+    otu_ids: list of OTU identifiers, the cols of counts
+    metric: name of a metric in NONPHYLOGENETIC_METRICS or
+    PHYLOGENETIC_METRICS
+    tree: tree object or ArrayTree, only used by the phylogenetic metrics
+    condensed: if True return the condensed float32 distmat
+
+    Output:
+    numpy array with the distances between all the samples
+    """
+    if metric in NONPHYLOGENETIC_METRICS:
+        distmat = NONPHYLOGENETIC_METRICS[metric](counts)
+        return to_condensed(distmat) if condensed else distmat
+    elif metric in PHYLOGENETIC_METRICS:
+        if tree is None:
+            raise ValueError, "The metric %s needs a tree" % metric
+        if condensed:
+            return PHYLOGENETIC_METRICS[metric](counts, otu_ids, tree,
+                condensed=True).astype(CONDENSED_DTYPE)
+        return PHYLOGENETIC_METRICS[metric](counts, otu_ids, tree)
+    raise ValueError, "Unknown metric %s, try one of: %s" % (metric,
+        ', '.join(list_known_metrics()))
+
+def beta_distmat(biom_table, metric, tree=None, condensed=False):
+    """Return the sample ids and the distance matrix of a biom table
+
+    The registered metrics are computed natively, any other metric goes
+    through qiime.beta_diversity.single_object_beta.
+
+    Inputs:
+    biom_table: biom table object
+    metric: name of the beta diversity metric, i. e. 'unweighted_unifrac'
+    tree: tree object or ArrayTree for the phylogenetic metrics
+    condensed: if True return the condensed float32 distmat
+
+    Output:
+    samples: list of sample ids, identifies the cols/rows of the distmat
+    distmat: numpy array with the distances, as returned by parse_distmat
+    """
+    if metric in NONPHYLOGENETIC_METRICS or metric in PHYLOGENETIC_METRICS:
+        counts, sample_ids, otu_ids = biom_table_to_csr(biom_table)
+        return sample_ids, distance_matrix(counts, otu_ids, metric, tree,
+            condensed)
+    samples, distmat = parse_distmat(single_object_beta(biom_table, metric,
+        tree))
+    return samples, to_condensed(distmat) if condensed else distmat
@@ -13,39 +13,61 @@ __email__ = "wdwvt1@gmail.com"
 __status__ = "Development"
 
 
-from numpy import searchsorted
-from qiime.filter import filter_mapping_file
-from qiime.util import compute_seqs_per_library_stats
+from numpy import (argsort, array, asarray, load, packbits, savez,
+    searchsorted, unpackbits, zeros)
+
+from evident.util import biom_table_to_csr
 
 def get_sorted_counts_per_sample(biom_table, reverse=False):
-    """gets a sorted list of sequences per sample from min to max
+    """gets the sequences per sample sorted from min to max
     
     inputs:
     biom_table: biom table object
     revers: reverse the ordering value i. e. from max to min
     
     outputs:
-    sorted_counts_per_sample: list of tuples sorted on first element which
-    gives [(seqs/sample, sampleId)... ]
+    counts: numpy array with the sequences of each sample, sorted
+    sample_ids: numpy array with the sample identifier of each count; the
+    samples with the same count are sorted by identifier
     """
 
-    sample_counts = compute_seqs_per_library_stats(biom_table)[4]
-    
-    sorted_counts_per_sample = [(v,k) for k,v in sample_counts.items()]
-    sorted_counts_per_sample.sort()
-    
+    counts, sample_ids, observation_ids = biom_table_to_csr(biom_table)
+    counts = asarray(counts.sum(1)).ravel()
+    sample_ids = array(sample_ids, dtype=object)
+
+    # by identifier, then a stable sort by count keeps the ties in that order
+    order = argsort(sample_ids)
+    order = order[argsort(counts[order], kind='mergesort')]
     if reverse:
-        sorted_counts_per_sample.reverse()
+        order = order[::-1]
+
+    return counts[order], sample_ids[order]
+
+def _tally_sample(tallies, lines, change):
+    """add change to the tally of each value in the lines of a sample
 
-    return sorted_counts_per_sample
+    Inputs:
+    tallies: list of dicts of value to count, one per column of the mapping
+    file except the first and the last
+    lines: lines of the mapping file of the sample
+    change: 1 to add the sample, -1 to remove it
+    """
+    for line in lines:
+        for tally, value in zip(tallies, line[1:-1]):
+            count = tally.get(value, 0) + change
+            if count:
+                tally[value] = count
+            else:
+                del tally[value]
 
 def make_selectors(counts_per_sample, minimum, mapping_file_tuple,
                     subject_header_name, verbose=False):
     """make the four column string needed to print in the selectors file
 
     Inputs:
-    counts_per_sample: a sorted list of tuples with the sample identifier and
-    the number of sequences.
+    counts_per_sample: a tuple with the arrays of the number of sequences and
+    of the sample identifiers sorted from min to max, see
+    get_sorted_counts_per_sample.
     minimum: minimum number of sequences considered to be a valid state.
     mapping_file_tuple: a tuple with the data of a mapping file and the headers.
     subject_header_name: string identifying the name of the column in the 
@@ -56,12 +78,11 @@ def make_selectors(counts_per_sample, minimum, mapping_file_tuple,
     number of samples and metadata fields.
     """
 
-    # unwrap the mapping file
+    # unwrap the sequences per sample and the mapping file
+    counts, sample_ids = counts_per_sample
     mapping_data = mapping_file_tuple[0]
     mapping_headers = mapping_file_tuple[1]
 
-    seqs_per_sample = [t[0] for t in counts_per_sample]
-
     head_val = None
     subj_val = None
     samp_sub = None
@@ -82,13 +103,30 @@ def make_selectors(counts_per_sample, minimum, mapping_file_tuple,
     for key, value in samples_per_subject.iteritems():
         samples_per_subject[key] = least_number_of_samples
 
-    for sequences_per_sample_tuple in counts_per_sample:
+    # the subject of each sample (from its first line) and the lines of each
+    # sample in the mapping file
+    subject_of_sample = {}
+    lines_of_sample = {}
+    for line in mapping_data:
+        subject_of_sample.setdefault(line[0], line[subject_index])
+        lines_of_sample.setdefault(line[0], []).append(line)
 
-        # there's no need to iterate if the minimum rarefaction depth is not met
-        # or if the depth is the same as the previous depth, this would mean a 
+    # how many times each value of each column is in the lines of the samples
+    # that have at least depth sequences; as qiime's filter_mapping_file does
+    # without repeated columns the headers are the first, the last and the
+    # ones in between with more than one value. The counts are sorted, so the
+    # samples are removed from the tallies as the depth goes past them.
+    tallies = [{} for header in mapping_headers[1:-1]]
+    for sample_id in sample_ids:
+        _tally_sample(tallies, lines_of_sample.get(sample_id, []), 1)
+    removed = 0
+
+    # there's no need to iterate if the minimum rarefaction depth is not met
+    for i in xrange(searchsorted(counts, minimum), len(counts)):
+
+        # or if the depth is the same as the previous depth, this would mean a
         # repeated row in the output line with the same values
-        if  sequences_per_sample_tuple[0] < minimum or \
-            sequences_per_sample_tuple[0] == depth:
+        if counts[i] == depth:
             continue
 
         if verbose:
@@ -96,19 +134,23 @@ def make_selectors(counts_per_sample, minimum, mapping_file_tuple,
                 .format(samples_per_subject, depth)
 
         # Some samples are not in the mapping file just print those out
-        sample_id = sequences_per_sample_tuple[1]
+        sample_id = sample_ids[i]
         try:
-            current_subject = [line[subject_index] for line in mapping_data if line[0] == sample_id][0]
-        except IndexError:
+            current_subject = subject_of_sample[sample_id]
+        except KeyError:
             print 'Sample Id: {0} is not in the mapping file'.format(sample_id)
             continue
 
         # extract convenience data for ease of use
-        depth = sequences_per_sample_tuple[0]
-        remaining_ids = [_tuple[1] for _tuple in counts_per_sample if _tuple[0] >= depth]
+        depth = counts[i]
+        while counts[removed] < depth:
+            _tally_sample(tallies, lines_of_sample.get(sample_ids[removed],
+                []), -1)
+            removed += 1
 
-        filtered_headers, filtered_data = filter_mapping_file(mapping_data,\
-            mapping_headers, remaining_ids, include_repeat_cols=False)
+        filtered_headers = [mapping_headers[0]] + [header for header, tally in
+            zip(mapping_headers[1:-1], tallies) if len(tally) > 1] + \
+            [mapping_headers[-1]]
 
         # Breaking when there are no subjects/individuals left
         if subject_header_name not in filtered_headers:
@@ -152,3 +194,81 @@ def make_selectors(counts_per_sample, minimum, mapping_file_tuple,
             pass
 
     return results, main_map_cat
+
+class SelectorIndex(object):
+    """What is available at each depth of a study, the selectors as arrays
+
+    One row per line of make_selectors: the depth where the line starts, the
+    number of subjects, the number of samples per subject and the metadata
+    columns, as a bitmask over columns. The lines with None as metadata take
+    the columns of the previous line, as the interface does.
+    """
+
+    def __init__(self, depths, subjects, samples, masks, columns):
+        self.depths = array(depths, dtype=int)
+        self.subjects = array(subjects, dtype=int)
+        self.samples = array(samples, dtype=int)
+        self.masks = array(masks, dtype='uint8')
+        self.columns = list(columns)
+
+    @classmethod
+    def from_selectors(cls, lines):
+        """Build the index from the lines of make_selectors or selectors.txt,
+        the comment lines are ignored"""
+        rows = [line.rstrip('\n').split('\t') for line in lines
+            if line.strip() and not line.startswith('#')]
+
+        columns = []
+        for row in rows:
+            if row[3] != 'None':
+                columns.extend([c for c in row[3].split(',')
+                    if c and c not in columns])
+
+        bits = zeros((len(rows), len(columns)), dtype=bool)
+        column_index = dict([(c, i) for i, c in enumerate(columns)])
+        for i, row in enumerate(rows):
+            if row[3] == 'None':
+                if i:
+                    bits[i] = bits[i-1]
+            else:
+                bits[i, [column_index[c] for c in row[3].split(',') if c]] = \
+                    True
+        return cls([int(row[0]) for row in rows], [int(row[1]) for row in rows],
+            [int(row[2]) for row in rows], packbits(bits, axis=1), columns)
+
+    @classmethod
+    def load(cls, index_fp):
+        """Load an index written by save"""
+        data = load(index_fp)
+        return cls(data['depths'], data['subjects'], data['samples'],
+            data['masks'], data['columns'].tolist())
+
+    def save(self, index_fp):
+        """Write the index as a numpy .npz file"""
+        savez(index_fp, depths=self.depths,
+            subjects=self.subjects, samples=self.samples, masks=self.masks,
+            columns=array(self.columns, dtype=str))
+
+    def min_depth(self):
+        return int(self.depths[0]) if len(self.depths) else 0
+
+    def max_depth(self):
+        return int(self.depths[-1]) if len(self.depths) else 0
+
+    def query(self, depth):
+        """Return what is available at depth
+
+        Output:
+        dict with the depth of the line that applies, the number of subjects,
+        the number of samples per subject and the list of metadata columns;
+        the line is the last one starting at or below depth, or the first one
+        for depths below it. None if the index is empty.
+        """
+        if not len(self.depths):
+            return None
+        i = max(searchsorted(self.depths, depth, 'right') - 1, 0)
+        bits = unpackbits(self.masks[i])[:len(self.columns)]
+        return {'depth': int(self.depths[i]),
+            'subjects': int(self.subjects[i]),
+            'samples': int(self.samples[i]),
+            'columns': [c for c, bit in zip(self.columns, bits) if bit]}
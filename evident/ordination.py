@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+"""principal coordinates analysis that only solves the requested axes
+
+The results are the ones of qiime.principal_coordinates.pcoa, but as arrays
+and only for the first axes: the centered matrix is reduced once to
+tridiagonal form, all the eigenvalues are taken from it but the eigenvectors
+only of the requested axes, instead of a full eigendecomposition. The PCoAs
+of the iterations of a jackknife are summarized as a stack of coordinates.
+"""
+
+from numpy import (abs as np_abs, asarray, dot, einsum, float64, percentile,
+    sqrt)
+from numpy.linalg import svd
+from scipy.linalg import eigh_tridiagonal, eigvalsh_tridiagonal
+from scipy.linalg.lapack import get_lapack_funcs
+
+from evident.distances import to_square
+
+
+def center_distmat(distmat):
+    """Return the double centered -distmat**2/2 of PCoA
+
+    Inputs:
+    distmat: square or condensed distance matrix
+
+    Output:
+    numpy float64 array, the only samples x samples array that is allocated;
+    the centering is done in place
+    """
+    distmat = asarray(distmat)
+    if distmat.ndim == 1:
+        centered = to_square(distmat).astype(float64)
+    else:
+        centered = distmat.astype(float64)
+    centered *= centered
+    centered *= -0.5
+    # the matrix is symmetric, the means of the cols are the means of the rows
+    means = centered.mean(1)
+    centered -= means
+    centered -= means[:, None]
+    centered += means.mean()
+    return centered
+
+def _top_eigenpairs(centered, axes):
+    """Return all the eigenvalues and the top axes eigenpairs of centered
+
+    Inputs:
+    centered: symmetric float64 numpy array, it is overwritten
+    axes: number of eigenpairs, the largest eigenvalues
+
+    Output:
+    eigenvalues: numpy array with all the eigenvalues, increasing
+    top_eigenvalues: numpy array with the top eigenvalues, increasing
+    eigenvectors: samples x axes numpy array with their eigenvectors
+
+    One Householder reduction (sytrd) gives the tridiagonal matrix whose
+    eigenvalues (sterf) are all computed and whose eigenvectors (stein) are
+    only computed for the top axes; they are then transformed back with the
+    reflectors of the reduction.
+    """
+    num_samples = centered.shape[0]
+    if num_samples == 1:
+        # already diagonal
+        return centered[0], centered[0], centered*0 + 1
+    sytrd, sytrd_lwork = get_lapack_funcs(('sytrd', 'sytrd_lwork'),
+        (centered,))
+    lwork, info = sytrd_lwork(num_samples, lower=1)
+    reflectors, diagonal, off_diagonal, tau, info = sytrd(centered, lower=1,
+        lwork=int(lwork), overwrite_a=1)
+    if info:
+        raise ValueError, "The reduction to tridiagonal form failed"
+    eigenvalues = eigvalsh_tridiagonal(diagonal, off_diagonal,
+        lapack_driver='sterf')
+    top_eigenvalues, eigenvectors = eigh_tridiagonal(diagonal, off_diagonal,
+        select='i', select_range=(num_samples - axes, num_samples - 1),
+        lapack_driver='stebz')
+
+    # Q = H(0) H(1) ... H(n-2), the vector of H(i) is 1 in row i+1 and the
+    # reflectors below it, 0 above
+    for i in range(num_samples - 3, -1, -1):
+        vector = reflectors[i+1:, i].copy()
+        vector[0] = 1
+        eigenvectors[i+1:] -= tau[i]*vector[:, None]*dot(vector,
+            eigenvectors[i+1:])
+    return eigenvalues, top_eigenvalues, eigenvectors
+
+def pcoa(distmat, axes=10):
+    """Principal coordinates of the samples of a distance matrix
+
+    Inputs:
+    distmat: square or condensed distance matrix
+    axes: number of axes to compute, at most the number of samples
+
+    Output:
+    coords: samples x axes numpy array with the coordinates
+    eigenvalues: numpy array with the eigenvalue of each axis, decreasing
+    percents: numpy array with the percent of the variation explained by each
+    axis
+
+    As in qiime the percents are relative to the sum of the absolute values
+    of all the eigenvalues, the negative ones of the non euclidean distances
+    (i. e. UniFrac) included.
+    """
+    centered = center_distmat(distmat)
+    num_samples = centered.shape[0]
+    axes = min(axes, num_samples)
+    all_eigenvalues, eigenvalues, eigenvectors = _top_eigenpairs(centered,
+        axes)
+    total = np_abs(all_eigenvalues).sum()
+    eigenvalues, eigenvectors = eigenvalues[::-1], eigenvectors[:, ::-1]
+    coords = eigenvectors*sqrt(np_abs(eigenvalues))
+    percents = np_abs(eigenvalues)/total*100 if total else eigenvalues*0
+    return coords, eigenvalues, percents
+
+def pcoa_coords(sample_ids, distmat, axes=10):
+    """PCoA in the format of qiime.parse.parse_coords
+
+    Output:
+    headers, coords, eigenvalues and percents as parse_coords returns them
+    from a file written by qiime's pcoa, see pcoa
+    """
+    coords, eigenvalues, percents = pcoa(distmat, axes)
+    return list(sample_ids), coords, eigenvalues, percents
+
+def procrustes_align(coords, reference):
+    """Rotate each matrix of a stack of coordinates to best fit a reference
+
+    Inputs:
+    coords: iterations x samples x axes numpy array
+    reference: samples x axes numpy array
+
+    Output:
+    iterations x samples x axes numpy array with the rotated coordinates
+
+    This is the orthogonal Procrustes problem, solved for all the iterations
+    with one stacked SVD of the axes x axes cross products. The coordinates
+    of a PCoA are centered and in the units of the distances, so they are
+    only rotated (or reflected), not translated or scaled.
+    """
+    u, s, vt = svd(einsum('isa,sb->iab', coords, reference))
+    return einsum('isa,iab->isb', coords, einsum('iab,ibc->iac', u, vt))
+
+def summarize_jackknife(coords, eigenvalues, percents, low=25, high=75):
+    """Summarize the PCoAs of the iterations of a jackknife
+
+    Inputs:
+    coords: iterations x samples x axes numpy array, the samples in the same
+    order in all the iterations
+    eigenvalues: iterations x axes numpy array
+    percents: iterations x axes numpy array
+    low, high: percentiles of the bounds of the coordinates of each sample,
+    the default is the interquartile range
+
+    Output:
+    coords, coords_low and coords_high: samples x axes numpy arrays with the
+    average and the bounds of the coordinates once aligned to the first
+    iteration, see procrustes_align
+    eigenvalues and percents: average of each axis
+    """
+    coords = asarray(coords)
+    aligned = procrustes_align(coords, coords[0])
+    coords_low, coords_high = percentile(aligned, [low, high], axis=0)
+    return aligned.mean(0), coords_low, coords_high, \
+        asarray(eigenvalues).mean(0), asarray(percents).mean(0)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+"""binary payload of the Emperor plots
+
+The coordinates are sent as base64 encoded little-endian float32 buffers and
+each mapping file column as its distinct values plus the base64 encoded code
+of each sample, instead of one JavaScript literal per sample. DECODE_JS
+rebuilds the globals of emperor.js (g_spherePositions, g_ellipsesDimensions
+and g_mappingFileData) from them in the browser.
+"""
+
+from base64 import b64encode
+from json import dumps
+
+from numpy import abs as np_abs, asarray, unique
+
+from emperor.format import format_pcoa_to_js, format_mapping_file_to_js
+
+# functions used by the payload, written once before it
+DECODE_JS = """
+function evidentDecodeBuffer(data) {
+    var raw = window.atob(data), bytes = new Uint8Array(raw.length);
+    for (var i = 0; i < raw.length; i++) {
+        bytes[i] = raw.charCodeAt(i);
+    }
+    return bytes.buffer;
+}
+function evidentDecodeFloat32(data) {
+    return new Float32Array(evidentDecodeBuffer(data));
+}
+function evidentDecodeCodes(data, width) {
+    var buffer = evidentDecodeBuffer(data);
+    if (width == 1) return new Uint8Array(buffer);
+    if (width == 2) return new Uint16Array(buffer);
+    return new Uint32Array(buffer);
+}
+function evidentSetSpheres(ids, axes, coords) {
+    coords = evidentDecodeFloat32(coords);
+    for (var i = 0; i < ids.length; i++) {
+        var sphere = {'name': ids[i], 'color': 0};
+        for (var j = 0; j < axes; j++) {
+            sphere['P' + (j+1)] = coords[i*axes + j];
+        }
+        sphere['x'] = sphere['P1'];
+        sphere['y'] = sphere['P2'];
+        sphere['z'] = sphere['P3'];
+        g_spherePositions[ids[i]] = sphere;
+    }
+}
+function evidentSetEllipses(ids, axes, coords, low, high) {
+    coords = evidentDecodeFloat32(coords);
+    low = evidentDecodeFloat32(low);
+    high = evidentDecodeFloat32(high);
+    for (var i = 0; i < ids.length; i++) {
+        var k = i*axes, ellipse = {'name': ids[i], 'color': 0,
+            'width': Math.abs(high[k] - low[k]),
+            'height': Math.abs(high[k+1] - low[k+1]),
+            'length': Math.abs(high[k+2] - low[k+2]),
+            'x': coords[k], 'y': coords[k+1], 'z': coords[k+2]};
+        for (var j = 0; j < axes; j++) {
+            ellipse['P' + (j+1)] = coords[k + j];
+        }
+        g_ellipsesDimensions[ids[i]] = ellipse;
+    }
+}
+function evidentSetMappingFileData(ids, columns) {
+    var codes = [];
+    for (var c = 0; c < columns.length; c++) {
+        codes.push(evidentDecodeCodes(columns[c][1], columns[c][2]));
+    }
+    for (var i = 0; i < ids.length; i++) {
+        var row = [];
+        for (var c = 0; c < columns.length; c++) {
+            row.push(columns[c][0][codes[c][i]]);
+        }
+        g_mappingFileData[ids[i]] = row;
+    }
+}
+"""
+
+def _js_literal(value):
+    """JSON of value that can be written inside a script element"""
+    return dumps(value).replace('</', '<\\/')
+
+def encode_float32(values):
+    """Return values as a base64 encoded little-endian float32 buffer"""
+    return b64encode(asarray(values, dtype='<f4').tostring())
+
+def encode_categories(values):
+    """Dictionary encode a column of values
+
+    Output:
+    categories: list of the distinct values, sorted
+    codes: base64 encoded little-endian buffer with the index in categories
+    of each value
+    width: number of bytes of each code, 1, 2 or 4
+    """
+    categories, codes = unique(asarray(values, dtype=object).astype(str),
+        return_inverse=True)
+    width = 1 if len(categories) <= 2**8 else 2 if len(categories) <= 2**16 \
+        else 4
+    return categories.tolist(), b64encode(codes.astype('<u%d' %
+        width).tostring()), width
+
+def _extreme_rows(coords, axes):
+    """Return the sorted indices of the rows with the max or min of an axis"""
+    coords = asarray(coords)[:, :axes]
+    rows = set(coords.argmax(0)) | set(coords.argmin(0)) | \
+        set(np_abs(coords).argmax(0))
+    return sorted(rows)
+
+def format_binary_pcoa_to_js(header, coords, eigvals, pct_var, coords_low=None,
+                             coords_high=None, number_of_axes=10,
+                             number_of_segments=8):
+    """JavaScript of a PCoA plot with the coordinates as float32 buffers
+
+    Inputs: as emperor.format.format_pcoa_to_js without the custom axes
+
+    Output:
+    string with the same globals format_pcoa_to_js writes; the scale of the
+    plot (the ranges of the axes, the radius of the spheres, ...) only
+    depends on the extreme coordinates, so format_pcoa_to_js writes it from
+    those rows, and the spheres and ellipses of all the samples are set by
+    DECODE_JS from the buffers
+    """
+    coords = asarray(coords)
+    axes = min(number_of_axes, coords.shape[1])
+    rows = _extreme_rows(coords, axes)
+    jackknifed = coords_low is not None and coords_high is not None
+    scale = format_pcoa_to_js([header[i] for i in rows], coords[rows],
+        eigvals, pct_var, custom_axes=None,
+        coords_low=asarray(coords_low)[rows] if jackknifed else None,
+        coords_high=asarray(coords_high)[rows] if jackknifed else None,
+        number_of_axes=number_of_axes, number_of_segments=number_of_segments)
+    lines = [line for line in scale.split('\n') if not
+        line.startswith(('g_spherePositions[', 'g_ellipsesDimensions['))]
+
+    ids = _js_literal(list(header))
+    lines.append("evidentSetSpheres(%s, %d, '%s');" % (ids, axes,
+        encode_float32(coords[:, :axes])))
+    if jackknifed:
+        lines.append("evidentSetEllipses(%s, %d, '%s', '%s', '%s');" % (ids,
+            axes, encode_float32(coords[:, :axes]),
+            encode_float32(asarray(coords_low)[:, :axes]),
+            encode_float32(asarray(coords_high)[:, :axes])))
+    return '\n'.join(lines) + '\n'
+
+def format_binary_mapping_file_to_js(map_data, map_headers,
+                                     animatable_headers):
+    """JavaScript of the mapping file with dictionary encoded columns
+
+    Inputs: as emperor.format.format_mapping_file_to_js
+
+    Output:
+    string with the globals format_mapping_file_to_js writes, the values of
+    g_mappingFileData are set by DECODE_JS
+    """
+    declarations = format_mapping_file_to_js([], map_headers,
+        animatable_headers)
+    ids = [row[0] for row in map_data]
+    columns = [encode_categories([row[i] for row in map_data])
+        for i in range(len(map_headers))]
+    return declarations + '\nevidentSetMappingFileData(%s, %s);\n' % (
+        _js_literal(ids), _js_literal(columns))
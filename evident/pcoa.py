@@ -13,21 +13,66 @@ __status__ = "Development"
 
 """code for doing pcoa analysis"""
 
-from numpy import array
-from cStringIO import StringIO
+from os import environ
+from multiprocessing import Pool
+from itertools import count
+from numpy import array, random
 
-from qiime.rarefaction import get_rare_data
-from qiime.principal_coordinates import pcoa
-from qiime.beta_diversity import single_object_beta
-from qiime.parse import parse_mapping_file, mapping_file_to_dict, parse_coords
+from qiime.parse import parse_mapping_file, mapping_file_to_dict
 from emperor.format import (format_pcoa_to_js, format_mapping_file_to_js, 
     format_taxa_to_js, format_vectors_to_js, format_emperor_html_footer_string, 
     format_comparison_bars_to_js, EMPEROR_HEADER_HTML_STRING)
-from emperor.util import preprocess_coords_file
 
+from evident.cache import rarefied_distmat
+from evident.ordination import pcoa_coords, summarize_jackknife
+from evident.payload import (DECODE_JS, format_binary_mapping_file_to_js,
+    format_binary_pcoa_to_js)
+
+# number of axes shown by make_pcoa_plot
+PLOT_AXES = 10
+
+# number of processes computing the iterations of a jackknifed PCoA
+DEFAULT_PCOA_WORKERS = int(environ.get('EVIDENT_PCOA_WORKERS', 1))
+
+# inputs of the iterations of each call, stored before the pool is created so
+# the forked workers inherit them instead of receiving a pickle per task
+_iteration_inputs = {}
+_calls = count()
+
+def iter_pcoa_plot(pcoa_headers, pcoa_files, eigenvalues, coords_pct,
+        map_headers, map_data, coords_low=None, coords_high=None,
+        jackkifing_controls=False, binary=False):
+    """ generate the pcoa plot a fragment at a time, see make_pcoa_plot
+
+    Output:
+    generator of the strings of the WebGL PCoA plot, each fragment is formatted
+    when it's requested so it can be written before the next one exists
+    """
+    yield EMPEROR_HEADER_HTML_STRING
+    if binary:
+        yield DECODE_JS
+        yield format_binary_mapping_file_to_js(map_data, map_headers,
+            map_headers)
+        yield format_binary_pcoa_to_js(pcoa_headers, pcoa_files,
+            eigenvalues, coords_pct, coords_low=coords_low,
+            coords_high=coords_high, number_of_axes=PLOT_AXES,
+            number_of_segments=8)
+    else:
+        yield format_mapping_file_to_js(map_data, map_headers, map_headers)
+        yield format_pcoa_to_js(pcoa_headers, pcoa_files,
+            eigenvalues, coords_pct, custom_axes=None, coords_low=coords_low,
+            coords_high=coords_high, number_of_axes=PLOT_AXES,
+            number_of_segments=8)
+    yield format_taxa_to_js([], [], [])
+    yield format_vectors_to_js(map_data, pcoa_files, map_headers,
+        pcoa_headers, None, None)
+    yield format_comparison_bars_to_js(pcoa_files, pcoa_headers, 0, False)
+    yield format_emperor_html_footer_string(False, jackkifing_controls, \
+        False, False)
 
 def make_pcoa_plot(pcoa_headers, pcoa_files, eigenvalues, coords_pct, map_headers, 
-        map_data, coords_low=None, coords_high=None, jackkifing_controls=False): 
+        map_data, coords_low=None, coords_high=None, jackkifing_controls=False,
+        binary=False): 
     """ generate pcoa plot, this is based on make_emperor.py 
 
     Input:
@@ -37,29 +82,43 @@ def make_pcoa_plot(pcoa_headers, pcoa_files, eigenvalues, coords_pct, map_header
     coords_pct: list of the values of the coords points
     map_headers: list of strings with the mapping headers
     map_data: list of lists with the values of the mapping file
+    binary: if True the coordinates and the mapping file are sent as base64
+    buffers decoded in the browser, see evident.payload
     
     Output:
     WebGL string representing the PCoA plot
     """
+    return ''.join(iter_pcoa_plot(pcoa_headers, pcoa_files, eigenvalues,
+        coords_pct, map_headers, map_data, coords_low, coords_high,
+        jackkifing_controls, binary))
 
-    webgl_string = EMPEROR_HEADER_HTML_STRING
-    webgl_string += format_mapping_file_to_js(map_data, map_headers, map_headers)
-    webgl_string += format_pcoa_to_js(pcoa_headers, pcoa_files,
-            eigenvalues, coords_pct, custom_axes=None, coords_low=coords_low,
-            coords_high=coords_high, number_of_axes=10, number_of_segments=8)
-    
-    webgl_string += format_taxa_to_js([], [], [])
-    webgl_string += format_vectors_to_js(map_data, pcoa_files, map_headers,
-        pcoa_headers, None, None)
-    webgl_string += format_comparison_bars_to_js(pcoa_files, pcoa_headers, 0, False)
-    webgl_string += format_emperor_html_footer_string(False, jackkifing_controls, \
-        False, False)
-    
-    return webgl_string
+def _pcoa_iteration(task):
+    """rarefy, get the distmat and run the PCoA of one iteration
 
-def generate_pcoa_cloud_from_point_in_omega(map_headers, map_data, biom_object, metric, 
-        sequences, iterations, axes, tree_object=None):
-    """run the randomisations and get a WebGL PCoA plot string representation
+    Input:
+    task: tuple with the identifier of the inputs in _iteration_inputs and the
+    seed of the iteration
+
+    Output:
+    headers, values, eigenvalues and pct as qiime's parse_coords returns them
+    """
+    call, iteration_seed = task
+    biom_object, sequences, metric, tree_object, study, cache, axes, \
+        rarefied = _iteration_inputs[call]
+    # the rarefaction of the caller is the one of the iteration with its seed
+    if rarefied is not None and iteration_seed == rarefied[0]:
+        rarefied = rarefied[1]
+    else:
+        rarefied = None
+    samples, distmat = rarefied_distmat(biom_object, sequences, metric,
+        tree_object, iteration_seed, study, cache, condensed=True,
+        rarefied=rarefied)
+    return pcoa_coords(samples, distmat, axes)
+
+def iter_pcoa_cloud_from_point_in_omega(map_headers, map_data, biom_object,
+        metric, sequences, iterations, axes, tree_object=None, study=None,
+        seed=None, cache=None, workers=None, binary=False, rarefied=None):
+    """run the randomisations and get the WebGL PCoA plot a fragment at a time
 
     Input:
     mapping_file_tuple: data and headers tuple for representing the mapping file
@@ -67,41 +126,81 @@ def generate_pcoa_cloud_from_point_in_omega(map_headers, map_data, biom_object,
     metric: string of the name for the beta diversity metric, i. e. 'unifrac'
     sequences: number of sequences per sample
     iterations: number of iterations to generate the pcoa plot
-    axes: number of axes to account for
+    axes: number of axes to account for, at least PLOT_AXES are computed
     tree_object: tree to perform the beta diversity calculation
+    study: name of the study, used with seed to cache the distance matrices
+    seed: seed of the first iteration, iteration i is rarefied with seed+i
+    cache: evident.cache.DistanceMatrixCache to get and store the distmats
+    workers: number of processes running the iterations, default is
+    DEFAULT_PCOA_WORKERS; with a seed the result doesn't depend on it
+    binary: if True send the plot data as base64 buffers, see make_pcoa_plot
+    rarefied: function without arguments returning biom_object already
+    rarefied with seed, as select_samples returns it; the first iteration
+    calls it instead of rarefying again when its distmat isn't cached
 
     Output:
-    WebGL string representing the PCoA plot
+    generator of the fragments of the WebGL PCoA plot, see iter_pcoa_plot; the
+    PCoAs are computed before it's returned
     """
-    
-    pcoa_input = {'pcoa_headers':[], 'pcoa_values':[], 'eigenvalues':[], 'coords_pct':[]}
-    for i in range(iterations):
-        rare_biom_table = get_rare_data(biom_object, sequences)
-        beta_dm = single_object_beta(rare_biom_table, metric, tree_object)
-        pcoa_results = pcoa(beta_dm)
-
-        pcoa_file = StringIO()
-        pcoa_file.write(pcoa_results)
-        pcoa_file.seek(0)
-        pcoa_headers, pcoa_values, eigenvalues, coords_pct = parse_coords(pcoa_file)
-        pcoa_file.close()
-        pcoa_input['pcoa_headers'].append(pcoa_headers)
-        pcoa_input['pcoa_values'].append(pcoa_values)
-        pcoa_input['eigenvalues'].append(eigenvalues)
-        pcoa_input['coords_pct'].append(coords_pct)
-    
+    if workers is None:
+        workers = DEFAULT_PCOA_WORKERS
+    workers = min(workers, iterations)
+    if rarefied is not None and seed is not None:
+        rarefied = (seed, rarefied)
+    else:
+        rarefied = None
+
+    # the forked workers share the state of the random number generator, so
+    # without a seed each iteration gets one (and nothing is cached)
+    if seed is None and workers > 1:
+        seed, study = random.randint(0, 2**31 - iterations), None
+    seeds = [None if seed is None else seed+i for i in range(iterations)]
+
+    call = _calls.next()
+    _iteration_inputs[call] = (biom_object, sequences, metric, tree_object,
+        study, cache, max(axes, PLOT_AXES), rarefied)
+    try:
+        if workers > 1:
+            pool = Pool(workers)
+            try:
+                results = pool.map(_pcoa_iteration, [(call, iteration_seed)
+                    for iteration_seed in seeds])
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = map(_pcoa_iteration, [(call, iteration_seed)
+                for iteration_seed in seeds])
+    finally:
+        del _iteration_inputs[call]
+
+    coords_headers = results[0][0]
     if iterations==1:
-        coords_headers = pcoa_input['pcoa_headers'][0]
-        coords_data = pcoa_input['pcoa_values'][0]
-        coords_eigenvalues = pcoa_input['eigenvalues'][0]
-        coords_pct = pcoa_input['coords_pct'][0]
+        coords_data, coords_eigenvalues, coords_pct = results[0][1:]
         coords_low, coords_high = None, None
     else:
-        coords_headers, coords_data, coords_eigenvalues, coords_pct, coords_low,\
-            coords_high, clones = preprocess_coords_file(pcoa_input['pcoa_headers'],
-            pcoa_input['pcoa_values'], pcoa_input['eigenvalues'], 
-            pcoa_input['coords_pct'], map_headers, map_data, custom_axes=None, 
-            jackknifing_method='IQR', is_comparison=False)
+        # all the iterations have the same samples, in the order of the first
+        coords = []
+        for pcoa_headers, pcoa_values, eigenvalues, pct in results:
+            row = dict([(h, i) for i, h in enumerate(pcoa_headers)])
+            coords.append(pcoa_values[[row[h] for h in coords_headers]])
+        coords_data, coords_low, coords_high, coords_eigenvalues, coords_pct =\
+            summarize_jackknife(coords, [r[2] for r in results],
+            [r[3] for r in results])
     
-    return make_pcoa_plot(coords_headers, coords_data, coords_eigenvalues, coords_pct, \
-        map_headers, map_data, coords_low, coords_high, True)
\ No newline at end of file
+    return iter_pcoa_plot(coords_headers, coords_data, coords_eigenvalues, coords_pct, \
+        map_headers, map_data, coords_low, coords_high, True, binary)
+
+def generate_pcoa_cloud_from_point_in_omega(map_headers, map_data, biom_object, metric, 
+        sequences, iterations, axes, tree_object=None, study=None, seed=None,
+        cache=None, workers=None, binary=False, rarefied=None):
+    """run the randomisations and get a WebGL PCoA plot string representation
+
+    Input: see iter_pcoa_cloud_from_point_in_omega
+
+    Output:
+    WebGL string representing the PCoA plot
+    """
+    return ''.join(iter_pcoa_cloud_from_point_in_omega(map_headers, map_data,
+        biom_object, metric, sequences, iterations, axes, tree_object, study,
+        seed, cache, workers, binary, rarefied))
\ No newline at end of file
@@ -20,9 +20,15 @@ from math import ceil
 from qiime.alpha_diversity import get_nonphylogenetic_metric, get_phylogenetic_metric, \
      AlphaDiversityCalc, AlphaDiversityCalcs
 from qiime.colors import process_colorby
-from qiime.rarefaction import RarefactionMaker
-from qiime.collate_alpha import make_output_row
 from qiime.parse import parse_matrix, parse_rarefaction
+from qiime.format import format_matrix
+
+from numpy import empty, hstack, nan, searchsorted
+
+from evident.alpha import (alpha_diversity, alpha_metric_name,
+	is_native_alpha_metric)
+from evident.rarefy import nested_rarefactions
+from evident.util import biom_table_to_csr
 
 import logging
 
@@ -52,20 +58,36 @@ def build_color_preferences(mapping_file_tuple):
 
 	return color_prefs, data, background_color, label_color
 
-def single_object_alpha(biom_object, metrics, tree_object):
-	"""given a metric calculates alpha diversity of a biom object
+def _alpha_matrix(biom_object, metrics, tree_object, counts=None,
+	sample_ids=None, observation_ids=None):
+	"""alpha diversity of a biom object as a samples x metrics array
 
 	Inputs:
 	biom_object: biom formatted OTU table
 	metrics: list of alpha diversity metrics
 	tree_object: tree object for the phylogenetic metrics
+	counts, sample_ids, observation_ids: biom_table_to_csr of biom_object,
+	computed when not given
 
 	Output:
-	calculations: tab delimitted string with the calculations for the object
+	headers: list with the name of each col of values
+	sample_ids: list of sample identifiers, the rows of values
+	values: numpy array with the alpha diversity of each sample
+
+	The metrics in evident.alpha are computed for all the samples at once and
+	come first, the rest are computed by qiime's AlphaDiversityCalcs.
 	"""
+	if counts is None:
+		counts, sample_ids, observation_ids = biom_table_to_csr(biom_object)
+	native_metrics = [m for m in metrics if is_native_alpha_metric(m)]
+	headers = [alpha_metric_name(m) for m in native_metrics]
+	values = [alpha_diversity(counts, native_metrics, observation_ids,
+		tree_object)]
 
 	calcs = []
 	for metric in metrics:
+		if is_native_alpha_metric(metric):
+			continue
 		try:
 			metric_f = get_nonphylogenetic_metric(metric)
 			is_phylogenetic = False
@@ -78,13 +100,57 @@ def single_object_alpha(biom_object, metrics, tree_object):
 		c = AlphaDiversityCalc(metric_f, is_phylogenetic)
 		calcs.append(c)
 
-	all_calcs = AlphaDiversityCalcs(calcs)
+	if calcs:
+		all_calcs = AlphaDiversityCalcs(calcs)
+
+		result = all_calcs(data_path=biom_object, tree_path=tree_object,
+			log_path=None)
+		calc_headers, calc_samples, calc_values = parse_matrix(
+			all_calcs.formatResult(result).split('\n'))
+		headers.extend(calc_headers)
+		values.append(calc_values)
+
+	return headers, sample_ids, hstack(values)
+
+def single_object_alpha(biom_object, metrics, tree_object):
+	"""given a metric calculates alpha diversity of a biom object
+
+	Inputs:
+	biom_object: biom formatted OTU table
+	metrics: list of alpha diversity metrics
+	tree_object: tree object for the phylogenetic metrics
+
+	Output:
+	calculations: tab delimitted string with the calculations for the object
+	"""
+	headers, sample_ids, values = _alpha_matrix(biom_object, metrics,
+		tree_object)
+	return format_matrix(values, sample_ids, headers)
 
-	result = all_calcs(data_path=biom_object, tree_path=tree_object,
-		log_path=None)
-	return all_calcs.formatResult(result)
+def _rarefied_biom_table(biom_object, sample_ids, counts):
+	"""biom table with the samples of biom_object and the values in counts
 
-def get_rarefactions(biom_object, minimum, maximum, iterations, steps):
+	Inputs:
+	biom_object: biom table the counts were rarefied from
+	sample_ids: list of sample identifiers, the rows of counts
+	counts: samples x observations csr_matrix, the cols are the observations
+	of biom_object
+
+	Output:
+	biom table with only sample_ids, the values are the rows of counts
+	"""
+	row_of = dict([(sample_id, i) for i, sample_id in enumerate(sample_ids)])
+	table = biom_object.filterSamples(lambda v, id, md: id in row_of)
+	return table.transformSamples(lambda v, id, md:
+		counts[row_of[id]].toarray().ravel())
+
+def _rarefaction_depths(minimum, maximum, steps):
+	"""list of depths from minimum to maximum in steps of the same size"""
+	rarefaction_step_size = int((maximum - minimum)/steps)
+	return range(minimum, maximum+1, rarefaction_step_size)
+
+def get_rarefactions(biom_object, minimum, maximum, iterations, steps,
+	seed=None):
 	"""rarify biom object and return rarefactions
 
 	Inputs:
@@ -93,18 +159,25 @@ def get_rarefactions(biom_object, minimum, maximum, iterations, steps):
 	maximum: ending point for the rarefactions
 	iterations: repetitions per rarefaction depth
 	steps: number of levels between minimum and maximum
+	seed: seed for the random number generator, default is None
 
 	Outputs:
-	list of 3 element tuples, where each tuple contains as a 1st element the
+	list of 3 element lists, where each list contains as a 1st element the
 	rarefaction depth, as a 2nd element the iteration number and as a 3rd
 	element the rarefied biom corresponding to this depth
+
+	The depths of an iteration are nested, each one is a prefix of a random
+	order of the reads of the deepest one, see evident.rarefy.
 	"""
 
-	rarefaction_step_size = int((maximum - minimum)/steps)
+	depths = _rarefaction_depths(minimum, maximum, steps)
 
-	rarefaction_maker = RarefactionMaker(biom_object, minimum,  maximum,\
-		rarefaction_step_size, iterations)
-	rarefactions = rarefaction_maker.rarefy_to_list()
+	counts, sample_ids, observation_ids = biom_table_to_csr(biom_object)
+	rarefactions = []
+	for depth, iteration, rarefied, kept in nested_rarefactions(counts,
+		depths, iterations, seed):
+		rarefactions.append([depth, iteration, _rarefied_biom_table(
+			biom_object, [sample_ids[i] for i in kept], rarefied)])
 
 	return rarefactions
 
@@ -148,9 +221,68 @@ def _format_rarefactions(rarefaction_data, samples):
 
 	return output
 
+def alpha_rarefaction_array(biom_object, metrics, depths, iterations,
+	tree_object=None, seed=None):
+	"""alpha diversity of every rarefaction of a biom object in one array
+
+	Inputs:
+	biom_object: OTU table to be rarefied and used to compute alpha diversity
+	metrics: list of metrics, phylogenetic or non phylogenetic
+	depths: list of rarefaction depths
+	iterations: number of repetitions per rarefaction depth
+	tree_object: tree to perform the phylogenetic operations, default is None
+	seed: seed for the random number generator, default is None
+
+	Output:
+	values: numpy array indexed by (depth, iteration, sample, metric), the
+	samples with fewer sequences than a depth are nan at that depth
+	depths: list of depths, the first axis of values
+	sample_ids: list of the samples with at least the smallest depth, the
+	third axis of values
+	headers: list of metric names as in qiime, the last axis of values
+
+	The metrics in evident.alpha are computed for all the rarefactions at
+	once, only the rest need the rarefied biom tables.
+	"""
+	counts, sample_ids, observation_ids = biom_table_to_csr(biom_object)
+	rarefactions = nested_rarefactions(counts, depths, iterations, seed)
+	depths = sorted(depths)
+	eligible = rarefactions[0][3]
+	sample_ids = [sample_ids[i] for i in eligible]
+
+	native_metrics = [m for m in metrics if is_native_alpha_metric(m)]
+	other_metrics = [m for m in metrics if not is_native_alpha_metric(m)]
+	native = alpha_diversity([r[2] for r in rarefactions], native_metrics,
+		observation_ids, tree_object)
+	headers = [alpha_metric_name(m) for m in native_metrics]
+
+	values = None
+	first_row = 0
+	for depth, iteration, rarefied, kept in rarefactions:
+		cols = searchsorted(eligible, kept)
+		rows = native[first_row:first_row+len(kept)]
+		first_row += len(kept)
+		if other_metrics:
+			other_headers, other_samples, other_values = _alpha_matrix(
+				_rarefied_biom_table(biom_object, [sample_ids[c] for c in
+				cols], rarefied), other_metrics, tree_object)
+			if values is None:
+				headers.extend(other_headers)
+			order = dict([(s, i) for i, s in enumerate(other_samples)])
+			rows = hstack([rows, other_values[[order[sample_ids[c]]
+				for c in cols]]])
+		if values is None:
+			values = empty((len(depths), iterations, len(sample_ids),
+				len(headers)))
+			values.fill(nan)
+		values[depths.index(depth), iteration, cols] = rows
+
+	return values, depths, sample_ids, headers
+
 def generate_alpha_rarefaction_data_from_point_in_omega(biom_object, metrics,
 													sequences, iterations,
-													tree_object=None):
+													tree_object=None,
+													seed=None):
 	"""generate alpha rarefaction data from a biom table and mapping file
 
 	Inputs:
@@ -159,6 +291,7 @@ def generate_alpha_rarefaction_data_from_point_in_omega(biom_object, metrics,
 	sequences: maximum number of sequences for the rarefaction plots
 	iterations: number of repetitions per rarefaction
 	tree_object: tree to perform the phylogenetic operations, default is None
+	seed: seed for the random number generator, default is None
 
 	Output:
 	alpha_rarefaction_data: dictionary where the keys are alpha diversity
@@ -171,35 +304,19 @@ def generate_alpha_rarefaction_data_from_point_in_omega(biom_object, metrics,
 	# The minimum depth is defined by the size of the maximum depth
 	steps = 4
 	min_depth = int(ceil(sequences / steps))
+	depths = _rarefaction_depths(min_depth, sequences, steps)
+
+	values, depths, all_samples, all_metrics = alpha_rarefaction_array(
+		biom_object, metrics, depths, iterations, tree_object, seed)
 
-	# get a rarefied biom with the proper identifiers
-	rarefied_bioms_list = get_rarefactions(biom_object, min_depth, sequences,\
-		iterations, steps)
-
-	alpha_rs = {}
-	alpha_filenames = []
-	# rarefy all the biom objects and get the alpha diversity values
-	for rarefied_biom in rarefied_bioms_list:
-		# this tag contains data about the iteration and the depth
-		identifier = 'alpha_rare_%s_%s' % (str(rarefied_biom[0]), str(rarefied_biom[1]))
-		alpha_values = single_object_alpha(rarefied_biom[2], metrics, tree_object)
-		alpha_rs[identifier] = (rarefied_biom[0], rarefied_biom[1], alpha_values.split('\n'))
-		alpha_filenames.append(identifier)
-
-	# use the rarefaction with the fewest sequences per sample as the reference
-	ref_rare = single_object_alpha(rarefied_bioms_list[0][2], metrics,\
-		tree_object=tree_object).split('\n')
-	all_metrics, all_samples, example_data = parse_matrix(ref_rare)
-
-	# build a dictionary with the data for each of the metrics specified
+	# the rows of make_averages, one per depth and iteration; the samples
+	# missing from a rarefaction are nan as in qiime's parse_rarefaction
 	metrics_data = {}
-	for metric in all_metrics:
-		per_metric_data = []
-		for filename in alpha_filenames:
-			f_metrics, f_samples, f_data = parse_matrix(alpha_rs[filename][2])
-			per_metric_data.append(make_output_row(f_metrics, metric,\
-				f_samples, f_data, filename, len(all_samples), all_samples))
-		metrics_data[metric] = per_metric_data
+	for m, metric in enumerate(all_metrics):
+		metrics_data[metric] = [['alpha_rare_%d_%d' % (depth, iteration),
+			depth, iteration] + values[d, iteration, :, m].tolist()
+			for d, depth in enumerate(depths)
+			for iteration in xrange(iterations)]
 
 	# now format the dictionary to make it compatible with make_averages
 	alpha_rarefaction_data = _format_rarefactions(metrics_data, all_samples)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+"""rarefaction of all the samples of an OTU table at once
+
+A sample is rarefied by drawing depth sequences without replacement, i. e.
+from a multivariate hypergeometric distribution. This is drawn as a chain of
+univariate hypergeometric draws, one per OTU of the sample; all the samples
+(and iterations) take their k-th draw in the same call to numpy, so there are
+as many calls as OTUs in the richest sample instead of one loop per sample.
+"""
+
+from numpy import (arange, argsort, asarray, concatenate, cumsum, diff,
+    flatnonzero, int64, minimum, ones, repeat, tile, zeros)
+from numpy.random import RandomState
+from scipy.sparse import coo_matrix, csr_matrix
+
+from evident.util import biom_table_to_csr
+
+
+def _random_state(seed):
+    if isinstance(seed, RandomState):
+        return seed
+    return RandomState(seed)
+
+def _take_rows(counts, rows):
+    """Return counts[rows] and the index in counts.data of its entries
+
+    Unlike the fancy indexing of scipy this keeps the order of the entries in
+    each row, so the draws of a seed don't depend on the scipy version.
+    """
+    row_nnz = diff(counts.indptr)[rows]
+    indptr = concatenate(([0], cumsum(row_nnz)))
+    entries = repeat(counts.indptr[rows] - indptr[:-1], row_nnz) + \
+        arange(indptr[-1])
+    taken = csr_matrix((counts.data[entries], counts.indices[entries], indptr),
+        shape=(len(rows), counts.shape[1]))
+    return taken, entries
+
+def _draw(counts, depth, random_state):
+    """Rarefy every row of a csr matrix of ints to depth sequences
+
+    depth is an int or an int array with the depth of each row, all the rows
+    must have at least depth sequences. Returns the data of the rarefied
+    matrix, aligned with counts.data.
+    """
+    num_rows = counts.shape[0]
+    row_nnz = diff(counts.indptr)
+    rows = repeat(arange(num_rows), row_nnz)
+    # position of each entry in its row, the k-th entries are drawn together
+    position = arange(len(counts.data)) - repeat(counts.indptr[:-1], row_nnz)
+    order = argsort(position, kind='mergesort')
+    bounds = [0] + (flatnonzero(diff(position[order]))+1).tolist() + \
+        [len(order)]
+
+    remaining = asarray(counts.sum(1)).ravel().astype(int64)
+    to_draw = zeros(num_rows, dtype=int64) + depth
+    drawn = zeros(len(counts.data), dtype=int64)
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        entries = order[start:end]
+        entry_rows = rows[entries]
+        good = counts.data[entries].astype(int64)
+        remaining[entry_rows] -= good
+        active = to_draw[entry_rows] > 0
+        if active.any():
+            entries, entry_rows, good = entries[active], entry_rows[active], \
+                good[active]
+            draws = random_state.hypergeometric(good, remaining[entry_rows],
+                to_draw[entry_rows])
+            drawn[entries] = draws
+            to_draw[entry_rows] -= draws
+    return drawn
+
+def rarefy(counts, depth, seed=None, include_small_samples=False):
+    """Rarefy every sample of a samples x OTUs matrix to depth sequences
+
+    Inputs:
+    counts: samples x OTUs scipy sparse matrix (or numpy array) of ints
+    depth: number of sequences to draw from each sample
+    seed: int or numpy RandomState, the same seed gives the same rarefaction
+    include_small_samples: if True the samples with fewer than depth
+    sequences are kept as they are, otherwise they are removed as qiime's
+    get_rare_data does
+
+    Output:
+    rarefied: samples x OTUs csr_matrix of ints with the kept samples
+    kept: int array with the index in counts of the rows of rarefied
+    """
+    counts = csr_matrix(counts, dtype=int64, copy=True)
+    counts.eliminate_zeros()
+    large = asarray(counts.sum(1)).ravel() >= depth
+    rarefied, entries = _take_rows(counts, flatnonzero(large))
+    rarefied.data = _draw(rarefied, depth, _random_state(seed))
+    if include_small_samples:
+        counts.data[entries] = rarefied.data
+        rarefied, kept = counts, arange(counts.shape[0])
+    else:
+        kept = flatnonzero(large)
+    rarefied.eliminate_zeros()
+    return rarefied, kept
+
+def rarefy_iterations(counts, depth, iterations, seed=None):
+    """Rarefy every sample of counts in iterations independent draws at once
+
+    Inputs:
+    counts: samples x OTUs scipy sparse matrix (or numpy array) of ints
+    depth: number of sequences to draw from each sample
+    iterations: number of independent rarefactions
+    seed: int or numpy RandomState, the same seed gives the same rarefactions
+
+    Output:
+    stacked: (iterations*kept samples) x OTUs csr_matrix, the rows of
+    iteration i are rows i*len(kept) to (i+1)*len(kept), see split_iterations
+    kept: int array with the index in counts of the rows of each iteration,
+    the samples with fewer than depth sequences are removed
+    """
+    counts = csr_matrix(counts, dtype=int64)
+    counts.eliminate_zeros()
+    kept = flatnonzero(asarray(counts.sum(1)).ravel() >= depth)
+    stacked = _take_rows(counts, tile(kept, iterations))[0]
+    stacked.data = _draw(stacked, depth, _random_state(seed))
+    stacked.eliminate_zeros()
+    return stacked, kept
+
+def nested_rarefactions(counts, depths, iterations, seed=None):
+    """Rarefy every sample of counts to all depths, shallower depths nested
+
+    In each iteration the reads of each sample are drawn once, up to the
+    deepest depth, and put in a random order; the rarefaction at each depth
+    is a prefix of that order. A prefix of a random order is itself a random
+    draw without replacement, so each depth is rarefied as by rarefy, but all
+    the depths cost about as much as the deepest one: the counts of a depth
+    are the counts of the previous depth plus the reads in between.
+
+    Inputs:
+    counts: samples x OTUs scipy sparse matrix (or numpy array) of ints
+    depths: list of depths, i. e. the x axis of a rarefaction curve
+    iterations: number of independent draws of each sample
+    seed: int or numpy RandomState, the same seed gives the same rarefactions
+
+    Output:
+    list of (depth, iteration, rarefied, kept) tuples sorted by depth and
+    then iteration, as in qiime's RarefactionMaker; rarefied is a samples x
+    OTUs csr_matrix with the samples that have at least depth sequences and
+    kept is an int array with their index in counts
+    """
+    counts = csr_matrix(counts, dtype=int64)
+    counts.eliminate_zeros()
+    depths = sorted(depths)
+    totals = asarray(counts.sum(1)).ravel()
+    eligible = flatnonzero(totals >= depths[0])
+    deepest = minimum(totals[eligible], depths[-1])
+    first_read = cumsum(deepest) - deepest
+    shape = (len(eligible), counts.shape[1])
+    random_state = _random_state(seed)
+
+    rarefactions = {}
+    for iteration in xrange(iterations):
+        drawn = _take_rows(counts, eligible)[0]
+        drawn.data = _draw(drawn, deepest, random_state)
+
+        # one entry per read, position is the place of the read in a random
+        # order of the reads of its sample, so a depth takes position < depth
+        rows = repeat(repeat(arange(len(eligible)), diff(drawn.indptr)),
+            drawn.data)
+        reads = repeat(drawn.indices, drawn.data)
+        order = argsort(rows + random_state.random_sample(len(reads)))
+        position = zeros(len(reads), dtype=int64)
+        position[order] = arange(len(reads)) - repeat(first_read, deepest)
+
+        rarefied = csr_matrix(shape, dtype=int64)
+        previous = 0
+        for depth in depths:
+            in_between = (position >= previous) & (position < depth)
+            rarefied = rarefied + coo_matrix((ones(in_between.sum(),
+                dtype=int64), (rows[in_between], reads[in_between])),
+                shape=shape).tocsr()
+            previous = depth
+            keep = flatnonzero(deepest >= depth)
+            rarefactions[(depth, iteration)] = (rarefied[keep], eligible[keep])
+
+    return [(depth, iteration) + rarefactions[(depth, iteration)]
+        for depth in depths for iteration in xrange(iterations)]
+
+def split_iterations(stacked, iterations):
+    """Return the list of per iteration matrices of rarefy_iterations"""
+    num_samples = stacked.shape[0]//iterations
+    return [stacked[i*num_samples:(i+1)*num_samples]
+        for i in xrange(iterations)]
+
+def rarefy_biom_table(biom_table, depth, seed=None):
+    """Rarefy a biom table, see rarefy
+
+    Output:
+    counts: samples x OTUs csr_matrix with the rarefied samples
+    sample_ids: list of the ids of the rarefied samples, the rows of counts
+    observation_ids: list of OTU identifiers, the cols of counts
+    """
+    counts, sample_ids, observation_ids = biom_table_to_csr(biom_table)
+    rarefied, kept = rarefy(counts, depth, seed)
+    return rarefied, [sample_ids[i] for i in kept], observation_ids
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+"""binary bundle of the OTU table and the mapping file of a study
+
+A bundle is a directory of .npy files: the samples x OTUs counts as the
+data, indices and indptr arrays of a csr_matrix, the sample and OTU ids, and
+the mapping file with each column dictionary encoded. The files are loaded
+memory-mapped, so a study opens without parsing its BIOM and mapping files
+and the pages are shared by all the processes that load it.
+"""
+
+from os.path import exists, join
+
+from numpy import array, asarray, cumsum, int32, load, unique, zeros
+from scipy.sparse import csr_matrix
+
+from biom.exception import TableException
+from biom.parse import parse_biom_table
+from biom.table import SparseOTUTable, table_factory
+
+from evident.util import biom_table_to_csr, path_version, save_arrays
+
+_ARRAYS = ['data', 'indices', 'indptr', 'sample_ids', 'otu_ids',
+    'map_headers', 'map_codes', 'map_values', 'map_offsets']
+
+
+def _encode_ids(ids):
+    """Return a fixed width string array of ids, utf-8 encoded"""
+    return array([unicode(i).encode('utf-8') for i in ids], dtype=str)
+
+def write_study_bundle(bundle_dir, biom_table, map_data, map_headers):
+    """Write the bundle of a study
+
+    Inputs:
+    bundle_dir: directory of the bundle, replaced if it exists (see
+    evident.util.save_arrays, the processes using the bundle are not affected)
+    biom_table: biom table object of the study
+    map_data: rows of the mapping file without the headers and the comments
+    map_headers: headers of the mapping file
+    """
+    counts, sample_ids, otu_ids = biom_table_to_csr(biom_table)
+    counts.sort_indices()
+
+    # each column as the index of its value in its sorted distinct values,
+    # the values of all the columns are stored one after the other
+    codes = zeros((len(map_data), len(map_headers)), dtype=int32)
+    values, sizes = [], []
+    for i in range(len(map_headers)):
+        column_values, codes[:, i] = unique(array([row[i] for row in map_data],
+            dtype=object).astype(str), return_inverse=True)
+        values.extend(column_values)
+        sizes.append(len(column_values))
+
+    arrays = {'data': counts.data, 'indices': counts.indices.astype(int32),
+        'indptr': counts.indptr.astype(int32),
+        'sample_ids': _encode_ids(sample_ids), 'otu_ids': _encode_ids(otu_ids),
+        'map_headers': _encode_ids(map_headers), 'map_codes': codes,
+        'map_values': _encode_ids(values),
+        'map_offsets': cumsum([0] + sizes).astype(int32)}
+    save_arrays(bundle_dir, arrays)
+
+def is_study_bundle(bundle_dir):
+    """Return True if bundle_dir has all the files of a bundle"""
+    return all([exists(join(bundle_dir, name + '.npy')) for name in _ARRAYS])
+
+class StudyBundle(object):
+    """The OTU table and the mapping file of a study, memory-mapped
+
+    SampleIds and ObservationIds are the ones of the biom table, so the
+    bundle can be used instead of it with select_samples and the functions
+    that get its counts with evident.util.biom_table_to_csr.
+    """
+
+    def __init__(self, bundle_dir):
+        self.bundle_dir = bundle_dir
+        arrays = dict([(name, load(join(bundle_dir, name + '.npy'),
+            mmap_mode='r')) for name in _ARRAYS])
+        self.counts = csr_matrix((arrays['data'], arrays['indices'],
+            arrays['indptr']), shape=(len(arrays['sample_ids']),
+            len(arrays['otu_ids'])), copy=False)
+        self.SampleIds = [i.decode('utf-8') for i in arrays['sample_ids']]
+        self.ObservationIds = [i.decode('utf-8') for i in arrays['otu_ids']]
+        self._map_headers = arrays['map_headers'].tolist()
+        self._map_codes = arrays['map_codes']
+        self._map_values = arrays['map_values']
+        self._map_offsets = arrays['map_offsets']
+
+    def csr(self):
+        """Return the counts, sample ids and OTU ids, see biom_table_to_csr"""
+        return self.counts, list(self.SampleIds), list(self.ObservationIds)
+
+    def mapping_file(self):
+        """Return the data and the headers of the mapping file, as
+        qiime.parse.parse_mapping_file does without the comments"""
+        columns = []
+        for i in range(len(self._map_headers)):
+            values = self._map_values[self._map_offsets[i]:
+                self._map_offsets[i+1]].tolist()
+            columns.append([values[code] for code in self._map_codes[:, i]])
+        return map(list, zip(*columns)), list(self._map_headers)
+
+    def biom_table(self, rows):
+        """Return a biom table with only the samples of rows
+
+        Inputs:
+        rows: indices of the samples in SampleIds, in the order of the table
+
+        A biom table of all the OTUs of the study, as filterSamples returns it;
+        it's built from the [OTU, sample, value] entries of the rows, as
+        biom.parse does, without a dense OTUs x samples array
+        """
+        if not len(rows):
+            raise TableException, "All samples were filtered out!"
+        counts = self.counts[asarray(rows)].tocoo()
+        entries = map(list, zip(counts.col.tolist(), counts.row.tolist(),
+            counts.data.tolist()))
+        return table_factory(entries, [self.SampleIds[i] for i in rows],
+            list(self.ObservationIds), constructor=SparseOTUTable,
+            shape=(len(self.ObservationIds), len(rows)))
+
+# bundles loaded by this process and their versions (see path_version), by
+# the path prefix of the study
+_loaded_studies = {}
+
+def get_study_table(study_fp):
+    """Return the OTU table of a study, the bundle loaded once per process
+
+    Inputs:
+    study_fp: path of the files of the study without their suffixes, see
+    scripts/add_processed_study.py
+
+    Output:
+    the StudyBundle in study_fp + '_bundle' or, for the studies added without
+    one, the biom table parsed from study_fp + '.biom'; the bundle is loaded
+    again when the study is added again
+    """
+    bundle_dir = study_fp + '_bundle'
+    version = path_version(bundle_dir)
+    loaded_version, bundle = _loaded_studies.get(study_fp, (None, None))
+    if bundle is not None and loaded_version == version:
+        return bundle
+    if not is_study_bundle(bundle_dir):
+        return parse_biom_table(open(study_fp + '.biom', 'U'))
+    bundle = StudyBundle(bundle_dir)
+    _loaded_studies[study_fp] = (version, bundle)
+    return bundle
@@ -11,68 +11,205 @@ __maintainer__ = "Will Van Treuren"
 __email__ = "wdwvt1@gmail.com"
 __status__ = "Development"
 
-from random import shuffle
+from hashlib import sha1
+from numpy import (arange, argsort, array, asarray, bincount, cumsum,
+    flatnonzero, lexsort, unique, zeros)
+from numpy.random import RandomState
 from biom.exception import TableException
-from qiime.rarefaction import get_rare_data
+
+from evident.rarefy import rarefy
+from evident.study import StudyBundle
+from evident.util import biom_table_to_csr
 
 import logging
 
+class Selection(object):
+    """The parameters and the result of a call to select_samples
+
+    The same parameters and seed always choose the same samples, so this is
+    all that is needed to identify (or repeat) a selection: rows are the
+    indices of the chosen samples in the SampleIds of the biom table, sorted.
+    """
+
+    def __init__(self, seed, depth, unique_id_column, subjects,
+                 samples_per_subject, stratify, rows):
+        self.seed = seed
+        self.depth = depth
+        self.unique_id_column = unique_id_column
+        self.subjects = subjects
+        self.samples_per_subject = samples_per_subject
+        self.stratify = stratify
+        self.rows = array(rows, dtype=int)
+
+    def key(self):
+        """Return an identifier of the selection for caches"""
+        return sha1('%s\t%d\t%s\t%d\t%d\t%s\t%s' % (self.seed, self.depth,
+            self.unique_id_column, self.subjects, self.samples_per_subject,
+            self.stratify, ','.join(map(str, self.rows)))).hexdigest()
+
+    def sample_ids(self, biom_table):
+        """Return the ids of the chosen samples of biom_table"""
+        return [biom_table.SampleIds[i] for i in self.rows]
+
+    def filter(self, biom_table):
+        """Return biom_table with only the chosen samples"""
+        if isinstance(biom_table, StudyBundle):
+            return biom_table.biom_table(self.rows)
+        chosen = set(self.sample_ids(biom_table))
+        return biom_table.filterSamples(lambda v,id,md: id in chosen)
+
+    def rarefied(self, biom_table):
+        """Return the chosen samples rarefied to depth, as select_samples does
+        with rarefied=True"""
+        counts, sample_ids, otu_ids = biom_table_to_csr(biom_table)
+        return _rarefy_rows(counts, sample_ids, otu_ids, self.rows,
+            self.depth, self.seed)
+
+def _rarefy_rows(counts, sample_ids, otu_ids, rows, depth, seed):
+    """Return the rows of counts rarefied to depth with seed
+
+    The draws are the ones of evident.rarefy.rarefy_biom_table on the table
+    with only those rows; the indexing of scipy can reorder the entries of a
+    row, biom_table_to_csr sorts them.
+    """
+    rarefied_counts, kept = rarefy(counts[asarray(rows)].sorted_indices(),
+        depth, seed)
+    return rarefied_counts, [sample_ids[rows[i]] for i in kept], otu_ids
+
+def _stratified_order(candidates, strata, random_state):
+    """Shuffle candidates taking one of each stratum in turn
+
+    Inputs:
+    candidates: int array with the codes of the subjects
+    strata: int array with the code of the stratum of each candidate
+    random_state: numpy RandomState
+
+    Output:
+    int array with the candidates in the order they are chosen
+    """
+    if not len(candidates):
+        return candidates
+    shuffled = random_state.permutation(len(candidates))
+    strata = strata[shuffled]
+    # the place of each candidate in the shuffled list of its stratum
+    by_stratum = argsort(strata, kind='mergesort')
+    sizes = bincount(strata)
+    turn = zeros(len(candidates), dtype=int)
+    turn[by_stratum] = arange(len(candidates)) - \
+        (cumsum(sizes) - sizes)[strata[by_stratum]]
+    # each turn goes over the strata in its own random order
+    priority = random_state.random_sample((sizes.max(), len(sizes)))
+    return candidates[shuffled[lexsort((priority[turn, strata], turn))]]
+
 def select_samples(map_data, headers, biom_table, depth, unique_id_column, 
-                    subjects, samples_per_subject):
+                    subjects, samples_per_subject, rarefied=False, seed=None,
+                    stratify=None, selection=False):
     """
     Randomly select a list of IDs with enough sequeneces per subject
 
     Input:
     map_data: rows of the mapping file without the headers and the comments
     headers: headers of the mapping file
-    biom_table: table object 
+    biom_table: table object or evident.study.StudyBundle
     depth: number of sequences pers sample
     unique_id_column: column header to identify unique subjects in the mapping 
     file i.e. HOST_SUBJECT_ID
     subjects: number of subjects to include in the resulting samples
     samples_per_subject: number of samples pers subject to include in the
     resulting samples
+    rarefied: if True also return the chosen samples rarefied to depth
+    seed: seed of the choice of subjects and samples and of the rarefaction,
+    the same seed always chooses the same samples
+    stratify: column header of the mapping file; if given the subjects are
+    taken from each of its values in turn (the value of a subject is the one
+    of its first sample), otherwise at random from all of them
+    selection: if True also return the Selection of the chosen samples
 
     Output:
     chosen_samples: a list of SampleIds with as many lists as subjects where 
     each list has as many elmenents as samples per subject
     final_biom_table: a biom table object containing only the 'chosen_samples'
+    rarefied_table: only if rarefied is True, tuple with the counts, sample
+    ids and OTU ids of final_biom_table rarefied to depth, as
+    evident.rarefy.rarefy_biom_table returns them with the same seed
+    selection: only if selection is True, the Selection
     """
 
     unique_id_column_index = headers.index(unique_id_column)
-    rare_biom_table = get_rare_data(biom_table, depth)
+    random_state = RandomState(seed)
+
+    # the samples with enough sequences, from the totals of the table
+    counts, sample_ids, otu_ids = biom_table_to_csr(biom_table)
+    totals = asarray(counts.sum(1)).ravel()
+    deep_sample_ids = set([sample_id for sample_id, total in
+        zip(sample_ids, totals) if total >= depth])
 
-    # make a dictionary of each subject with its corresponding list of SampleIds
-    per_subject_sample_ids = {}
+    # the rows of the mapping file of those samples, one per sample, with the
+    # subjects coded as ints
+    eligible, seen = [], set()
     for row in map_data:
-        if row[0] not in rare_biom_table.SampleIds:
-            continue
+        if row[0] in deep_sample_ids and row[0] not in seen:
+            eligible.append(row)
+            seen.add(row[0])
+    if eligible:
+        subject_names, codes = unique([row[unique_id_column_index]
+            for row in eligible], return_inverse=True)
+        samples_of_subject = bincount(codes)
+    else:
+        # no sample is deep enough, nothing is chosen
+        subject_names, codes = [], zeros(0, dtype=int)
+        samples_of_subject = zeros(0, dtype=int)
 
-        if  row[unique_id_column_index] not in per_subject_sample_ids:
-            per_subject_sample_ids[row[unique_id_column_index]] = []
-        per_subject_sample_ids[row[unique_id_column_index]].append(row[0])
+    # the samples of each subject in a random order, the first
+    # samples_per_subject of each are the ones that can be chosen
+    order = lexsort((random_state.random_sample(len(codes)), codes))
+    place = arange(len(codes)) - (cumsum(samples_of_subject) -
+        samples_of_subject)[codes[order]]
 
-    # subsampling samples per individual
-    subsampled_ids = {}
-    subject_keys = []
-    for k,v in per_subject_sample_ids.items():
-        if len(v)>=samples_per_subject:
-            subsampled_ids[k] = v[:samples_per_subject]
-            subject_keys.append(k)
+    # subsampling subjects
+    candidates = flatnonzero(samples_of_subject >= samples_per_subject)
+    if stratify is None:
+        chosen_subjects = random_state.permutation(candidates)
+    else:
+        stratify_index = headers.index(stratify)
+        first_sample = argsort(codes, kind='mergesort')[
+            cumsum(samples_of_subject) - samples_of_subject]
+        strata = unique([eligible[i][stratify_index] for i in
+            first_sample[candidates]], return_inverse=True)[1]
+        chosen_subjects = _stratified_order(candidates, strata, random_state)
+    chosen_subjects = chosen_subjects[:subjects]
 
-    ##open('/tmp/tmp.txt','a').write('%s %d %s\n\n' % (k, len(subsampled_ids[k]), subsampled_ids[k]))
+    # the chosen samples grouped by subject in the order they were chosen
+    subject_turn = zeros(len(subject_names), dtype=int) - 1
+    subject_turn[chosen_subjects] = arange(len(chosen_subjects))
+    chosen_rows = order[(place < samples_per_subject) &
+        (subject_turn[codes[order]] >= 0)]
+    chosen_rows = chosen_rows[argsort(subject_turn[codes[chosen_rows]],
+        kind='mergesort')]
+    chosen_samples = [eligible[i][0] for i in chosen_rows]
+    chosen = set(chosen_samples)
 
-    # subsampling subjects
-    shuffle(subject_keys)
-    chosen_samples = []
-    for k in subject_keys[:subjects]:
-        chosen_samples.extend(subsampled_ids[k])
+    # the rows of the chosen samples in the order of the table, i. e. the rows
+    # of final_biom_table
+    rows = [i for i, sample_id in enumerate(sample_ids) if sample_id in chosen]
     
     # creating new biom file with only the good samples
     try:
-        final_biom_table = biom_table.filterSamples(lambda v,id,md: id in chosen_samples)
+        if isinstance(biom_table, StudyBundle):
+            final_biom_table = biom_table.biom_table(rows)
+        else:
+            final_biom_table = biom_table.filterSamples(
+                lambda v,id,md: id in chosen)
     except TableException:
         raise TableException, "Using those parameters there are no subjects "+\
             "available in this study, make the selectors files are correct"
 
-    return chosen_samples, final_biom_table
+    result = [chosen_samples, final_biom_table]
+
+    if rarefied:
+        result.append(_rarefy_rows(counts, sample_ids, otu_ids, rows, depth,
+            seed))
+    if selection:
+        result.append(Selection(seed, depth, unique_id_column, subjects,
+            samples_per_subject, stratify, rows))
+    return tuple(result)
@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+"""array representation of phylogenetic trees for the phylogenetic metrics
+
+An ArrayTree can be saved as a directory of .npy files (see
+scripts/convert_tree.py) that is loaded memory-mapped, so a large tree like
+the Greengenes one is parsed once instead of on every request.
+"""
+
+from os.path import exists, join, splitext
+
+from numpy import (arange, array, asarray, bincount, concatenate,
+    cumsum, flatnonzero, lexsort, load, ones, zeros)
+from numpy import add
+from scipy.sparse import csr_matrix
+
+from qiime.parse import parse_newick
+
+from evident.util import path_version, save_arrays
+
+# the tree of the studies, Greengenes 97%
+DEFAULT_TREE_FP = '/evident/data/gg_97_otus_4feb2011.tre'
+
+_TREE_ARRAYS = ['parents', 'lengths', 'tips', 'tip_names', 'child_order',
+    'child_heights']
+
+
+class ArrayTree(object):
+    """Postorder array encoding of a phylogenetic tree
+
+    Nodes are numbered in postorder, every node comes after all of its
+    descendants and the root is the last node.
+
+    Attributes:
+    parents: int array with the index of the parent of each node, -1 for root
+    lengths: float array with the length of the branch above each node
+    tip_names: list with the names of the tips
+    tips: int array with the node index of each of the tip_names
+    """
+
+    def __init__(self, parents, lengths, tip_names, tips):
+        self.parents = asarray(parents)
+        self.lengths = asarray(lengths)
+        self.tip_names = list(tip_names)
+        self.tips = asarray(tips)
+        self.tip_index = dict(zip(self.tip_names, self.tips.tolist()))
+        self._child_order = None
+        self._child_heights = None
+
+    def __len__(self):
+        return len(self.parents)
+
+    def shear(self, names):
+        """Return the subtree of the tips in names
+
+        The tips that are not in names are removed, and so are the internal
+        nodes left without tips and the ones left with a single child; the
+        branch of a removed single child node is added to the branch of its
+        child. The root is always kept, so the branches between the tips and
+        the root (i. e. the phylogenetic diversity) are the same.
+
+        Inputs:
+        names: names of the tips to keep, the ones not in the tree are ignored
+
+        Output:
+        ArrayTree with the nodes in the same (postorder) order
+        """
+        kept_tips = array(sorted(set([self.tip_index[name] for name in names
+            if name in self.tip_index])), dtype=int)
+        if not len(kept_tips):
+            raise ValueError, "None of the tips are in the tree"
+        num_nodes = len(self.parents)
+        root = num_nodes - 1
+
+        # the nodes with kept tips below, and how many of their children do
+        alive = self.propagate(kept_tips, ones(len(kept_tips), dtype=int)) > 0
+        alive_children = bincount(self.parents[:-1][alive[:-1]],
+            minlength=num_nodes)
+        kept = alive & ((alive_children != 1) | (arange(num_nodes) == root))
+
+        # go up from each kept node over the removed ones, adding their
+        # branches, until the parent is a kept node
+        nodes = flatnonzero(kept[:-1])
+        parents = self.parents[nodes]
+        lengths = self.lengths[nodes].astype(float)
+        skipped = flatnonzero(~kept[parents])
+        while len(skipped):
+            lengths[skipped] += self.lengths[parents[skipped]]
+            parents[skipped] = self.parents[parents[skipped]]
+            skipped = skipped[~kept[parents[skipped]]]
+
+        # the kept tips are sorted, i. e. in postorder as in tree_to_arrays
+        new_index = cumsum(kept) - 1
+        tip_position = zeros(num_nodes, dtype=int)
+        tip_position[self.tips] = arange(len(self.tips))
+        return ArrayTree(concatenate((new_index[parents], [-1])),
+            concatenate((lengths, [self.lengths[root]])),
+            [self.tip_names[i] for i in tip_position[kept_tips]],
+            new_index[kept_tips])
+
+    def save(self, tree_dir):
+        """Write the tree as .npy files in tree_dir, see load
+
+        The order of the nodes of propagate is computed and saved too. An
+        existing tree_dir is replaced (see evident.util.save_arrays), the
+        processes using it are not affected.
+        """
+        child_order, child_heights = self._levels()
+        arrays = {'parents': self.parents, 'lengths': self.lengths,
+            'tips': self.tips, 'tip_names': array([unicode(name).encode(
+            'utf-8') for name in self.tip_names], dtype=str),
+            'child_order': child_order, 'child_heights': child_heights}
+        save_arrays(tree_dir, arrays)
+
+    @classmethod
+    def load(cls, tree_dir):
+        """Load a tree written by save, the arrays are memory-mapped"""
+        arrays = dict([(name, load(join(tree_dir, name + '.npy'),
+            mmap_mode='r')) for name in _TREE_ARRAYS])
+        tree = cls(arrays['parents'], arrays['lengths'], [name.decode('utf-8')
+            for name in arrays['tip_names']], arrays['tips'])
+        tree._child_order = arrays['child_order']
+        tree._child_heights = arrays['child_heights']
+        return tree
+
+    def tip_nodes(self, names):
+        """Return an int array with the node index of each tip in names"""
+        try:
+            return array([self.tip_index[name] for name in names], dtype=int)
+        except KeyError, e:
+            raise ValueError, "The tip %s is not in the tree" % e.args[0]
+
+    def ancestors(self, nodes):
+        """Return a sparse nodes x len(nodes) matrix of the paths to the root
+
+        Entry [i, j] is 1 if node i is nodes[j] or one of its ancestors, so
+        the product with a nodes x samples matrix adds the values of each
+        sample up to the root, i. e. a sparse version of propagate.
+        """
+        nodes = asarray(nodes, dtype=int)
+        rows, cols = [], []
+        current, col = nodes, arange(len(nodes))
+        while len(current):
+            rows.append(current)
+            cols.append(col)
+            current = self.parents[current]
+            col = col[current >= 0]
+            current = current[current >= 0]
+        rows, cols = concatenate(rows), concatenate(cols)
+        return csr_matrix((ones(len(rows)), (rows, cols)),
+            shape=(len(self.parents), len(nodes)))
+
+    def _levels(self):
+        """Sort the non-root nodes by the height of their parent
+
+        The height of a node is the number of branches in the longest path to
+        one of its tips, so all the children of the nodes at one height are
+        at lower heights and each height can be processed in one operation.
+        """
+        if self._child_order is None:
+            parents = self.parents.tolist()
+            heights = [0]*len(parents)
+            for node in xrange(len(parents)-1):
+                if heights[node] >= heights[parents[node]]:
+                    heights[parents[node]] = heights[node]+1
+            heights = array(heights)
+            children = arange(len(parents)-1)
+            child_parents = self.parents[:-1]
+            order = lexsort((children, child_parents, heights[child_parents]))
+            self._child_order = order
+            self._child_heights = heights[child_parents][order]
+        return self._child_order, self._child_heights
+
+    def propagate(self, tip_nodes, tip_values, ufunc=add, active=None):
+        """Accumulate values from the tips to the root
+
+        Inputs:
+        tip_nodes: int array with the node index of the tips that have values
+        tip_values: array with one row per tip_nodes, i. e. tips x samples
+        ufunc: numpy ufunc that combines the values of sibling nodes, add for
+        counts and logical_or for presence/absence
+        active: optional bool array, only the values of the active nodes are
+        passed to their parents; used to skip the nodes known to be empty
+
+        Output:
+        values: array with one row per node in the tree, the value of a node is
+        ufunc reduced over the values of its children
+        """
+        tip_values = asarray(tip_values)
+        values = zeros((len(self.parents),) + tip_values.shape[1:],
+            dtype=tip_values.dtype)
+        values[tip_nodes] = tip_values
+
+        order, heights = self._levels()
+        if active is not None:
+            keep = active[order]
+            order, heights = order[keep], heights[keep]
+        if len(order) == 0:
+            return values
+
+        bounds = [0] + (flatnonzero(heights[1:] != heights[:-1])+1).tolist() +\
+            [len(order)]
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            children = order[start:end]
+            parents = self.parents[children]
+            first = ones(len(parents), dtype=bool)
+            first[1:] = parents[1:] != parents[:-1]
+            first = flatnonzero(first)
+            values[parents[first]] = ufunc.reduceat(values[children], first,
+                axis=0)
+        return values
+
+
+def tree_to_arrays(tree):
+    """Convert a tree object (i. e. from parse_newick) to an ArrayTree
+
+    Inputs:
+    tree: PhyloNode object, branches without length are taken as zero
+
+    Output:
+    ArrayTree with the nodes of tree
+    """
+    nodes = list(tree.postorder())
+    index = dict([(id(node), i) for i, node in enumerate(nodes)])
+
+    parents = zeros(len(nodes), dtype=int)
+    lengths = zeros(len(nodes))
+    tip_names, tips = [], []
+    for i, node in enumerate(nodes):
+        if node is tree or node.Parent is None:
+            parents[i] = -1
+        else:
+            parents[i] = index[id(node.Parent)]
+        lengths[i] = node.Length or 0.0
+        if not node.Children:
+            tip_names.append(node.Name)
+            tips.append(i)
+    return ArrayTree(parents, lengths, tip_names, tips)
+
+# keep the conversion of the last trees, the references to the tree objects
+# assure the ids can't be reused while they are cached
+_converted_trees = {}
+
+def as_array_tree(tree):
+    """Return tree as an ArrayTree, converting and caching tree objects"""
+    if isinstance(tree, ArrayTree):
+        return tree
+    try:
+        return _converted_trees[id(tree)][1]
+    except KeyError:
+        if len(_converted_trees) > 1:
+            _converted_trees.clear()
+        array_tree = tree_to_arrays(tree)
+        _converted_trees[id(tree)] = (tree, array_tree)
+        return array_tree
+
+def array_tree_dir(tree_fp):
+    """Return the directory of the converted tree of a Newick file"""
+    return splitext(tree_fp)[0] + '_arrays'
+
+def is_array_tree_dir(tree_dir):
+    """Return True if tree_dir has all the files of a saved ArrayTree"""
+    return all([exists(join(tree_dir, name + '.npy'))
+        for name in _TREE_ARRAYS])
+
+# trees loaded by this process and the versions of their files (see
+# path_version), by the path of the Newick file
+_loaded_trees = {}
+
+def get_tree(tree_fp=DEFAULT_TREE_FP):
+    """Return the ArrayTree of a Newick file, loaded once per process
+
+    The tree saved next to the file by scripts/convert_tree.py is loaded
+    memory-mapped, its pages are shared by all the processes; without it the
+    Newick file is parsed and converted. The tree is loaded again when either
+    of them changes.
+    """
+    tree_dir = array_tree_dir(tree_fp)
+    version = (path_version(tree_dir), path_version(tree_fp))
+    loaded_version, tree = _loaded_trees.get(tree_fp, (None, None))
+    if tree is not None and loaded_version == version:
+        return tree
+    if is_array_tree_dir(tree_dir):
+        tree = ArrayTree.load(tree_dir)
+    else:
+        tree = tree_to_arrays(parse_newick(open(tree_fp, 'U')))
+    _loaded_trees[tree_fp] = (version, tree)
+    return tree
+
+# trees of the studies loaded by this process and the versions of their
+# directories (see path_version), by directory
+_study_trees = {}
+
+def get_study_tree(tree_dir, tree_fp=DEFAULT_TREE_FP):
+    """Return the tree of a study, loaded once per process
+
+    The tree of the OTUs of the study saved in tree_dir by
+    scripts/process_new_study.py, or the full tree (see get_tree) for the
+    studies processed without one. The tree is loaded again when the study is
+    processed again.
+    """
+    version = path_version(tree_dir)
+    loaded_version, tree = _study_trees.get(tree_dir, (None, None))
+    if tree is not None and loaded_version == version:
+        return tree
+    if not is_array_tree_dir(tree_dir):
+        return get_tree(tree_fp)
+    tree = ArrayTree.load(tree_dir)
+    _study_trees[tree_dir] = (version, tree)
+    return tree
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+"""unweighted UniFrac computed for all the samples of a table at once"""
+
+from numpy import (asarray, diff, errstate, logical_or, ones, sqrt,
+    triu_indices, zeros)
+from scipy.linalg.blas import get_blas_funcs
+from scipy.sparse import issparse
+
+from evident.tree import as_array_tree
+
+
+def _presence_per_tip(counts):
+    """Return the observed OTUs and a bool OTUs x samples presence matrix"""
+    if issparse(counts):
+        counts = counts.tocsc()
+        counts.eliminate_zeros()
+        observed = (diff(counts.indptr) > 0).nonzero()[0]
+        presence = counts[:, observed].T.toarray() > 0
+    else:
+        counts = asarray(counts)
+        observed = (counts > 0).any(0).nonzero()[0]
+        presence = counts[:, observed].T > 0
+    return observed, presence
+
+def unweighted_unifrac(counts, otu_ids, tree, condensed=False):
+    """Calculate the unweighted UniFrac distance between all pairs of samples
+
+    As in qiime.beta_diversity.single_object_beta the branches between the
+    observed OTUs and the root of the tree are used, the ones above the
+    lowest common ancestor of the observed OTUs included. As in faith_pd the
+    branch above the root is not part of the tree (qiime adds its length to
+    all the samples).
+
+    Inputs:
+    counts: samples x OTUs numpy array or scipy sparse matrix
+    otu_ids: list of OTU identifiers, the cols of counts; must be tips of tree
+    tree: ArrayTree or tree object
+    condensed: if True return the upper triangle of the distance matrix as a
+    vector ordered by rows, as scipy.spatial.distance.pdist does
+
+    Output:
+    numpy float array with the distance matrix (samples x samples) or its
+    condensed version
+    """
+    tree = as_array_tree(tree)
+    observed, presence = _presence_per_tip(counts)
+    tips = tree.tip_nodes([otu_ids[i] for i in observed])
+    num_samples = presence.shape[1]
+
+    # number of observed tips under each node, the other nodes are not used
+    tips_below = tree.propagate(tips, ones(len(tips), dtype=int))
+    used = (tips_below > 0) & (tree.lengths > 0)
+    used[-1] = False
+    node_presence = tree.propagate(tips, presence, logical_or,
+        active=tips_below > 0)
+
+    # shared branch length is W'W with W = presence*sqrt(length), syrk only
+    # computes the upper triangle
+    weights = (node_presence[used].T * sqrt(tree.lengths[used])).T
+    syrk = get_blas_funcs('syrk', (weights,))
+    shared = syrk(1.0, weights, trans=1) if weights.size else \
+        zeros((num_samples, num_samples))
+    totals = shared.diagonal()
+
+    rows, cols = triu_indices(num_samples, 1)
+    shared = shared[rows, cols]
+    with errstate(divide='ignore', invalid='ignore'):
+        distances = (totals[rows] + totals[cols] - 2*shared) /\
+            (totals[rows] + totals[cols] - shared)
+
+    if condensed:
+        return distances
+    distmat = zeros((num_samples, num_samples))
+    distmat[rows, cols] = distances
+    distmat[cols, rows] = distances
+    return distmat
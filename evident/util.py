@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+"""utilities to move data between biom tables, numpy/scipy arrays and disk"""
+
+from os import chmod, makedirs, rename, stat
+from os.path import abspath, dirname, basename, exists, join
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from numpy import array, concatenate, save, zeros
+from scipy.sparse import csr_matrix
+
+
+def biom_table_to_csr(biom_table):
+    """Get the counts of a biom table as a sparse samples x observations matrix
+
+    Inputs:
+    biom_table: biom table object or evident.study.StudyBundle
+
+    Output:
+    counts: scipy csr_matrix with one row per sample and one col per OTU
+    sample_ids: list of sample identifiers, the rows of counts
+    observation_ids: list of OTU identifiers, the cols of counts
+    """
+    # a study bundle already has its counts as a (memory-mapped) csr_matrix
+    if hasattr(biom_table, 'csr'):
+        return biom_table.csr()
+
+    sample_ids = list(biom_table.SampleIds)
+    observation_ids = list(biom_table.ObservationIds)
+
+    data, indices, indptr = [], [], [0]
+    for values in biom_table.iterSampleData():
+        nonzero = values.nonzero()[0]
+        data.append(values[nonzero])
+        indices.append(nonzero)
+        indptr.append(indptr[-1] + len(nonzero))
+
+    if data:
+        data, indices = concatenate(data), concatenate(indices)
+    else:
+        data, indices = zeros(0), zeros(0, dtype=int)
+    counts = csr_matrix((array(data, dtype=float), indices, array(indptr)),
+        shape=(len(sample_ids), len(observation_ids)))
+    return counts, sample_ids, observation_ids
+
+def save_arrays(arrays_dir, arrays):
+    """Write each array as a .npy file named by its key in arrays_dir
+
+    The files are written to a new directory next to arrays_dir that then
+    takes its place with a rename, so the files are never seen half written:
+    the processes that have the previous files memory-mapped keep reading
+    them until they reload, and the ones that load arrays_dir during the
+    swap don't find it (the callers fall back to the text files).
+
+    Inputs:
+    arrays_dir: directory of the arrays, replaced if it exists
+    arrays: dict of numpy arrays by name
+    """
+    arrays_dir = abspath(arrays_dir)
+    parent, name = dirname(arrays_dir), basename(arrays_dir)
+    if not exists(parent):
+        makedirs(parent)
+    new_dir = mkdtemp(prefix='.%s.new.' % name, dir=parent)
+    for array_name, values in arrays.iteritems():
+        save(open(join(new_dir, array_name + '.npy'), 'wb'), values)
+    # mkdtemp only lets the owner read the directory
+    chmod(new_dir, 0755)
+
+    if exists(arrays_dir):
+        # a directory can only be renamed over an empty one
+        old_dir = mkdtemp(prefix='.%s.old.' % name, dir=parent)
+        rename(arrays_dir, old_dir)
+        rename(new_dir, arrays_dir)
+        rmtree(old_dir)
+    else:
+        rename(new_dir, arrays_dir)
+
+def path_version(path):
+    """Return an identifier of the current contents of path, None if missing
+
+    save_arrays replaces the directory, so its inode and modification time
+    change each time the arrays are written.
+    """
+    try:
+        info = stat(path)
+    except OSError:
+        return None
+    return info.st_ino, info.st_mtime
@@ -14,10 +14,14 @@ __status__ = "Development"
 
 
 from qiime.util import parse_command_line_parameters, make_option, get_options_lookup
+from qiime.parse import parse_mapping_file
+from biom.parse import parse_biom_table
+from evident.map_sample_space import SelectorIndex
+from evident.study import write_study_bundle
 from os.path import exists, join
 from os import listdir
 from re import sub
-from shutil import copyfile, move
+from shutil import copyfile, copytree, move, rmtree
 from datetime import datetime
 options_lookup = get_options_lookup()
 
@@ -63,6 +67,8 @@ def main():
     # validating the preexistance of the output files
     if (exists(study_name + '.biom') or exists(study_name + '_alpha_stderr.html') or \
        exists(study_name + '_selectors.txt') or \
+       exists(study_name + '_selectors.npz') or exists(study_name + '_bundle') or \
+       exists(study_name + '_tree') or \
        exists(study_name + '_alpha_stddev.html') or exists(study_name + '_map.txt') or \
        exists(study_name + '_unweighted_unifrac_pc.txt')) and not opts.force_overwrite:
        raise IOError, 'The output file(s) exist, either change the name of the study ' +\
@@ -85,6 +91,8 @@ def main():
     if not exists(selectors):
         raise IOError, "Couldn't find a selectors file in the input folder"
     
+    selectors_index = join(opts.input_path, 'selectors.npz')
+    
     mapping_file = join(opts.input_path, 'mapping_file.txt')
     if not exists(mapping_file):
         raise IOError, "Couldn't find a mapping file in the input folder"
@@ -99,9 +107,31 @@ def main():
     copyfile(alpha_stderr, join(opts.output_path, study_name + '_alpha_stderr.html'))
     copyfile(alpha_stddev, join(opts.output_path, study_name + '_alpha_stddev.html'))
     copyfile(selectors, join(opts.output_path, study_name + '_selectors.txt'))
+    # the studies processed before the index was written only have the
+    # selectors file, the index is built from it
+    if exists(selectors_index):
+        copyfile(selectors_index, join(opts.output_path, study_name + '_selectors.npz'))
+    else:
+        SelectorIndex.from_selectors(open(selectors, 'U')).save(
+            join(opts.output_path, study_name + '_selectors.npz'))
     copyfile(mapping_file, join(opts.output_path, study_name + '_map.txt'))
     copyfile(unweighted_unifrac_pc, join(opts.output_path, study_name + '_unweighted_unifrac_pc.txt'))
     
+    # the tree of the OTUs of the study, the studies processed without it use
+    # the full tree
+    study_tree = join(opts.input_path, 'tree')
+    if exists(study_tree):
+        tree_dir = join(opts.output_path, study_name + '_tree')
+        if exists(tree_dir):
+            rmtree(tree_dir)
+        copytree(study_tree, tree_dir)
+    
+    # binary copy of the biom and mapping files that the interface loads
+    # memory-mapped instead of parsing them
+    map_data, map_headers, comments = parse_mapping_file(open(mapping_file, 'U'))
+    write_study_bundle(join(opts.output_path, study_name + '_bundle'),
+        parse_biom_table(open(biom_file, 'U')), map_data, map_headers)
+    
     # modifying the studies.txt file
     lines = open(join(opts.input_path, 'study_preferences.txt'),'U').read().split('\n')
     rarefied = lines[0]
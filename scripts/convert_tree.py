@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+
+from qiime.util import parse_command_line_parameters, make_option
+from qiime.parse import parse_newick
+from os.path import exists
+from evident.tree import array_tree_dir, tree_to_arrays
+
+script_info = {}
+script_info['brief_description'] = "Converts a Newick tree to the arrays " +\
+    "Evident loads"
+script_info['script_description'] = """This script parses a Newick tree once \
+and saves it as the arrays of evident.tree.ArrayTree: the parent and the \
+branch length of each node in postorder and the names of the tips. Evident \
+loads these files memory-mapped instead of parsing the tree on each request. \
+By default the files are written to a folder next to the tree, where \
+evident.tree.get_tree looks for them."""
+
+script_info['script_usage'] = [("Convert the Greengenes tree","",
+'%prog -i /evident/data/gg_97_otus_4feb2011.tre')]
+script_info['output_description']= """A folder with one .npy file per array, \
+by default the name of the tree with _arrays instead of its extension."""
+script_info['required_options'] = [\
+ make_option('-i','--tree_fp',type='existing_filepath',
+            help='the Newick tree [REQUIRED]'),
+]
+script_info['optional_options'] = [\
+ make_option('-o','--output_dir',type='string',
+            help='the output folder [default: next to the tree]',
+            default=None),
+ make_option('-f','--force_overwrite',action='store_true',
+            help='force the overwrite of output files [default: %default]',
+            default=False),
+]
+script_info['version'] = __version__
+
+def main():
+    option_parser, opts, args =\
+       parse_command_line_parameters(**script_info)
+
+    output_dir = opts.output_dir or array_tree_dir(opts.tree_fp)
+    if exists(output_dir) and not opts.force_overwrite:
+        option_parser.error("Output directory already exists. Please choose"
+            " a different directory, or force overwrite with -f.")
+
+    tree_to_arrays(parse_newick(open(opts.tree_fp, 'U'))).save(output_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,10 +25,13 @@ from qiime.workflow.util import (print_commands,
 from qiime.workflow.downstream import run_beta_diversity_through_plots, run_alpha_rarefaction
 from qiime.util import load_qiime_config, parse_command_line_parameters, get_options_lookup
 from qiime.format import format_biom_table, format_mapping_file
-from evident.map_sample_space import get_sorted_counts_per_sample, make_selectors
+from evident.map_sample_space import (get_sorted_counts_per_sample,
+    make_selectors, SelectorIndex)
+from evident.tree import get_tree
+from evident.util import biom_table_to_csr
 from os import makedirs
 from os.path import join
-from numpy import inf
+from numpy import asarray, inf
 from shutil import copyfile
 
 qiime_config = load_qiime_config()
@@ -50,9 +53,10 @@ script_info['script_usage'].append(("Process a new study in parallel","""To proc
 study in parallel, using 10 jobs, you can use this command:""", """%prog -i \
 otu_table.biom -m mapping_file.txt -o processed_study -e 1000 -s HOST_SUBJECTY -aO 10"""))
 script_info['output_description']="""The script creates a raw.biom (original file), \
-an even sampled biom file, a selectors.txt file that contains information of how evident \
-should behave in the main GUI, a cleaned mapping file, a study_preference file that has \
-some basic information about the study, and alpha & beta calculations. """
+an even sampled biom file, a selectors.txt file (and its index, selectors.npz) that \
+contains information of how evident should behave in the main GUI, a cleaned \
+mapping file, the tree of the OTUs of the study (tree), a study_preference file \
+that has some basic information about the study, and alpha & beta calculations. """
 script_info['required_options'] = [\
  make_option('-i','--otu_table_fp',type='existing_filepath',
             help='the input biom table [REQUIRED]'),
@@ -142,12 +146,23 @@ def main():
     fout.write('#Sequences\tSubjects\tSamples\tMetadata\n')
     fout.write('\n'.join(results))
     fout.close()
+
+    # the same lines indexed by depth, this is what the interface queries
+    SelectorIndex.from_selectors(results).save(join(output_dir,
+        'selectors.npz'))
     
     fout = open(join(output_dir,'mapping_file.txt'),'w')
     fout.write(format_mapping_file(real_map_headers, real_map_data))
     fout.close()
     ## ******************** make_evident_selectors ********************
 
+    ## the tree of the OTUs observed in the study, used by the phylogenetic
+    ## metrics of the interface instead of the full tree
+    counts, sample_ids, otu_ids = biom_table_to_csr(biom_table)
+    totals = asarray(counts.sum(0)).ravel()
+    get_tree(tree_fp).shear([otu_id for otu_id, total in zip(otu_ids, totals)
+        if total > 0]).save(join(output_dir, 'tree'))
+
     fout = open(join(output_dir,'study_preferences.txt'),'w')
     fout.write('%d\n' % seqs_per_sample)
     fout.write('%s\n' % subject_category)
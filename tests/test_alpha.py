@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+from cogent.util.unit_test import TestCase, main
+from cogent.parse.tree import DndParser
+from numpy import array, log2
+from scipy.sparse import csr_matrix
+
+from evident.alpha import alpha_diversity, is_native_alpha_metric
+
+class TopLevelTests(TestCase):
+
+    def setUp(self):
+        self.counts = array([[1, 1, 2, 0, 4],
+                             [0, 3, 0, 0, 0],
+                             [1, 2, 2, 1, 1]])
+
+    def test_alpha_diversity(self):
+        "test the count based metrics against known values"
+        obs = alpha_diversity(csr_matrix(self.counts), ['observed_species',
+            'singles', 'doubles', 'Chao1'])
+        self.assertFloatEqual(obs, [[4, 2, 1, 4.5],
+                                    [1, 0, 0, 1],
+                                    [5, 3, 2, 6]])
+
+    def test_alpha_diversity_frequencies(self):
+        "test the metrics of the frequencies of the OTUs"
+        obs = alpha_diversity(self.counts, ['shannon', 'dominance',
+            'simpson', 'goods_coverage'])
+        p = array([1, 1, 2, 4])/8
+        self.assertFloatEqual(obs[0], [-(p*log2(p)).sum(), (p*p).sum(),
+            1 - (p*p).sum(), 1 - 2/8])
+        self.assertFloatEqual(obs[1], [0, 1, 0, 1])
+
+    def test_alpha_diversity_stack(self):
+        "test a list of tables is computed as one table"
+        obs = alpha_diversity([self.counts, csr_matrix(self.counts[:2])],
+            ['observed_species', 'chao1'])
+        self.assertEqual(obs.shape, (5, 2))
+        self.assertFloatEqual(obs[3:], obs[:2])
+
+    def test_faith_pd(self):
+        "test PD_whole_tree against known values"
+        tree = DndParser('((O1:0.5,O2:0.25):1,(O3:0.5,(O4:1,O5:2):0.5):0.25);')
+        otu_ids = ['O1', 'O2', 'O3', 'O4', 'O6']
+        obs = alpha_diversity(self.counts, ['PD_whole_tree', 'chao1'],
+            otu_ids, tree)
+        # O6 isn't in the tree, as in qiime it is ignored
+        self.assertFloatEqual(obs[:, 0], [2.5, 1.25, 4])
+        self.assertFloatEqual(obs[:, 1], [4.5, 1, 6])
+        # a stack of tables in a single call
+        obs = alpha_diversity([self.counts, self.counts[1:]],
+            ['PD_whole_tree'], otu_ids, tree)
+        self.assertFloatEqual(obs[:, 0], [2.5, 1.25, 4, 1.25, 4])
+        # the branch above the root is not part of the tree
+        tree = DndParser('((O1:0.5,O2:0.25):1,(O3:0.5,(O4:1,O5:2):0.5):0.25)'
+            ':3;')
+        obs = alpha_diversity(self.counts, ['PD_whole_tree'], otu_ids, tree)
+        self.assertFloatEqual(obs[:, 0], [2.5, 1.25, 4])
+
+    def test_unknown_metric(self):
+        "test unknown metrics raise an error"
+        self.assertRaises(ValueError, alpha_diversity, self.counts,
+            ['not_a_metric'])
+        self.assertRaises(ValueError, alpha_diversity, self.counts,
+            ['PD_whole_tree'])
+        self.assertTrue(is_native_alpha_metric('Chao1'))
+        self.assertTrue(is_native_alpha_metric('PD_whole_tree'))
+        self.assertFalse(is_native_alpha_metric('not_a_metric'))
+
+
+if __name__ == "__main__":
+    main()
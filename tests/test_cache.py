@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+from os import utime
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from cogent.util.unit_test import TestCase, main
+from numpy import array, float32, memmap, random
+
+from biom.table import SparseOTUTable, table_factory
+from qiime.rarefaction import get_rare_data
+from evident.cache import DistanceMatrixCache, rarefied_distmat
+from evident.distances import beta_distmat, to_condensed
+
+class TopLevelTests(TestCase):
+
+    def setUp(self):
+        self.cache_dir = mkdtemp()
+        self.cache = DistanceMatrixCache(self.cache_dir)
+        self.samples = ['s1', 's2', 's3']
+        self.distmat = array([[0, .2, .4], [.2, 0, .6], [.4, .6, 0]])
+
+    def tearDown(self):
+        rmtree(self.cache_dir)
+
+    def test_key(self):
+        "test the key ignores the order of the samples only"
+        key = self.cache.key('study', 100, 0, 'unifrac', self.samples)
+        self.assertEqual(key, self.cache.key('study', 100, 0, 'unifrac',
+            ['s3', 's1', 's2']))
+        for other in [('study2', 100, 0, 'unifrac', self.samples),
+                      ('study', 110, 0, 'unifrac', self.samples),
+                      ('study', 100, 1, 'unifrac', self.samples),
+                      ('study', 100, 0, 'euclidean', self.samples),
+                      ('study', 100, 0, 'unifrac', ['s1', 's2'])]:
+            self.assertNotEqual(key, self.cache.key(*other))
+
+    def test_get_put(self):
+        "test entries are stored condensed, memory-mapped and counted"
+        self.assertEqual(self.cache.get('missing'), None)
+        self.cache.put('key', self.samples, self.distmat)
+        samples, distmat = self.cache.get('key')
+        self.assertEqual(samples, self.samples)
+        self.assertFloatEqual(distmat, [.2, .4, .6])
+        self.assertEqual(distmat.dtype, float32)
+        self.assertTrue(isinstance(distmat, memmap))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        # other instances share the directory
+        other = DistanceMatrixCache(self.cache_dir)
+        self.assertEqual(other.get('key')[0], self.samples)
+
+    def test_get_or_compute(self):
+        "test compute is only called on a miss"
+        calls = []
+        def compute():
+            calls.append(1)
+            return self.samples, self.distmat
+        for i in range(3):
+            samples, distmat = self.cache.get_or_compute('study', 100, 0,
+                'unifrac', ['s2', 's1', 's3'], compute)
+            self.assertEqual(samples, self.samples)
+            self.assertFloatEqual(distmat, to_condensed(self.distmat))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.cache.stats()['hits'], 2)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_evict(self):
+        "test the least recently used entries are removed first"
+        self.cache.put('a', self.samples, self.distmat)
+        entry_size = self.cache.size()
+        self.cache.max_bytes = 2*entry_size
+        self.cache.put('b', self.samples, self.distmat)
+        utime(self.cache._paths('a')[0], (1, 1))
+        utime(self.cache._paths('b')[0], (2, 2))
+
+        # a was used, so b is now the least recent one
+        self.cache.get('a')
+        self.cache.put('c', self.samples, self.distmat)
+        self.assertEqual(self.cache.get('b'), None)
+        self.assertNotEqual(self.cache.get('a'), None)
+        self.assertNotEqual(self.cache.get('c'), None)
+        self.assertEqual(self.cache.size(), 2*entry_size)
+
+    def test_rarefied_distmat(self):
+        "test rarefied_distmat returns the cached entries"
+        class Table(object):
+            SampleIds = ['s3', 's1', 's2']
+        self.cache.put(self.cache.key('study', 10, 5, 'unifrac',
+            self.samples), self.samples, self.distmat)
+        samples, distmat = rarefied_distmat(Table(), 10, 'unifrac', None, 5,
+            'study', self.cache)
+        self.assertEqual(samples, self.samples)
+        self.assertFloatEqual(distmat, self.distmat)
+        samples, distmat = rarefied_distmat(Table(), 10, 'unifrac', None, 5,
+            'study', self.cache, condensed=True)
+        self.assertFloatEqual(distmat, [.2, .4, .6])
+
+    def test_rarefied_distmat_rarefied(self):
+        "test the rarefaction of the caller is only made on a cache miss"
+        class Table(object):
+            SampleIds = ['s3', 's1', 's2']
+        calls = []
+        def rarefied():
+            calls.append(1)
+            return (array([[1, 3], [2, 2], [4, 0]]), self.samples,
+                ['o1', 'o2'])
+        samples, distmat = rarefied_distmat(Table(), 4, 'euclidean', None, 5,
+            'study', self.cache, rarefied=rarefied)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(samples, self.samples)
+        self.assertFloatEqual(distmat[0], [0, 2**.5, 18**.5])
+
+        samples, cached = rarefied_distmat(Table(), 4, 'euclidean', None, 5,
+            'study', self.cache, rarefied=rarefied)
+        self.assertEqual(len(calls), 1)
+        self.assertFloatEqual(cached, distmat)
+
+    def test_rarefied_distmat_qiime_metric(self):
+        "test the metrics of qiime are rarefied without the global generator"
+        biom_table = table_factory(array([[5, 0, 3], [2, 6, 1], [0, 4, 7],
+            [3, 1, 2]]), self.samples, ['o1', 'o2', 'o3', 'o4'],
+            constructor=SparseOTUTable)
+        state = random.get_state()
+        samples, distmat = rarefied_distmat(biom_table, 8, 'canberra', None,
+            3)
+        self.assertEqual(random.get_state()[1].tolist(), state[1].tolist())
+        self.assertEqual(samples, self.samples)
+        self.assertEqual(rarefied_distmat(biom_table, 8, 'canberra', None,
+            3)[1].tolist(), distmat.tolist())
+
+        # the draws are the ones of qiime's get_rare_data after seeding
+        random.seed(3)
+        exp = beta_distmat(get_rare_data(biom_table, 8), 'canberra', None)[1]
+        self.assertFloatEqual(distmat, exp)
+
+
+if __name__ == "__main__":
+    main()
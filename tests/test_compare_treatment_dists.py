@@ -22,7 +22,9 @@ from qiime.test import initiate_timeout, disable_timeout
 from numpy import isnan, nan, array, std, allclose
 from evident.compare_treatment_dists import (between_treatments_dist, 
     treatment_dist, treatment_covering, within_treatment_dist, 
-    compare_treatment_dists)
+    compare_treatment_dists, SampleIndex, group_distance_summary,
+    batch_compare_treatment_dists, stack_distmats)
+from evident.distances import to_condensed
 from cogent.parse.tree import DndParser
 from biom.parse import parse_biom_table_str
 
@@ -130,6 +132,144 @@ class compare_treatments(TestCase):
         self.assertTrue(isnan(obs_m))
         self.assertTrue(isnan(obs_se))
 
+    def test_sample_index(self):
+        """Tests the index map and that it can replace the marginal ids."""
+        covering = {'HF': ['d1', 'd2', 'd3'], 'LF': ['a1', 'a2', 'c1']}
+        si = SampleIndex(self.samples, covering)
+        self.assertEqual(len(si), 13)
+        self.assertEqual(si.positions['c1'], 6)
+        self.assertEqual(list(si.treatment_indices['HF']), [10, 11, 12])
+        self.assertEqual(list(si.treatment_indices['LF']), [0, 1, 6])
+        self.assertEqual(list(si.group_indices(['b2', 'a1'])), [4, 0])
+        self.assertTrue(si.matches(tuple(self.samples)))
+        self.assertFalse(si.matches(self.samples[::-1]))
+        # the functions give the same results with the index or the ids
+        g1, g2 = ['a3','a1','b3'], ['c1', 'd2', 'c3']
+        self.assertFloatEqual(between_treatments_dist(g1, g2, si,
+            self.distmat), between_treatments_dist(g1, g2, self.samples,
+            self.distmat))
+        self.assertFloatEqual(treatment_dist(g1, si, self.distmat),
+            treatment_dist(g1, self.samples, self.distmat))
+        self.assertFloatEqual(within_treatment_dist(g2, si, self.distmat),
+            within_treatment_dist(g2, self.samples, self.distmat))
+
+    def test_group_distance_summary(self):
+        """Tests the block reductions match the per group functions."""
+        groups = [['a1','a2','c1'], ['d1'], ['b1','b2','c3','d3']]
+        labels = array([0, 0, -1, 2, 2, -1, 0, -1, 2, -1, 1, -1, 2])
+        obs = group_distance_summary(labels, self.distmat)
+        self.assertEqual(obs['counts'][0][0], 6)
+        self.assertEqual(obs['counts'][0][2], 12)
+        self.assertEqual(obs['counts'][1][1], 0)
+        self.assertEqual(list(obs['to_all_counts']), [30, 12, 36])
+        for i, g in enumerate(groups):
+            exp_m, exp_se = treatment_dist(g, self.samples, self.distmat)
+            self.assertFloatEqual(obs['to_all_means'][i], exp_m)
+            exp_m, exp_se = within_treatment_dist(g, self.samples,
+                self.distmat)
+            if isnan(exp_m):
+                self.assertTrue(isnan(obs['means'][i][i]))
+            else:
+                self.assertFloatEqual(obs['means'][i][i], exp_m)
+            for j, h in enumerate(groups):
+                if i != j:
+                    exp_m, exp_se = between_treatments_dist(g, h,
+                        self.samples, self.distmat)
+                    self.assertFloatEqual(obs['means'][i][j], exp_m)
+        self.assertFloatEqual(obs['sums'], obs['sums'].T)
+        # groups are numbered up to num_groups even if they are empty
+        obs = group_distance_summary(labels, self.distmat, 4)
+        self.assertEqual(obs['sums'].shape, (4, 4))
+        self.assertEqual(obs['to_all_counts'][3], 0)
+
+    def test_group_distance_summary_stack(self):
+        """Tests a stack of distmats is summarized one distmat at a time."""
+        labels = array([0, 0, -1, 2, 2, -1, 0, -1, 2, -1, 1, -1, 2])
+        stack = array([self.distmat, 2*self.distmat, self.distmat**2])
+        obs = group_distance_summary(labels, stack)
+        self.assertEqual(obs['sums'].shape, (3, 3, 3))
+        self.assertEqual(obs['to_all_means'].shape, (3, 3))
+        self.assertEqual(obs['counts'].shape, (3, 3))
+        for i, dm in enumerate(stack):
+            exp = group_distance_summary(labels, dm)
+            for key in ['sums', 'sumsq', 'to_all_sums', 'to_all_sumsq']:
+                self.assertFloatEqual(obs[key][i], exp[key])
+        self.assertFloatEqual(obs['to_all_means'][1],
+            2*obs['to_all_means'][0])
+
+    def test_group_distance_summary_condensed(self):
+        """Tests condensed distmats give the same summary as square ones."""
+        labels = array([0, 0, -1, 2, 2, -1, 0, -1, 2, -1, 1, -1, 2])
+        stack = array([self.distmat, 2*self.distmat])
+        condensed = array([to_condensed(dm) for dm in stack])
+        exp = group_distance_summary(labels, stack)
+        obs = group_distance_summary(labels, condensed, condensed=True)
+        single = group_distance_summary(labels, condensed[1], condensed=True)
+        for key in exp:
+            self.assertFloatEqual(obs[key], exp[key])
+            self.assertFloatEqual(single[key], exp[key][1] if
+                key not in ['counts', 'to_all_counts'] else exp[key])
+
+    def test_treatment_dists_condensed(self):
+        """Tests the single group functions take condensed distmats."""
+        condensed = to_condensed(self.distmat)
+        g1, g2 = ['a1', 'b2', 'd3'], ['c1', 'a2']
+        self.assertFloatEqual(between_treatments_dist(g1, g2, self.samples,
+            condensed), between_treatments_dist(g1, g2, self.samples,
+            self.distmat))
+        self.assertFloatEqual(treatment_dist(g1, self.samples, condensed),
+            treatment_dist(g1, self.samples, self.distmat))
+        self.assertFloatEqual(within_treatment_dist(g1, self.samples,
+            condensed), within_treatment_dist(g1, self.samples, self.distmat))
+
+    def test_stack_distmats_condensed(self):
+        """Tests distmats are condensed and put in the order of the first."""
+        order = range(len(self.samples))[::-1]
+        reordered = self.distmat.take(order, 0).take(order, 1)
+        samples, stack = stack_distmats([(self.samples, self.distmat),
+            ([self.samples[i] for i in order], to_condensed(reordered))],
+            condensed=True)
+        self.assertEqual(samples, self.samples)
+        self.assertEqual(stack.shape, (2, len(to_condensed(self.distmat))))
+        self.assertFloatEqual(stack[1], to_condensed(self.distmat))
+
+    def test_batch_compare_treatment_dists(self):
+        """Tests the per iteration and averaged stats of a distmat stack."""
+        sids = ['a1', 'a2','c1', 'd1', 'd2', 'd3', 'b1']
+        mf = {'a1': {'Diet': 'LF'}, 'a2': {'Diet': 'LF'}, 'c1': {'Diet': 'LF'},
+            'd1': {'Diet': 'HF'}, 'd2': {'Diet': 'HF'}, 'd3': {'Diet': 'HF'},
+            'b1': {'Diet': 'MF'}}
+        stack = array([self.distmat, 2*self.distmat])
+        marginals, per_iteration, averages = batch_compare_treatment_dists(
+            sids, 'Diet', mf, self.samples, stack)
+        self.assertEqualItems(marginals, ['LF', 'HF', 'MF'])
+        bt_wi_m, bt_wi_se, ta_m_se = per_iteration
+        self.assertEqual(bt_wi_m.shape, (2, 3, 3))
+        self.assertEqual(ta_m_se.shape, (2, 3, 2))
+        lf, hf = marginals.index('LF'), marginals.index('HF')
+        exp_m, exp_se = between_treatments_dist(['a1','a2','c1'],
+            ['d1','d2','d3'], self.samples, self.distmat)
+        self.assertFloatEqual(bt_wi_m[0][min(lf, hf)][max(lf, hf)], exp_m)
+        self.assertFloatEqual(bt_wi_se[0][min(lf, hf)][max(lf, hf)], exp_se)
+        self.assertFloatEqual(bt_wi_m[0][max(lf, hf)][min(lf, hf)], 0)
+        exp_m, exp_se = treatment_dist(['d1','d2','d3'], self.samples,
+            self.distmat)
+        self.assertFloatEqual(ta_m_se[1][hf], [2*exp_m, 2*exp_se])
+        # averages of the two iterations
+        self.assertFloatEqual(averages[2], 1.5*ta_m_se[0])
+        self.assertFloatEqual(averages[0][lf][lf], 1.5*bt_wi_m[0][lf][lf])
+        self.assertFloatEqual(averages[1][hf][hf], 1.5*bt_wi_se[0][hf][hf])
+        # a single sample has no within dist in any iteration
+        mf_ind = marginals.index('MF')
+        self.assertTrue(isnan(averages[0][mf_ind][mf_ind]))
+        # the condensed stack gives the same stats
+        condensed = array([to_condensed(dm) for dm in stack])
+        obs = batch_compare_treatment_dists(sids, 'Diet', mf, self.samples,
+            condensed, condensed=True)
+        self.assertEqual(obs[0], marginals)
+        for o, e in zip(obs[2], averages):
+            self.assertFloatEqual(o, e)
+
     def test_treatment_covering(self):
         """Tests treatment covering returns the correct data."""
         #sids = [['a1', 'a2'], ['c1'], ['d1', 'd2', 'd3']]
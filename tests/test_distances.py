@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+from cogent.util.unit_test import TestCase, main
+from cogent.parse.tree import DndParser
+from numpy import arange, array, concatenate, float32, triu_indices
+from scipy.sparse import csr_matrix
+
+from evident.distances import (distance_matrix, list_known_metrics,
+    pairwise_minimum_sums, condensed_index, condensed_num_samples,
+    condensed_rows, condensed_take, permute_condensed, to_condensed,
+    to_square)
+
+class TopLevelTests(TestCase):
+
+    def setUp(self):
+        self.counts = array([[1, 0, 3, 2],
+                             [0, 4, 1, 1],
+                             [2, 2, 0, 0]])
+        self.otu_ids = ['O1', 'O2', 'O3', 'O4']
+        self.upper = triu_indices(3, 1)
+
+    def test_pairwise_minimum_sums(self):
+        "test the sums of the element-wise minimum of the rows"
+        exp = array([[6, 2, 1], [2, 6, 2], [1, 2, 4]])
+        self.assertFloatEqual(pairwise_minimum_sums(self.counts), exp)
+        self.assertFloatEqual(pairwise_minimum_sums(csr_matrix(self.counts)),
+            exp)
+
+    def test_distance_matrix(self):
+        "test the non phylogenetic metrics against known values"
+        exp = {'binary_jaccard': [0.5, 0.75, 0.75],
+            'binary_sorensen_dice': [1/3, 0.6, 0.6],
+            'bray_curtis': [2/3, 0.8, 0.6],
+            'chord': [1.1704952847625179, 1.27359158563127, 0.816496580927726],
+            'euclidean': [4.69041575982343, 4.242640687119285,
+                3.1622776601683795],
+            'hellinger': [0.9753180045602268, 1.1927488129570176,
+                0.919401686761966],
+            'kulczynski': [2/3, 0.7916666666666667, 0.5833333333333334],
+            'manhattan': [8, 8, 6]}
+        for metric, values in exp.items():
+            obs = distance_matrix(csr_matrix(self.counts), self.otu_ids,
+                metric)
+            self.assertFloatEqual(obs[self.upper], values)
+            self.assertFloatEqual(obs, obs.T)
+            self.assertFloatEqual(obs.diagonal(), [0, 0, 0])
+
+    def test_distance_matrix_empty_samples(self):
+        "test samples without sequences are at distance 0 from each other"
+        counts = array([[1, 0, 3, 2], [0, 0, 0, 0], [0, 0, 0, 0]])
+        for metric in ['bray_curtis', 'binary_jaccard', 'hellinger']:
+            obs = distance_matrix(counts, self.otu_ids, metric)
+            self.assertFloatEqual(obs[1][2], 0)
+
+    def test_distance_matrix_phylogenetic(self):
+        "test the phylogenetic metrics and the errors"
+        tree = DndParser('((O1:0.5,O2:0.5):0.5,(O3:0.5,O4:0.5):0.5);')
+        obs = distance_matrix(self.counts, self.otu_ids, 'unweighted_unifrac',
+            tree)
+        self.assertFloatEqual(obs[self.upper], [1/3, 2/3, 2/3])
+        self.assertRaises(ValueError, distance_matrix, self.counts,
+            self.otu_ids, 'unifrac')
+        self.assertRaises(ValueError, distance_matrix, self.counts,
+            self.otu_ids, 'not_a_metric')
+        self.assertTrue('unifrac' in list_known_metrics())
+
+    def test_condensed(self):
+        "test the conversions between square and condensed distmats"
+        distmat = distance_matrix(self.counts, self.otu_ids, 'bray_curtis')
+        condensed = to_condensed(distmat)
+        self.assertEqual(condensed.dtype, float32)
+        self.assertFloatEqual(condensed, distmat[self.upper])
+        self.assertFloatEqual(to_square(condensed), distmat)
+        self.assertFloatEqual(distance_matrix(self.counts, self.otu_ids,
+            'bray_curtis', condensed=True), condensed)
+        self.assertEqual(condensed_num_samples(3), 3)
+        self.assertRaises(ValueError, condensed_num_samples, 4)
+
+    def test_condensed_index(self):
+        "test the positions of the pairs in the condensed distmat"
+        rows, cols = triu_indices(5, 1)
+        self.assertEqual(condensed_index(rows, cols, 5).tolist(), range(10))
+        self.assertEqual(condensed_index(cols, rows, 5).tolist(), range(10))
+        self.assertEqual(condensed_index(3, 1, 5), 5)
+
+    def test_condensed_take_and_rows(self):
+        "test blocks and row strips of a condensed distmat"
+        square = to_square(arange(1, 11))
+        condensed = to_condensed(square)
+        self.assertFloatEqual(condensed_take(condensed, [4, 0], [0, 2, 4]),
+            square[[4, 0]][:, [0, 2, 4]])
+        strips = list(condensed_rows(condensed, 2))
+        self.assertEqual([start for start, rows in strips], [0, 2, 4])
+        self.assertFloatEqual(concatenate([rows for start, rows in strips]),
+            square)
+        order = [3, 0, 4, 1, 2]
+        self.assertFloatEqual(to_square(permute_condensed(condensed, order)),
+            square[order][:, order])
+
+    def test_distance_matrix_phylogenetic_condensed(self):
+        "test the condensed unifrac distmat"
+        tree = DndParser('((O1:0.5,O2:0.5):0.5,(O3:0.5,O4:0.5):0.5);')
+        obs = distance_matrix(self.counts, self.otu_ids, 'unweighted_unifrac',
+            tree, condensed=True)
+        self.assertEqual(obs.dtype, float32)
+        self.assertFloatEqual(obs, [1/3, 2/3, 2/3])
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,10 @@ __email__ = "yoshiki89@gmail.com"
 __status__ = "Development"
 
 from biom.parse import parse_biom_table
-from evident.map_sample_space import get_sorted_counts_per_sample, make_selectors
+from os import remove
+from numpy import array
+from evident.map_sample_space import (get_sorted_counts_per_sample,
+    make_selectors, SelectorIndex)
 
 from cogent.util.unit_test import TestCase, main
 from qiime.util import get_qiime_temp_dir, get_tmp_filename
@@ -28,31 +31,30 @@ class TopLevelTests(TestCase):
         self.mapping_file_tuple = (self.mapping_data, self.mapping_headers)
         self.biom_object = parse_biom_table(input_biom_table)
 
-        self.sorted_counts_per_sample = [ (146.0, u'PC.481'), (147.0, u'PC.355'),\
-            (148.0, u'PC.636'), (149.0, u'PC.354'), (149.0, u'PC.593'),\
-            (149.0, u'PC.607'), (149.0, u'PC.635'), (150.0, u'PC.356'),\
-            (150.0, u'PC.634')]
+        self.sorted_counts_per_sample = (array([146.0, 147.0, 148.0, 149.0,
+            149.0, 149.0, 149.0, 150.0, 150.0]), array([u'PC.481', u'PC.355',
+            u'PC.636', u'PC.354', u'PC.593', u'PC.607', u'PC.635', u'PC.356',
+            u'PC.634'], dtype=object))
 
     def test_get_sorted_counts_per_sample(self):
         "test for correct sorting of the sequences per sample"
 
         # check defaults
-        output = get_sorted_counts_per_sample(self.biom_object)
-        expected_output = [ (146.0, u'PC.481'), (147.0, u'PC.355'),\
-                            (148.0, u'PC.636'), (149.0, u'PC.354'),\
-                            (149.0, u'PC.593'), (149.0, u'PC.607'),\
-                            (149.0, u'PC.635'), (150.0, u'PC.356'),\
-                            (150.0, u'PC.634')]
-        self.assertEquals(output, expected_output)
+        counts, sample_ids = get_sorted_counts_per_sample(self.biom_object)
+        self.assertEquals(counts.tolist(), [146.0, 147.0, 148.0, 149.0, 149.0, 149.0,
+            149.0, 150.0, 150.0])
+        self.assertEquals(sample_ids.tolist(), [u'PC.481', u'PC.355',
+            u'PC.636', u'PC.354', u'PC.593', u'PC.607', u'PC.635', u'PC.356',
+            u'PC.634'])
 
         # check reversed
-        output = get_sorted_counts_per_sample(self.biom_object, reverse=True)
-        expected_output = [ (150.0, u'PC.634'), (150.0, u'PC.356'),\
-                            (149.0, u'PC.635'), (149.0, u'PC.607'),\
-                            (149.0, u'PC.593'), (149.0, u'PC.354'),\
-                            (148.0, u'PC.636'), (147.0, u'PC.355'),\
-                            (146.0, u'PC.481')]
-        self.assertEquals(output, expected_output)
+        counts, sample_ids = get_sorted_counts_per_sample(self.biom_object,
+            reverse=True)
+        self.assertEquals(counts.tolist(), [150.0, 150.0, 149.0, 149.0, 149.0, 149.0,
+            148.0, 147.0, 146.0])
+        self.assertEquals(sample_ids.tolist(), [u'PC.634', u'PC.356',
+            u'PC.635', u'PC.607', u'PC.593', u'PC.354', u'PC.636', u'PC.355',
+            u'PC.481'])
 
     def test_make_selectors(self):
         "test for the creation of the selectors string"
@@ -71,6 +73,35 @@ class TopLevelTests(TestCase):
             '149\t8\t1\tNone', '150\t7\t1\tNone'], ['SampleID', 'BarcodeSequence',\
             'Treatment', 'DOB', 'Description']))
 
+    def test_selector_index(self):
+        "test the queries of the selectors index"
+        index = SelectorIndex.from_selectors(['#Sequences\tSubjects\tSamples'
+            '\tMetadata', '146\t9\t2\tBarcodeSequence,Treatment,DOB',
+            '147\t8\t2\tNone', '148\t7\t1\tTreatment', '150\t5\t1\tNone'])
+        self.assertEqual(index.columns, ['BarcodeSequence', 'Treatment', 'DOB'])
+        self.assertEqual(index.min_depth(), 146)
+        self.assertEqual(index.max_depth(), 150)
+
+        self.assertEqual(index.query(147), {'depth': 147, 'subjects': 8,
+            'samples': 2, 'columns': ['BarcodeSequence', 'Treatment', 'DOB']})
+        self.assertEqual(index.query(149), {'depth': 148, 'subjects': 7,
+            'samples': 1, 'columns': ['Treatment']})
+        self.assertEqual(index.query(1000)['columns'], ['Treatment'])
+        # below the first depth the first line applies
+        self.assertEqual(index.query(10)['depth'], 146)
+
+        # the index is the same once saved and loaded
+        index_fp = get_tmp_filename(tmp_dir=get_qiime_temp_dir(),
+            prefix='selectors_', suffix='.npz')
+        index.save(index_fp)
+        loaded = SelectorIndex.load(index_fp)
+        remove(index_fp)
+        self.assertEqual(loaded.columns, index.columns)
+        for depth in range(140, 155):
+            self.assertEqual(loaded.query(depth), index.query(depth))
+
+        self.assertEqual(SelectorIndex.from_selectors([]).query(100), None)
+
 mapping_file_data = [\
     ['PC.354','AGCACGAGCCTA','YATGCTGCCTCCCGTAGGAGT','Control','20061218','Control_mouse_I.D._354'],\
     ['PC.355','AACTCGTCGATG','YATGCTGCCTCCCGTAGGAGT','Control','20061218','Control_mouse_I.D._355'],\
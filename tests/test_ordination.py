@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+from numpy import (abs as np_abs, array, cos, dot, eye, maximum,
+    minimum, ones, sin, sqrt)
+from numpy.linalg import eigh
+from numpy.random import RandomState
+from scipy.spatial.distance import pdist, squareform
+
+from cogent.util.unit_test import TestCase, main
+from evident.distances import to_condensed
+from evident.ordination import (center_distmat, pcoa, pcoa_coords,
+    procrustes_align, summarize_jackknife)
+
+class TopLevelTests(TestCase):
+    def setUp(self):
+        points = RandomState(3).random_sample((12, 4))
+        self.distmat = squareform(pdist(points, 'braycurtis'))
+
+    def test_center_distmat(self):
+        """the centered matrix is -J*D**2*J/2"""
+        n = self.distmat.shape[0]
+        j = eye(n) - ones((n, n))/n
+        expected = dot(dot(j, -0.5*self.distmat**2), j)
+        self.assertFloatEqual(center_distmat(self.distmat), expected)
+        # the condensed distances are float32
+        condensed = to_condensed(self.distmat)
+        square = squareform(condensed.astype(float))
+        expected = dot(dot(j, -0.5*square**2), j)
+        self.assertFloatEqual(center_distmat(condensed), expected)
+
+    def test_pcoa(self):
+        """the first axes are those of a full eigendecomposition"""
+        values, vectors = eigh(center_distmat(self.distmat))
+        order = values.argsort()[::-1]
+        values, vectors = values[order], vectors[:, order]
+
+        coords, eigenvalues, percents = pcoa(self.distmat, 3)
+        self.assertEqual(coords.shape, (12, 3))
+        self.assertFloatEqual(eigenvalues, values[:3])
+        # bray curtis is not euclidean, the percents are relative to the
+        # absolute values of all the eigenvalues as in qiime
+        self.assertTrue(values.min() < -1e-10)
+        self.assertFloatEqual(percents, values[:3]/np_abs(values).sum()*100)
+        # the sign of each axis is arbitrary
+        self.assertFloatEqual(np_abs(coords),
+            np_abs(vectors[:, :3]*sqrt(np_abs(values[:3]))))
+
+        # no more axes than samples
+        coords, eigenvalues, percents = pcoa(self.distmat, 20)
+        self.assertEqual(coords.shape, (12, 12))
+        # the centered matrix has a 0 eigenvalue
+        self.assertFloatEqualAbs(eigenvalues, values)
+        self.assertFloatEqualAbs(np_abs(coords), np_abs(vectors*sqrt(np_abs(
+            values))))
+
+    def test_pcoa_coords(self):
+        """the output is that of parse_coords"""
+        headers, coords, eigenvalues, percents = pcoa_coords(['a', 'b', 'c'],
+            array([0.5, 0.25, 0.5]))
+        self.assertEqual(headers, ['a', 'b', 'c'])
+        self.assertEqual(coords.shape, (3, 3))
+        self.assertFloatEqual(eigenvalues[2], 0)
+
+    def test_procrustes_align(self):
+        """rotated and reflected copies are aligned back to the reference"""
+        reference = pcoa(self.distmat, 2)[0]
+        rotation = array([[cos(1), -sin(1)], [sin(1), cos(1)]])
+        reflection = array([[1, 0], [0, -1]])
+        coords = array([reference, dot(reference, rotation),
+            dot(reference, reflection)])
+        aligned = procrustes_align(coords, reference)
+        for i in range(3):
+            self.assertFloatEqual(aligned[i], reference)
+
+    def test_summarize_jackknife(self):
+        """the bounds are the interquartile range of the aligned coords"""
+        reference = pcoa(self.distmat, 2)[0]
+        coords = array([reference*f for f in (1, 0.5, 1.5, 2, 0)])
+        coords[2] = -coords[2]
+        mean, low, high, eigenvalues, percents = summarize_jackknife(coords,
+            [[2, 1], [4, 3]], [[20, 10], [40, 30]])
+        self.assertFloatEqual(mean, reference)
+        self.assertFloatEqual(low, minimum(reference*0.5, reference*1.5))
+        self.assertFloatEqual(high, maximum(reference*0.5, reference*1.5))
+        self.assertFloatEqual(eigenvalues, [3, 2])
+        self.assertFloatEqual(percents, [30, 20])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+from base64 import b64decode
+
+from numpy import array, fromstring
+
+from cogent.util.unit_test import TestCase, main
+from evident.payload import (encode_float32, encode_categories,
+    _extreme_rows, format_binary_pcoa_to_js, format_binary_mapping_file_to_js)
+
+class TopLevelTests(TestCase):
+    def setUp(self):
+        self.header = ['PC.354', 'PC.355', 'PC.356', 'PC.481']
+        self.coords = array([[0.1, -0.2, 0.3, 0.05], [-0.4, 0.1, 0.0, 0.02],
+            [0.2, 0.3, -0.1, -0.01], [0.1, -0.2, -0.2, -0.06]])
+
+    def test_encode_float32(self):
+        """the buffer is little-endian float32"""
+        decoded = fromstring(b64decode(encode_float32(self.coords)),
+            dtype='<f4')
+        self.assertFloatEqual(decoded, self.coords.ravel(), 1e-7)
+
+    def test_encode_categories(self):
+        """each value is the index of its category"""
+        categories, codes, width = encode_categories(['Fast', 'Control',
+            'Fast', 'Fast'])
+        self.assertEqual(categories, ['Control', 'Fast'])
+        self.assertEqual(width, 1)
+        self.assertEqual(fromstring(b64decode(codes), dtype='<u1').tolist(),
+            [1, 0, 1, 1])
+
+        categories, codes, width = encode_categories(range(300))
+        self.assertEqual(width, 2)
+        self.assertEqual(len(b64decode(codes)), 600)
+
+    def test_extreme_rows(self):
+        """the rows with the max or min of each axis"""
+        self.assertEqual(_extreme_rows(self.coords, 2), [0, 1, 2])
+        self.assertEqual(_extreme_rows(self.coords, 3), [0, 1, 2, 3])
+
+    def test_format_binary_pcoa_to_js(self):
+        """the samples are only in the buffers"""
+        out = format_binary_pcoa_to_js(self.header, self.coords, [1, 0.5, 0.2,
+            0.1], [50, 25, 15, 10], coords_low=self.coords-0.1,
+            coords_high=self.coords+0.1)
+        self.assertFalse("g_spherePositions['" in out)
+        self.assertFalse("g_ellipsesDimensions['" in out)
+        self.assertTrue('evidentSetSpheres(["PC.354", "PC.355", "PC.356", '
+            '"PC.481"], 4, \'%s\');' % encode_float32(self.coords) in out)
+        self.assertTrue('evidentSetEllipses(' in out)
+
+        out = format_binary_pcoa_to_js(self.header, self.coords, [1, 0.5, 0.2,
+            0.1], [50, 25, 15, 10])
+        self.assertFalse('evidentSetEllipses(' in out)
+
+    def test_format_binary_mapping_file_to_js(self):
+        """the columns are dictionary encoded"""
+        out = format_binary_mapping_file_to_js([['PC.354', 'Control'],
+            ['PC.355', 'Fast']], ['SampleID', 'Treatment'], ['Treatment'])
+        self.assertFalse("'PC.354'" in out)
+        self.assertTrue('evidentSetMappingFileData(["PC.354", "PC.355"], '
+            '[[["PC.354", "PC.355"], "AAE=", 1], [["Control", "Fast"], '
+            '"AAE=", 1]]);' in out)
+
+if __name__ == "__main__":
+    main()
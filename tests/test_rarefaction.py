@@ -11,12 +11,13 @@ __maintainer__ = "Yoshiki Vazquez-Baeza"
 __email__ = "yoshiki89@gmail.com"
 __status__ = "Development"
 
+from numpy import isnan
 from numpy.random import seed
 from qiime.parse import parse_newick
 from biom.parse import parse_biom_table
 from cogent.util.unit_test import TestCase, main
 from evident.rarefaction import (build_color_preferences, single_object_alpha,
-    get_rarefactions, _format_rarefactions,
+    get_rarefactions, _format_rarefactions, alpha_rarefaction_array,
     generate_alpha_rarefaction_data_from_point_in_omega)
 
 class TopLevelTests(TestCase):
@@ -83,15 +84,34 @@ class TopLevelTests(TestCase):
         """check multiple rarefactions are correctly performed"""
 
         # test for a 6 depths rarefaction case
-        expected_output = [\
-            [40, 0, parse_biom_table(expected_biom_object_a)],\
-            [60, 0, parse_biom_table(expected_biom_object_b)],\
-            [80, 0, parse_biom_table(expected_biom_object_c)],\
-            [100, 0, parse_biom_table(expected_biom_object_d)],\
-            [120, 0, parse_biom_table(expected_biom_object_e)],\
-            [140, 0, parse_biom_table(expected_biom_object_f)]]
         out_rarefactions = get_rarefactions(self.biom_object, 40, 140, 1, 5)
-        self.assertEquals(out_rarefactions, expected_output)
+        self.assertEquals([r[:2] for r in out_rarefactions], [[40, 0],
+            [60, 0], [80, 0], [100, 0], [120, 0], [140, 0]])
+        for depth, iteration, rarefied in out_rarefactions:
+            self.assertEquals(rarefied.SampleIds, self.biom_object.SampleIds)
+            self.assertEquals(rarefied.ObservationIds,
+                self.biom_object.ObservationIds)
+            self.assertEquals([rarefied.sampleData(s).sum() for s in
+                rarefied.SampleIds], [depth]*len(rarefied.SampleIds))
+
+        # the depths of an iteration are nested
+        for smaller, larger in zip(out_rarefactions, out_rarefactions[1:]):
+            for sample_id in self.biom_object.SampleIds:
+                self.assertTrue((smaller[2].sampleData(sample_id) <=
+                    larger[2].sampleData(sample_id)).all())
+
+        # multiple iterations, the samples with less sequences are removed
+        out_rarefactions = get_rarefactions(self.biom_object, 140, 150, 2, 2,
+            seed=5)
+        self.assertEquals([r[:2] for r in out_rarefactions], [[140, 0],
+            [140, 1], [145, 0], [145, 1], [150, 0], [150, 1]])
+        self.assertEquals(out_rarefactions[-1][2].SampleIds, ('PC.356',
+            'PC.634'))
+        self.assertNotEqual(out_rarefactions[0][2], out_rarefactions[1][2])
+
+        # the same seed gives the same rarefactions
+        self.assertEquals(out_rarefactions, get_rarefactions(self.biom_object,
+            140, 150, 2, 2, seed=5))
 
     def test_format_rarefactions(self):
         """check the formatting is being performed correctly"""
@@ -108,18 +128,62 @@ class TopLevelTests(TestCase):
         output = _format_rarefactions(metrics_data_b, sample_ids)
         self.assertEquals(output, expected_formated_dict_b)
 
+    def test_alpha_rarefaction_array(self):
+        """check the axes of the alpha rarefaction array"""
+        values, depths, sample_ids, headers = alpha_rarefaction_array(
+            self.biom_object, self.metrics, [139, 35, 87], 2, self.tree_object,
+            seed=7)
+        self.assertEquals(values.shape, (3, 2, 9, 3))
+        self.assertEquals(depths, [35, 87, 139])
+        self.assertEquals(sample_ids, list(self.biom_object.SampleIds))
+        self.assertEquals(headers, ['observed_species', 'chao1',
+            'PD_whole_tree'])
+        self.assertFalse(isnan(values).any())
+
+        # the samples with fewer sequences than a depth are nan
+        values, depths, sample_ids, headers = alpha_rarefaction_array(
+            self.biom_object, ['observed_species'], [100, 148], 1, seed=7)
+        self.assertEquals(isnan(values[:, 0, :, 0]).tolist(),
+            [[False]*9, [sample_id in ('PC.481', 'PC.355')
+            for sample_id in sample_ids]])
+
+        # the same seed gives the same values
+        self.assertEqual(alpha_rarefaction_array(self.biom_object,
+            ['observed_species'], [100, 148], 1, seed=7)[0][0], values[0])
+
     def test_generate_alpha_rarefaction_data_from_point_in_omega(self):
         """check the multiple rarefactions are being created correctly"""
 
-        # just one iteration
-        output = generate_alpha_rarefaction_data_from_point_in_omega(
-            self.biom_object, self.metrics, 140, 1, self.tree_object)
-        self.assertEquals(output, expected_alpha_rarefactions_a)
-
-        # multiple iterations
-        output = generate_alpha_rarefaction_data_from_point_in_omega(
-            self.biom_object, self.metrics, 140, 3, self.tree_object)
-        self.assertEquals(output, expected_alpha_rarefactions_b)
+        header = ['', 'sequences per sample', 'iteration'] +\
+            list(self.biom_object.SampleIds)
+        depths = [35, 61, 87, 113, 139]
+        for iterations in [1, 3]:
+            output = generate_alpha_rarefaction_data_from_point_in_omega(
+                self.biom_object, self.metrics, 140, iterations,
+                self.tree_object, seed=3)
+            self.assertEquals(sorted(output.keys()), ['PD_whole_tree',
+                'chao1', 'observed_species'])
+            for metric, (columns, empty, labels, rows) in output.iteritems():
+                self.assertEquals(columns, header)
+                self.assertEquals(empty, [])
+                self.assertEquals(labels, ['alpha_rare_%d_%d' % (depth, i)
+                    for depth in depths for i in range(iterations)])
+                self.assertEquals([row[:2] for row in rows], [[depth, i]
+                    for depth in depths for i in range(iterations)])
+                self.assertEquals(set(map(len, rows)), set([len(header) - 1]))
+
+            # the depths of an iteration are nested, the OTUs of a depth
+            # are observed in the next ones
+            rows = output['observed_species'][3]
+            for smaller, larger in zip(rows, rows[iterations:]):
+                self.assertTrue(all([a <= b for a, b in zip(smaller[2:],
+                    larger[2:])]))
+
+            # the same seed gives the same values
+            self.assertEquals(output,
+                generate_alpha_rarefaction_data_from_point_in_omega(
+                self.biom_object, self.metrics, 140, iterations,
+                self.tree_object, seed=3))
 
 metrics_data_a = {\
 'PD_whole_tree': [\
@@ -367,98 +431,6 @@ PC.634\t64.0\t146.0\t0.80022"""
 input_biom_table = """{"rows": [{"id": "0", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "1", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "2", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "3", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "4", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "5", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "6", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "7", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "8", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "9", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "10", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "11", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "12", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "13", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "14", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "15", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Streptococcaceae", "Streptococcus"]}}, {"id": "16", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "17", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "18", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "19", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "20", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "21", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "22", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "23", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "24", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "25", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "26", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "27", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "28", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "29", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "30", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "31", "metadata": {"taxonomy": ["Bacteria", "TM7", "TM7_genera_incertae_sedis"]}}, {"id": "32", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "33", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "34", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "35", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria"]}}, {"id": "36", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "37", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "38", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "39", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Olsenella"]}}, {"id": "40", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "41", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "42", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "43", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "44", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "45", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "46", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "47", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "48", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "49", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "50", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "51", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "52", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "53", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "54", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "55", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "56", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "57", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "58", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "59", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "60", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "61", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "62", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "63", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "64", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "65", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "66", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "67", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "68", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Dorea"]}}, {"id": "69", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "70", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "71", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "72", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "73", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "74", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "75", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "76", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Coprobacillus"]}}, {"id": "77", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "78", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "79", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "80", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "81", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "82", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "83", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "84", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "85", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "86", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "87", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "88", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "89", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "90", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "91", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "92", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "93", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "94", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "95", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "96", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "97", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "98", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "99", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "100", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "101", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "102", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "103", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "104", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "105", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "106", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "107", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "108", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "109", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "110", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "111", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "112", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "113", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "114", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "115", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "116", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "117", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "118", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "119", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "120", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "121", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "122", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "123", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "124", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Marvinbryantia"]}}, {"id": "125", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "126", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "127", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "128", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "129", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "130", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "131", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "132", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "133", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "134", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "135", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "136", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "137", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "138", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "139", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "140", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "141", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "142", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "143", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "144", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "145", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "146", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "147", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "148", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "149", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "150", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "151", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "152", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "153", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "154", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "155", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "156", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "157", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "158", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "159", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "160", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "161", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "162", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "163", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "164", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "165", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "166", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "167", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "168", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "169", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "170", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "171", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "172", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "173", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "174", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "175", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "176", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "177", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "178", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "179", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "180", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "181", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "182", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "183", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "184", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "185", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "186", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "187", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "188", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "189", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "190", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "191", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "192", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "193", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "194", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "195", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Acetanaerobacterium"]}}, {"id": "196", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "197", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "198", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "199", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "200", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "201", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Butyricimonas"]}}, {"id": "202", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "203", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "204", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "205", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "206", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "207", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "208", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "209", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "210", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "211", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "212", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "213", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "214", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "215", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "216", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "217", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "218", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "219", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "220", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "221", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "222", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "223", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "224", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "225", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "226", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "227", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "228", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "229", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "230", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "231", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "232", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "233", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "234", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "235", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "236", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "237", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "238", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "239", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "240", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "241", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "242", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "243", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "244", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "245", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "246", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "247", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "248", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "249", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "250", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "251", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "252", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "253", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "254", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "255", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "256", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "257", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "258", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "259", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "260", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Prevotellaceae"]}}, {"id": "261", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "262", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "263", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "264", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "265", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "266", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales"]}}, {"id": "267", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria"]}}, {"id": "268", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "269", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "270", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Ruminococcus"]}}, {"id": "271", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "272", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "273", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "274", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Asaccharobacter"]}}, {"id": "275", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "276", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "277", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "278", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "279", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "280", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "281", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "282", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "283", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "284", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "285", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "286", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "287", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "288", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "289", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "290", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "291", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "292", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "293", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "294", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "295", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "296", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "297", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "298", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "299", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "300", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "301", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "302", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "303", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "304", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Epsilonproteobacteria", "Campylobacterales", "Helicobacteraceae", "Helicobacter"]}}, {"id": "305", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "306", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "307", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "308", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "309", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "310", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "311", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "312", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Carnobacteriaceae"]}}, {"id": "313", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "314", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "315", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "316", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "317", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "318", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "319", "metadata": {"taxonomy": ["Bacteria", "Verrucomicrobia", "Verrucomicrobiae", "Verrucomicrobiales", "Verrucomicrobiaceae", "Akkermansia"]}}, {"id": "320", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "321", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "322", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "323", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "324", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "325", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "326", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "327", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "328", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "329", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "330", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "331", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "332", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "333", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "334", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "335", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "336", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "337", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "338", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "339", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "340", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "341", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "342", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "343", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "344", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "345", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "346", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "347", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "348", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "349", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "350", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "351", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "352", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "353", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "354", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "355", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "356", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII", "Anaerovorax"]}}, {"id": "357", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII"]}}, {"id": "358", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "359", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "360", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "361", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "362", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Clostridiaceae", "Clostridium"]}}, {"id": "363", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "364", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "365", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "366", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "367", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "368", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "369", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "370", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "371", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "372", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "373", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "374", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "375", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "376", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "377", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "378", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "379", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "380", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "381", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "382", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "383", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "384", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "385", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "386", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "387", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "388", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "389", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "390", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "391", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "392", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "393", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "394", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "395", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "396", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "397", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "398", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "399", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "400", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "401", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "402", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "403", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "404", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "405", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "406", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "407", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "408", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "409", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "410", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Turicibacter"]}}, {"id": "411", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "412", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "413", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "414", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "415", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "416", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "417", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "418", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}], "format": "Biological Observation Matrix 1.0.0", "data": [[0, 0, 1], [1, 1, 1], [2, 0, 1], [3, 2, 1], [4, 3, 1], [5, 0, 1], [5, 1, 1], [6, 4, 1], [7, 3, 1], [8, 0, 1], [8, 1, 1], [8, 2, 1], [8, 4, 1], [9, 5, 1], [10, 3, 1], [11, 1, 1], [11, 3, 1], [12, 6, 1], [13, 4, 2], [13, 6, 1], [14, 1, 1], [14, 2, 1], [15, 7, 1], [16, 1, 1], [17, 8, 1], [18, 8, 1], [19, 2, 1], [20, 8, 1], [21, 3, 1], [21, 4, 1], [22, 7, 1], [23, 7, 1], [24, 1, 2], [25, 3, 1], [26, 1, 1], [27, 7, 2], [28, 0, 1], [29, 8, 1], [30, 1, 1], [31, 8, 2], [32, 1, 1], [32, 3, 1], [33, 8, 1], [34, 1, 1], [34, 2, 1], [35, 1, 1], [36, 7, 1], [37, 3, 3], [38, 7, 1], [39, 7, 2], [40, 6, 1], [41, 3, 1], [41, 7, 2], [42, 3, 1], [42, 4, 1], [43, 7, 1], [44, 5, 1], [45, 4, 16], [45, 5, 12], [46, 0, 6], [46, 1, 2], [46, 7, 3], [46, 8, 5], [47, 3, 1], [48, 7, 1], [49, 5, 1], [50, 4, 1], [51, 5, 1], [52, 3, 1], [53, 1, 1], [53, 3, 2], [53, 6, 2], [54, 0, 37], [54, 1, 10], [54, 3, 1], [54, 8, 4], [55, 5, 1], [56, 0, 5], [56, 1, 4], [56, 2, 1], [56, 3, 2], [56, 4, 1], [56, 5, 1], [56, 6, 3], [56, 7, 9], [56, 8, 2], [57, 5, 1], [58, 0, 1], [59, 0, 1], [59, 1, 1], [59, 2, 10], [59, 3, 2], [59, 4, 2], [59, 5, 24], [59, 6, 1], [60, 3, 1], [61, 2, 1], [62, 7, 1], [63, 2, 1], [64, 6, 1], [65, 7, 1], [66, 1, 1], [67, 3, 1], [68, 3, 1], [69, 6, 1], [70, 7, 1], [71, 6, 1], [72, 0, 2], [72, 1, 3], [72, 8, 2], [73, 0, 1], [73, 8, 2], [74, 0, 1], [74, 1, 4], [74, 5, 2], [74, 7, 2], [74, 8, 1], [75, 7, 5], [76, 4, 1], [77, 0, 2], [77, 1, 2], [78, 1, 1], [79, 4, 1], [80, 2, 1], [81, 2, 1], [82, 0, 19], [82, 1, 2], [82, 3, 1], [82, 8, 1], [83, 7, 1], [84, 2, 1], [85, 3, 1], [86, 3, 1], [87, 3, 1], [88, 5, 1], [89, 1, 1], [90, 0, 1], [90, 1, 2], [90, 2, 4], [90, 5, 1], [90, 6, 4], [90, 7, 2], [91, 2, 1], [92, 2, 1], [93, 2, 2], [93, 3, 6], [93, 4, 1], [93, 6, 4], [94, 2, 1], [95, 4, 2], [96, 0, 1], [97, 8, 1], [98, 7, 1], [99, 1, 1], [99, 3, 1], [99, 8, 3], [100, 3, 1], [101, 7, 1], [102, 0, 1], [103, 0, 1], [104, 3, 1], [104, 5, 4], [105, 6, 1], [106, 3, 1], [107, 6, 1], [108, 8, 5], [109, 8, 1], [110, 4, 1], [111, 7, 1], [112, 4, 1], [113, 5, 1], [114, 4, 1], [115, 0, 1], [116, 2, 1], [116, 3, 1], [117, 3, 1], [117, 4, 1], [117, 7, 1], [118, 3, 1], [119, 2, 1], [120, 1, 1], [120, 8, 2], [121, 0, 1], [121, 6, 1], [122, 6, 1], [123, 2, 1], [123, 4, 1], [123, 6, 3], [124, 0, 1], [124, 6, 1], [125, 4, 1], [126, 1, 1], [126, 2, 1], [127, 7, 1], [128, 4, 1], [129, 2, 2], [129, 4, 2], [129, 6, 2], [130, 2, 1], [130, 5, 1], [130, 6, 1], [131, 5, 1], [132, 5, 1], [133, 4, 1], [134, 1, 1], [135, 2, 1], [135, 4, 1], [136, 1, 1], [136, 4, 1], [137, 8, 1], [138, 8, 1], [139, 4, 1], [140, 7, 1], [141, 3, 1], [142, 1, 1], [143, 7, 1], [144, 2, 1], [145, 1, 1], [146, 1, 1], [146, 3, 6], [147, 7, 1], [148, 1, 2], [148, 3, 2], [148, 4, 4], [148, 6, 9], [149, 0, 1], [150, 1, 1], [151, 0, 2], [151, 1, 5], [151, 3, 1], [151, 8, 1], [152, 2, 1], [153, 5, 1], [154, 0, 1], [155, 8, 1], [156, 1, 1], [156, 3, 1], [157, 8, 1], [158, 1, 1], [159, 7, 1], [160, 7, 2], [161, 6, 2], [162, 6, 1], [163, 0, 1], [163, 1, 1], [164, 0, 1], [164, 1, 1], [165, 2, 14], [165, 3, 1], [165, 4, 14], [165, 6, 1], [166, 2, 4], [166, 4, 6], [166, 5, 2], [167, 1, 1], [168, 5, 1], [169, 2, 8], [169, 4, 2], [169, 5, 1], [169, 6, 3], [170, 5, 1], [171, 7, 1], [172, 1, 1], [173, 0, 1], [174, 5, 1], [175, 0, 1], [175, 8, 1], [176, 8, 1], [177, 4, 1], [177, 5, 10], [178, 8, 2], [179, 7, 1], [180, 3, 1], [181, 5, 9], [181, 7, 1], [182, 0, 2], [182, 5, 4], [183, 3, 1], [184, 3, 1], [185, 7, 2], [186, 1, 1], [187, 6, 1], [188, 0, 1], [188, 1, 1], [188, 3, 1], [188, 7, 1], [189, 5, 1], [190, 1, 1], [191, 4, 1], [191, 5, 1], [192, 2, 1], [193, 2, 1], [194, 2, 1], [195, 2, 2], [196, 2, 1], [197, 2, 1], [198, 2, 1], [198, 6, 2], [199, 7, 1], [200, 7, 1], [201, 1, 3], [201, 8, 1], [202, 3, 5], [202, 4, 2], [202, 6, 1], [202, 7, 1], [203, 2, 10], [203, 4, 29], [203, 6, 1], [204, 7, 1], [205, 1, 1], [206, 2, 1], [207, 0, 1], [208, 0, 1], [209, 2, 2], [210, 3, 1], [211, 8, 13], [212, 3, 2], [213, 8, 1], [214, 4, 1], [214, 7, 4], [215, 0, 1], [216, 2, 1], [217, 1, 5], [217, 5, 2], [218, 1, 1], [218, 7, 2], [219, 1, 1], [219, 2, 2], [220, 6, 1], [221, 3, 4], [222, 3, 1], [223, 1, 1], [223, 2, 1], [223, 7, 2], [224, 0, 1], [225, 3, 1], [225, 4, 2], [225, 6, 2], [226, 2, 1], [226, 4, 1], [227, 2, 1], [227, 3, 1], [227, 4, 1], [228, 3, 1], [228, 4, 1], [228, 6, 4], [229, 4, 3], [230, 7, 1], [231, 7, 2], [232, 3, 5], [232, 4, 1], [232, 5, 17], [232, 7, 20], [233, 1, 1], [234, 0, 1], [235, 1, 1], [235, 8, 2], [236, 3, 1], [236, 4, 1], [237, 7, 1], [238, 1, 1], [239, 4, 1], [240, 3, 1], [241, 4, 1], [242, 8, 1], [243, 1, 1], [244, 4, 1], [245, 7, 1], [246, 0, 2], [246, 1, 2], [246, 7, 7], [247, 1, 1], [247, 7, 1], [248, 7, 1], [249, 7, 1], [249, 8, 1], [250, 5, 1], [251, 2, 1], [251, 4, 1], [252, 5, 1], [253, 5, 1], [254, 3, 1], [255, 1, 1], [256, 3, 2], [257, 3, 1], [257, 7, 1], [258, 1, 1], [259, 2, 1], [260, 1, 1], [261, 3, 1], [262, 4, 1], [263, 0, 1], [264, 2, 1], [265, 0, 1], [265, 8, 1], [266, 2, 1], [267, 7, 1], [268, 5, 1], [268, 6, 1], [269, 0, 1], [270, 1, 2], [270, 4, 1], [271, 2, 1], [271, 4, 1], [271, 6, 1], [272, 4, 1], [272, 6, 1], [273, 0, 1], [273, 2, 3], [273, 3, 2], [273, 4, 1], [273, 6, 5], [274, 0, 1], [275, 2, 2], [276, 7, 1], [277, 2, 1], [278, 1, 3], [278, 7, 6], [279, 3, 1], [280, 1, 1], [281, 6, 1], [282, 5, 1], [283, 8, 5], [284, 6, 1], [284, 8, 1], [285, 8, 1], [286, 5, 1], [287, 3, 1], [288, 2, 2], [288, 4, 1], [289, 6, 1], [290, 3, 1], [291, 7, 1], [292, 0, 2], [293, 1, 1], [294, 7, 1], [295, 3, 1], [296, 1, 1], [297, 1, 1], [298, 1, 1], [298, 7, 1], [299, 6, 1], [300, 3, 1], [301, 2, 1], [302, 7, 1], [303, 2, 2], [304, 5, 5], [304, 7, 2], [305, 7, 1], [306, 2, 2], [306, 4, 1], [306, 7, 6], [307, 1, 1], [308, 7, 1], [309, 6, 1], [310, 3, 2], [311, 1, 1], [312, 0, 1], [313, 1, 1], [314, 2, 5], [314, 3, 13], [314, 4, 11], [314, 5, 2], [314, 6, 12], [315, 0, 1], [315, 1, 1], [315, 8, 1], [316, 8, 1], [317, 8, 1], [318, 2, 2], [318, 3, 1], [318, 4, 2], [319, 8, 1], [320, 3, 1], [321, 2, 1], [322, 7, 1], [323, 2, 1], [324, 0, 1], [325, 0, 1], [326, 2, 1], [326, 4, 1], [327, 7, 1], [328, 7, 1], [329, 4, 1], [330, 7, 1], [331, 6, 1], [332, 2, 1], [332, 4, 1], [333, 2, 1], [334, 7, 1], [335, 2, 2], [336, 7, 1], [337, 1, 1], [338, 1, 1], [339, 5, 2], [340, 1, 1], [341, 0, 1], [342, 0, 3], [342, 3, 1], [342, 5, 1], [342, 6, 1], [343, 0, 2], [343, 1, 1], [343, 2, 2], [344, 1, 1], [345, 0, 1], [346, 8, 1], [347, 0, 3], [347, 4, 1], [347, 5, 2], [347, 8, 2], [348, 7, 1], [349, 5, 3], [350, 1, 2], [350, 3, 7], [350, 6, 2], [351, 3, 1], [352, 3, 1], [353, 5, 1], [354, 8, 1], [355, 3, 2], [355, 4, 1], [355, 5, 4], [355, 6, 1], [356, 8, 1], [357, 7, 1], [357, 8, 1], [358, 1, 1], [359, 5, 2], [359, 8, 1], [360, 1, 1], [361, 1, 1], [362, 6, 1], [362, 8, 3], [363, 1, 1], [364, 8, 1], [365, 8, 1], [366, 6, 1], [367, 6, 1], [368, 6, 1], [369, 7, 1], [370, 1, 5], [370, 2, 2], [370, 3, 4], [370, 4, 1], [370, 6, 2], [370, 7, 5], [370, 8, 1], [371, 1, 1], [372, 3, 2], [373, 1, 1], [374, 1, 1], [375, 7, 1], [376, 8, 1], [377, 4, 1], [378, 0, 3], [378, 1, 5], [378, 7, 5], [378, 8, 9], [379, 0, 4], [379, 1, 4], [379, 3, 1], [379, 4, 2], [379, 6, 18], [379, 8, 21], [380, 2, 1], [381, 2, 1], [382, 3, 1], [383, 6, 2], [383, 7, 1], [384, 2, 1], [385, 2, 1], [385, 4, 1], [386, 2, 1], [387, 1, 1], [387, 2, 1], [388, 2, 1], [389, 2, 1], [390, 2, 1], [391, 8, 1], [392, 2, 2], [392, 5, 2], [392, 6, 20], [392, 8, 3], [393, 0, 1], [393, 2, 1], [394, 2, 1], [395, 3, 1], [396, 2, 1], [396, 6, 2], [397, 0, 3], [397, 1, 1], [397, 2, 2], [397, 5, 9], [397, 6, 1], [397, 7, 1], [397, 8, 1], [398, 7, 1], [399, 8, 2], [400, 0, 4], [400, 2, 3], [400, 3, 1], [400, 5, 4], [400, 6, 2], [400, 8, 5], [401, 8, 1], [402, 6, 1], [403, 4, 1], [404, 6, 1], [405, 3, 1], [406, 0, 1], [406, 1, 1], [406, 2, 1], [406, 3, 2], [406, 6, 2], [406, 8, 1], [407, 8, 1], [408, 8, 4], [409, 0, 1], [410, 3, 9], [410, 8, 3], [411, 0, 1], [411, 6, 1], [412, 7, 1], [413, 0, 1], [414, 0, 2], [414, 1, 10], [414, 8, 8], [415, 6, 1], [416, 2, 1], [416, 3, 3], [417, 6, 1], [418, 0, 1]], "columns": [{"id": "PC.636", "metadata": null}, {"id": "PC.635", "metadata": null}, {"id": "PC.356", "metadata": null}, {"id": "PC.481", "metadata": null}, {"id": "PC.354", "metadata": null}, {"id": "PC.593", "metadata": null}, {"id": "PC.355", "metadata": null}, {"id": "PC.607", "metadata": null}, {"id": "PC.634", "metadata": null}], "generated_by": "", "matrix_type": "sparse", "shape": [419, 9], "format_url": "http://biom-format.org", "date": "2012-10-01T12:38:04.204723", "type": "OTU table", "id": null, "matrix_element_type": "int"}"""
 gg_tree_string = ("""(((237:0.30436,((((46:0.01913,(((79:0.04725,(204:0.01294,134:0.00579)0.887.14:0.02834)0.931.9:0.03432,((138:0.02089,(150:0.02083,139:0.02056)0.876.18:0.00461)0.418.5:0.02505,((128:0.01404,86:0.00925)0.948.14:0.00668,124:0.02119)0.980.16:0.02248)0.892.14:0.07211)1.000.427:0.01797,227:0.01179)0.994.25:0.07016)1.000.431:0.05034,(245:0.08204,249:0.10427)0.999.73:0.15503)0.674.3:0.00989,(((403:0.04732,361:0.06429)1.000.280:0.09824,((328:0.04327,260:0.07672)0.042.2:0.00254,(336:0.06865,299:0.071)0.931.4:0.02734)0.456.3:0.07714)0.996.25:0.09989,14:0.14785)0.974.16:0.03468)0.978.18:0.01572,20:0.0865)0.734.6:0.01931)0.858.4:0.01124,51:0.27116)1.000.467:0.12261);""")
 
-expected_biom_object_a = """{"rows": [{"id": "0", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "1", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "2", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "3", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "4", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "5", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "6", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "7", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "8", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "9", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "10", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "11", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "12", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "13", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "14", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "15", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Streptococcaceae", "Streptococcus"]}}, {"id": "16", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "17", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "18", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "19", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "20", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "21", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "22", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "23", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "24", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "25", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "26", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "27", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "28", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "29", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "30", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "31", "metadata": {"taxonomy": ["Bacteria", "TM7", "TM7_genera_incertae_sedis"]}}, {"id": "32", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "33", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "34", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "35", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria"]}}, {"id": "36", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "37", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "38", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "39", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Olsenella"]}}, {"id": "40", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "41", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "42", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "43", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "44", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "45", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "46", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "47", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "48", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "49", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "50", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "51", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "52", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "53", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "54", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "55", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "56", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "57", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "58", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "59", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "60", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "61", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "62", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "63", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "64", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "65", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "66", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "67", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "68", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Dorea"]}}, {"id": "69", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "70", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "71", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "72", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "73", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "74", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "75", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "76", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Coprobacillus"]}}, {"id": "77", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "78", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "79", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "80", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "81", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "82", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "83", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "84", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "85", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "86", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "87", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "88", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "89", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "90", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "91", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "92", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "93", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "94", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "95", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "96", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "97", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "98", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "99", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "100", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "101", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "102", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "103", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "104", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "105", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "106", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "107", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "108", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "109", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "110", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "111", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "112", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "113", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "114", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "115", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "116", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "117", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "118", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "119", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "120", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "121", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "122", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "123", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "124", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Marvinbryantia"]}}, {"id": "125", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "126", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "127", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "128", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "129", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "130", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "131", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "132", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "133", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "134", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "135", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "136", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "137", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "138", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "139", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "140", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "141", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "142", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "143", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "144", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "145", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "146", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "147", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "148", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "149", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "150", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "151", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "152", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "153", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "154", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "155", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "156", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "157", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "158", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "159", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "160", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "161", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "162", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "163", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "164", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "165", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "166", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "167", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "168", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "169", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "170", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "171", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "172", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "173", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "174", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "175", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "176", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "177", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "178", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "179", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "180", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "181", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "182", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "183", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "184", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "185", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "186", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "187", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "188", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "189", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "190", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "191", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "192", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "193", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "194", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "195", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Acetanaerobacterium"]}}, {"id": "196", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "197", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "198", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "199", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "200", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "201", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Butyricimonas"]}}, {"id": "202", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "203", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "204", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "205", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "206", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "207", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "208", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "209", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "210", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "211", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "212", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "213", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "214", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "215", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "216", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "217", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "218", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "219", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "220", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "221", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "222", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "223", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "224", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "225", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "226", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "227", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "228", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "229", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "230", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "231", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "232", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "233", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "234", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "235", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "236", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "237", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "238", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "239", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "240", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "241", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "242", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "243", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "244", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "245", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "246", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "247", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "248", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "249", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "250", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "251", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "252", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "253", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "254", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "255", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "256", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "257", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "258", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "259", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "260", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Prevotellaceae"]}}, {"id": "261", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "262", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "263", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "264", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "265", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "266", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales"]}}, {"id": "267", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria"]}}, {"id": "268", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "269", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "270", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Ruminococcus"]}}, {"id": "271", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "272", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "273", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "274", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Asaccharobacter"]}}, {"id": "275", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "276", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "277", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "278", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "279", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "280", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "281", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "282", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "283", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "284", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "285", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "286", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "287", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "288", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "289", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "290", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "291", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "292", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "293", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "294", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "295", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "296", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "297", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "298", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "299", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "300", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "301", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "302", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "303", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "304", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Epsilonproteobacteria", "Campylobacterales", "Helicobacteraceae", "Helicobacter"]}}, {"id": "305", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "306", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "307", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "308", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "309", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "310", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "311", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "312", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Carnobacteriaceae"]}}, {"id": "313", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "314", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "315", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "316", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "317", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "318", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "319", "metadata": {"taxonomy": ["Bacteria", "Verrucomicrobia", "Verrucomicrobiae", "Verrucomicrobiales", "Verrucomicrobiaceae", "Akkermansia"]}}, {"id": "320", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "321", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "322", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "323", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "324", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "325", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "326", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "327", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "328", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "329", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "330", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "331", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "332", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "333", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "334", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "335", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "336", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "337", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "338", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "339", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "340", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "341", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "342", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "343", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "344", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "345", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "346", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "347", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "348", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "349", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "350", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "351", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "352", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "353", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "354", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "355", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "356", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII", "Anaerovorax"]}}, {"id": "357", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII"]}}, {"id": "358", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "359", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "360", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "361", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "362", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Clostridiaceae", "Clostridium"]}}, {"id": "363", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "364", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "365", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "366", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "367", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "368", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "369", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "370", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "371", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "372", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "373", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "374", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "375", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "376", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "377", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "378", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "379", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "380", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "381", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "382", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "383", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "384", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "385", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "386", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "387", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "388", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "389", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "390", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "391", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "392", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "393", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "394", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "395", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "396", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "397", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "398", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "399", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "400", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "401", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "402", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "403", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "404", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "405", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "406", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "407", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "408", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "409", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "410", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Turicibacter"]}}, {"id": "411", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "412", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "413", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "414", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "415", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "416", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "417", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "418", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}], "format": "Biological Observation Matrix 1.0.0", "data": [[0, 0, 1.0], [5, 0, 1.0], [11, 3, 1.0], [12, 6, 1.0], [13, 4, 2.0], [14, 1, 1.0], [16, 1, 1.0], [21, 3, 1.0], [23, 7, 1.0], [24, 1, 1.0], [27, 7, 1.0], [31, 8, 1.0], [33, 8, 1.0], [35, 1, 1.0], [37, 3, 2.0], [38, 7, 1.0], [39, 7, 1.0], [40, 6, 1.0], [42, 3, 1.0], [42, 4, 1.0], [44, 5, 1.0], [45, 4, 4.0], [45, 5, 2.0], [46, 0, 1.0], [46, 8, 1.0], [48, 7, 1.0], [51, 5, 1.0], [53, 3, 1.0], [53, 6, 2.0], [54, 0, 11.0], [54, 1, 4.0], [54, 3, 1.0], [54, 8, 1.0], [55, 5, 1.0], [56, 0, 1.0], [56, 1, 2.0], [56, 2, 1.0], [56, 3, 1.0], [56, 6, 1.0], [56, 7, 3.0], [58, 0, 1.0], [59, 2, 3.0], [59, 3, 1.0], [59, 4, 1.0], [59, 5, 9.0], [59, 6, 1.0], [61, 2, 1.0], [68, 3, 1.0], [71, 6, 1.0], [72, 0, 2.0], [73, 0, 1.0], [73, 8, 2.0], [74, 0, 1.0], [74, 1, 1.0], [74, 5, 1.0], [75, 7, 4.0], [77, 1, 1.0], [81, 2, 1.0], [82, 0, 2.0], [82, 1, 1.0], [82, 3, 1.0], [83, 7, 1.0], [86, 3, 1.0], [90, 0, 1.0], [90, 1, 1.0], [90, 2, 2.0], [90, 6, 2.0], [90, 7, 1.0], [93, 3, 2.0], [93, 4, 1.0], [94, 2, 1.0], [99, 8, 1.0], [101, 7, 1.0], [104, 3, 1.0], [108, 8, 2.0], [110, 4, 1.0], [114, 4, 1.0], [117, 4, 1.0], [117, 7, 1.0], [120, 8, 2.0], [123, 6, 2.0], [125, 4, 1.0], [126, 1, 1.0], [126, 2, 1.0], [129, 2, 1.0], [129, 4, 1.0], [130, 6, 1.0], [142, 1, 1.0], [146, 1, 1.0], [146, 3, 1.0], [148, 1, 1.0], [148, 3, 1.0], [148, 4, 3.0], [148, 6, 3.0], [151, 0, 1.0], [151, 1, 2.0], [151, 8, 1.0], [152, 2, 1.0], [154, 0, 1.0], [160, 7, 1.0], [163, 1, 1.0], [165, 2, 2.0], [165, 4, 4.0], [165, 6, 1.0], [166, 2, 1.0], [166, 4, 1.0], [166, 5, 1.0], [167, 1, 1.0], [168, 5, 1.0], [169, 2, 5.0], [170, 5, 1.0], [172, 1, 1.0], [176, 8, 1.0], [177, 5, 3.0], [178, 8, 1.0], [181, 5, 3.0], [181, 7, 1.0], [182, 0, 2.0], [182, 5, 2.0], [183, 3, 1.0], [184, 3, 1.0], [194, 2, 1.0], [196, 2, 1.0], [198, 6, 1.0], [199, 7, 1.0], [202, 3, 1.0], [202, 4, 1.0], [203, 2, 1.0], [203, 4, 8.0], [203, 6, 1.0], [205, 1, 1.0], [210, 3, 1.0], [211, 8, 6.0], [215, 0, 1.0], [217, 5, 1.0], [219, 2, 2.0], [220, 6, 1.0], [221, 3, 1.0], [223, 7, 1.0], [225, 4, 1.0], [225, 6, 1.0], [226, 2, 1.0], [228, 3, 1.0], [228, 4, 1.0], [228, 6, 2.0], [230, 7, 1.0], [232, 5, 7.0], [232, 7, 2.0], [233, 1, 1.0], [235, 8, 1.0], [236, 3, 1.0], [239, 4, 1.0], [243, 1, 1.0], [246, 7, 3.0], [249, 7, 1.0], [249, 8, 1.0], [251, 2, 1.0], [251, 4, 1.0], [265, 0, 1.0], [265, 8, 1.0], [271, 6, 1.0], [273, 4, 1.0], [273, 6, 1.0], [274, 0, 1.0], [276, 7, 1.0], [278, 7, 3.0], [280, 1, 1.0], [281, 6, 1.0], [283, 8, 2.0], [285, 8, 1.0], [292, 0, 2.0], [301, 2, 1.0], [303, 2, 1.0], [306, 7, 3.0], [308, 7, 1.0], [309, 6, 1.0], [314, 3, 3.0], [314, 4, 2.0], [314, 5, 1.0], [314, 6, 3.0], [317, 8, 1.0], [318, 3, 1.0], [322, 7, 1.0], [332, 4, 1.0], [333, 2, 1.0], [341, 0, 1.0], [343, 0, 1.0], [343, 1, 1.0], [343, 2, 2.0], [344, 1, 1.0], [347, 5, 2.0], [349, 5, 1.0], [350, 1, 1.0], [350, 3, 2.0], [350, 6, 1.0], [351, 3, 1.0], [354, 8, 1.0], [358, 1, 1.0], [359, 5, 1.0], [362, 8, 2.0], [363, 1, 1.0], [370, 1, 2.0], [370, 2, 2.0], [370, 3, 1.0], [370, 6, 1.0], [370, 7, 1.0], [372, 3, 1.0], [374, 1, 1.0], [375, 7, 1.0], [378, 1, 1.0], [378, 7, 1.0], [378, 8, 1.0], [379, 0, 1.0], [379, 4, 1.0], [379, 6, 4.0], [379, 8, 3.0], [383, 6, 1.0], [387, 2, 1.0], [392, 2, 1.0], [392, 6, 3.0], [393, 2, 1.0], [397, 0, 2.0], [397, 1, 1.0], [397, 2, 1.0], [397, 5, 1.0], [397, 8, 1.0], [400, 0, 1.0], [400, 2, 2.0], [400, 6, 1.0], [400, 8, 2.0], [406, 1, 1.0], [406, 3, 1.0], [408, 8, 1.0], [410, 3, 5.0], [410, 8, 1.0], [411, 0, 1.0], [412, 7, 1.0], [414, 1, 2.0], [414, 8, 1.0], [416, 3, 1.0], [418, 0, 1.0]], "columns": [{"id": "PC.636", "metadata": null}, {"id": "PC.635", "metadata": null}, {"id": "PC.356", "metadata": null}, {"id": "PC.481", "metadata": null}, {"id": "PC.354", "metadata": null}, {"id": "PC.593", "metadata": null}, {"id": "PC.355", "metadata": null}, {"id": "PC.607", "metadata": null}, {"id": "PC.634", "metadata": null}], "generated_by": "", "matrix_type": "sparse", "shape": [419, 9], "format_url": "http://biom-format.org", "date": "2012-10-30T17:33:56.904149", "type": "OTU table", "id": null, "matrix_element_type": "float"}"""
-expected_biom_object_b = """{"rows": [{"id": "0", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "1", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "2", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "3", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "4", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "5", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "6", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "7", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "8", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "9", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "10", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "11", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "12", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "13", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "14", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "15", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Streptococcaceae", "Streptococcus"]}}, {"id": "16", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "17", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "18", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "19", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "20", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "21", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "22", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "23", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "24", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "25", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "26", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "27", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "28", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "29", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "30", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "31", "metadata": {"taxonomy": ["Bacteria", "TM7", "TM7_genera_incertae_sedis"]}}, {"id": "32", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "33", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "34", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "35", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria"]}}, {"id": "36", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "37", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "38", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "39", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Olsenella"]}}, {"id": "40", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "41", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "42", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "43", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "44", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "45", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "46", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "47", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "48", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "49", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "50", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "51", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "52", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "53", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "54", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "55", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "56", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "57", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "58", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "59", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "60", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "61", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "62", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "63", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "64", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "65", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "66", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "67", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "68", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Dorea"]}}, {"id": "69", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "70", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "71", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "72", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "73", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "74", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "75", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "76", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Coprobacillus"]}}, {"id": "77", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "78", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "79", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "80", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "81", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "82", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "83", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "84", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "85", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "86", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "87", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "88", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "89", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "90", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "91", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "92", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "93", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "94", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "95", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "96", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "97", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "98", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "99", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "100", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "101", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "102", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "103", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "104", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "105", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "106", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "107", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "108", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "109", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "110", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "111", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "112", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "113", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "114", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "115", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "116", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "117", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "118", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "119", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "120", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "121", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "122", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "123", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "124", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Marvinbryantia"]}}, {"id": "125", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "126", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "127", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "128", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "129", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "130", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "131", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "132", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "133", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "134", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "135", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "136", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "137", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "138", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "139", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "140", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "141", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "142", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "143", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "144", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "145", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "146", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "147", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "148", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "149", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "150", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "151", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "152", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "153", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "154", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "155", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "156", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "157", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "158", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "159", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "160", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "161", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "162", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "163", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "164", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "165", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "166", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "167", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "168", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "169", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "170", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "171", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "172", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "173", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "174", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "175", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "176", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "177", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "178", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "179", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "180", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "181", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "182", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "183", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "184", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "185", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "186", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "187", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "188", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "189", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "190", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "191", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "192", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "193", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "194", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "195", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Acetanaerobacterium"]}}, {"id": "196", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "197", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "198", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "199", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "200", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "201", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Butyricimonas"]}}, {"id": "202", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "203", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "204", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "205", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "206", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "207", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "208", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "209", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "210", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "211", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "212", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "213", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "214", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "215", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "216", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "217", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "218", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "219", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "220", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "221", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "222", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "223", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "224", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "225", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "226", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "227", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "228", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "229", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "230", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "231", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "232", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "233", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "234", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "235", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "236", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "237", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "238", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "239", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "240", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "241", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "242", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "243", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "244", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "245", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "246", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "247", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "248", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "249", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "250", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "251", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "252", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "253", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "254", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "255", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "256", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "257", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "258", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "259", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "260", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Prevotellaceae"]}}, {"id": "261", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "262", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "263", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "264", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "265", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "266", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales"]}}, {"id": "267", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria"]}}, {"id": "268", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "269", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "270", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Ruminococcus"]}}, {"id": "271", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "272", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "273", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "274", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Asaccharobacter"]}}, {"id": "275", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "276", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "277", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "278", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "279", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "280", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "281", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "282", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "283", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "284", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "285", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "286", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "287", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "288", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "289", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "290", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "291", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "292", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "293", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "294", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "295", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "296", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "297", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "298", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "299", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "300", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "301", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "302", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "303", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "304", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Epsilonproteobacteria", "Campylobacterales", "Helicobacteraceae", "Helicobacter"]}}, {"id": "305", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "306", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "307", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "308", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "309", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "310", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "311", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "312", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Carnobacteriaceae"]}}, {"id": "313", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "314", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "315", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "316", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "317", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "318", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "319", "metadata": {"taxonomy": ["Bacteria", "Verrucomicrobia", "Verrucomicrobiae", "Verrucomicrobiales", "Verrucomicrobiaceae", "Akkermansia"]}}, {"id": "320", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "321", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "322", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "323", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "324", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "325", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "326", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "327", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "328", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "329", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "330", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "331", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "332", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "333", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "334", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "335", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "336", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "337", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "338", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "339", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "340", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "341", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "342", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "343", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "344", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "345", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "346", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "347", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "348", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "349", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "350", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "351", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "352", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "353", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "354", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "355", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "356", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII", "Anaerovorax"]}}, {"id": "357", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII"]}}, {"id": "358", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "359", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "360", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "361", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "362", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Clostridiaceae", "Clostridium"]}}, {"id": "363", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "364", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "365", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "366", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "367", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "368", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "369", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "370", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "371", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "372", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "373", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "374", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "375", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "376", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "377", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "378", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "379", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "380", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "381", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "382", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "383", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "384", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "385", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "386", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "387", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "388", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "389", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "390", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "391", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "392", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "393", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "394", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "395", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "396", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "397", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "398", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "399", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "400", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "401", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "402", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "403", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "404", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "405", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "406", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "407", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "408", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "409", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "410", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Turicibacter"]}}, {"id": "411", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "412", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "413", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "414", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "415", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "416", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "417", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "418", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}], "format": "Biological Observation Matrix 1.0.0", "data": [[6, 4, 1.0], [8, 0, 1.0], [8, 1, 1.0], [8, 2, 1.0], [8, 4, 1.0], [9, 5, 1.0], [11, 1, 1.0], [14, 1, 1.0], [17, 8, 1.0], [18, 8, 1.0], [19, 2, 1.0], [21, 3, 1.0], [22, 7, 1.0], [24, 1, 1.0], [25, 3, 1.0], [26, 1, 1.0], [28, 0, 1.0], [30, 1, 1.0], [31, 8, 1.0], [32, 1, 1.0], [32, 3, 1.0], [35, 1, 1.0], [37, 3, 3.0], [38, 7, 1.0], [41, 7, 1.0], [42, 4, 1.0], [45, 4, 7.0], [45, 5, 5.0], [46, 0, 3.0], [46, 7, 3.0], [46, 8, 2.0], [53, 3, 1.0], [53, 6, 1.0], [54, 0, 18.0], [54, 1, 4.0], [54, 8, 1.0], [56, 0, 2.0], [56, 1, 1.0], [56, 2, 1.0], [56, 3, 1.0], [56, 5, 1.0], [56, 6, 2.0], [56, 7, 4.0], [57, 5, 1.0], [59, 1, 1.0], [59, 2, 6.0], [59, 3, 1.0], [59, 5, 10.0], [62, 7, 1.0], [64, 6, 1.0], [65, 7, 1.0], [66, 1, 1.0], [68, 3, 1.0], [72, 1, 1.0], [73, 8, 1.0], [74, 0, 1.0], [74, 1, 2.0], [74, 5, 1.0], [74, 7, 2.0], [74, 8, 1.0], [75, 7, 1.0], [77, 1, 2.0], [80, 2, 1.0], [81, 2, 1.0], [82, 0, 8.0], [82, 1, 1.0], [82, 8, 1.0], [84, 2, 1.0], [85, 3, 1.0], [90, 0, 1.0], [90, 1, 2.0], [90, 2, 3.0], [90, 6, 2.0], [93, 2, 1.0], [93, 3, 3.0], [93, 4, 1.0], [93, 6, 1.0], [95, 4, 2.0], [97, 8, 1.0], [98, 7, 1.0], [99, 1, 1.0], [99, 3, 1.0], [99, 8, 3.0], [101, 7, 1.0], [103, 0, 1.0], [104, 3, 1.0], [104, 5, 1.0], [105, 6, 1.0], [106, 3, 1.0], [107, 6, 1.0], [108, 8, 3.0], [109, 8, 1.0], [110, 4, 1.0], [112, 4, 1.0], [113, 5, 1.0], [114, 4, 1.0], [117, 3, 1.0], [118, 3, 1.0], [119, 2, 1.0], [121, 6, 1.0], [123, 6, 1.0], [124, 6, 1.0], [126, 1, 1.0], [128, 4, 1.0], [129, 2, 1.0], [129, 4, 1.0], [130, 2, 1.0], [130, 5, 1.0], [131, 5, 1.0], [133, 4, 1.0], [134, 1, 1.0], [135, 2, 1.0], [136, 4, 1.0], [140, 7, 1.0], [141, 3, 1.0], [142, 1, 1.0], [146, 3, 4.0], [148, 3, 1.0], [148, 6, 3.0], [149, 0, 1.0], [151, 0, 1.0], [151, 1, 4.0], [151, 3, 1.0], [152, 2, 1.0], [154, 0, 1.0], [156, 1, 1.0], [158, 1, 1.0], [159, 7, 1.0], [160, 7, 1.0], [161, 6, 1.0], [163, 0, 1.0], [165, 2, 2.0], [165, 3, 1.0], [165, 4, 5.0], [165, 6, 1.0], [166, 4, 2.0], [166, 5, 1.0], [167, 1, 1.0], [169, 2, 5.0], [169, 4, 1.0], [169, 6, 3.0], [170, 5, 1.0], [171, 7, 1.0], [172, 1, 1.0], [173, 0, 1.0], [177, 5, 2.0], [179, 7, 1.0], [180, 3, 1.0], [181, 5, 4.0], [182, 5, 2.0], [184, 3, 1.0], [185, 7, 1.0], [187, 6, 1.0], [188, 0, 1.0], [188, 1, 1.0], [188, 3, 1.0], [192, 2, 1.0], [194, 2, 1.0], [195, 2, 1.0], [196, 2, 1.0], [199, 7, 1.0], [201, 8, 1.0], [202, 3, 2.0], [202, 4, 1.0], [202, 6, 1.0], [202, 7, 1.0], [203, 2, 5.0], [203, 4, 9.0], [209, 2, 1.0], [211, 8, 4.0], [212, 3, 1.0], [213, 8, 1.0], [214, 4, 1.0], [214, 7, 1.0], [216, 2, 1.0], [217, 1, 3.0], [217, 5, 2.0], [219, 1, 1.0], [220, 6, 1.0], [221, 3, 2.0], [222, 3, 1.0], [223, 2, 1.0], [225, 6, 1.0], [226, 4, 1.0], [227, 2, 1.0], [227, 3, 1.0], [228, 6, 4.0], [231, 7, 1.0], [232, 5, 9.0], [232, 7, 8.0], [234, 0, 1.0], [235, 8, 1.0], [236, 3, 1.0], [237, 7, 1.0], [241, 4, 1.0], [244, 4, 1.0], [245, 7, 1.0], [246, 0, 1.0], [246, 7, 3.0], [247, 1, 1.0], [248, 7, 1.0], [251, 2, 1.0], [252, 5, 1.0], [254, 3, 1.0], [256, 3, 2.0], [260, 1, 1.0], [264, 2, 1.0], [266, 2, 1.0], [270, 1, 2.0], [270, 4, 1.0], [271, 2, 1.0], [271, 4, 1.0], [272, 4, 1.0], [273, 6, 1.0], [275, 2, 2.0], [278, 7, 2.0], [283, 8, 3.0], [284, 6, 1.0], [286, 5, 1.0], [291, 7, 1.0], [297, 1, 1.0], [299, 6, 1.0], [301, 2, 1.0], [303, 2, 1.0], [304, 5, 1.0], [304, 7, 1.0], [305, 7, 1.0], [306, 7, 3.0], [310, 3, 2.0], [311, 1, 1.0], [312, 0, 1.0], [314, 2, 3.0], [314, 3, 2.0], [314, 4, 6.0], [314, 5, 1.0], [314, 6, 3.0], [315, 1, 1.0], [317, 8, 1.0], [318, 2, 2.0], [318, 4, 2.0], [321, 2, 1.0], [323, 2, 1.0], [325, 0, 1.0], [327, 7, 1.0], [329, 4, 1.0], [332, 4, 1.0], [333, 2, 1.0], [334, 7, 1.0], [336, 7, 1.0], [339, 5, 1.0], [342, 3, 1.0], [343, 0, 2.0], [347, 0, 2.0], [347, 5, 1.0], [347, 8, 1.0], [350, 1, 1.0], [350, 3, 4.0], [350, 6, 1.0], [351, 3, 1.0], [355, 3, 1.0], [355, 4, 1.0], [355, 5, 3.0], [355, 6, 1.0], [356, 8, 1.0], [357, 7, 1.0], [358, 1, 1.0], [359, 8, 1.0], [362, 6, 1.0], [362, 8, 1.0], [364, 8, 1.0], [369, 7, 1.0], [370, 1, 2.0], [370, 2, 1.0], [370, 3, 2.0], [370, 4, 1.0], [370, 6, 1.0], [370, 7, 2.0], [371, 1, 1.0], [372, 3, 2.0], [374, 1, 1.0], [377, 4, 1.0], [378, 0, 2.0], [378, 1, 2.0], [378, 7, 2.0], [378, 8, 5.0], [379, 0, 2.0], [379, 1, 1.0], [379, 3, 1.0], [379, 4, 1.0], [379, 6, 8.0], [379, 8, 9.0], [383, 6, 1.0], [386, 2, 1.0], [390, 2, 1.0], [392, 5, 1.0], [392, 6, 11.0], [392, 8, 2.0], [393, 0, 1.0], [397, 0, 1.0], [397, 5, 6.0], [397, 7, 1.0], [398, 7, 1.0], [399, 8, 1.0], [400, 0, 1.0], [400, 3, 1.0], [400, 6, 1.0], [400, 8, 4.0], [403, 4, 1.0], [405, 3, 1.0], [406, 6, 1.0], [407, 8, 1.0], [408, 8, 1.0], [410, 8, 1.0], [411, 0, 1.0], [413, 0, 1.0], [414, 0, 1.0], [414, 1, 4.0], [414, 8, 3.0], [416, 3, 1.0]], "columns": [{"id": "PC.636", "metadata": null}, {"id": "PC.635", "metadata": null}, {"id": "PC.356", "metadata": null}, {"id": "PC.481", "metadata": null}, {"id": "PC.354", "metadata": null}, {"id": "PC.593", "metadata": null}, {"id": "PC.355", "metadata": null}, {"id": "PC.607", "metadata": null}, {"id": "PC.634", "metadata": null}], "generated_by": "", "matrix_type": "sparse", "shape": [419, 9], "format_url": "http://biom-format.org", "date": "2012-10-30T17:33:56.920373", "type": "OTU table", "id": null, "matrix_element_type": "float"}"""
-expected_biom_object_c = """{"rows": [{"id": "0", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "1", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "2", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "3", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "4", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "5", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "6", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "7", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "8", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "9", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "10", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "11", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "12", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "13", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "14", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "15", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Streptococcaceae", "Streptococcus"]}}, {"id": "16", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "17", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "18", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "19", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "20", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "21", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "22", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "23", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "24", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "25", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "26", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "27", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "28", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "29", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "30", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "31", "metadata": {"taxonomy": ["Bacteria", "TM7", "TM7_genera_incertae_sedis"]}}, {"id": "32", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "33", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "34", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "35", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria"]}}, {"id": "36", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "37", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "38", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "39", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Olsenella"]}}, {"id": "40", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "41", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "42", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "43", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "44", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "45", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "46", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "47", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "48", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "49", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "50", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "51", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "52", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "53", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "54", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "55", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "56", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "57", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "58", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "59", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "60", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "61", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "62", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "63", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "64", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "65", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "66", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "67", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "68", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Dorea"]}}, {"id": "69", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "70", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "71", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "72", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "73", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "74", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "75", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "76", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Coprobacillus"]}}, {"id": "77", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "78", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "79", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "80", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "81", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "82", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "83", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "84", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "85", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "86", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "87", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "88", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "89", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "90", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "91", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "92", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "93", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "94", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "95", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "96", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "97", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "98", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "99", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "100", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "101", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "102", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "103", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "104", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "105", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "106", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "107", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "108", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "109", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "110", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "111", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "112", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "113", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "114", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "115", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "116", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "117", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "118", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "119", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "120", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "121", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "122", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "123", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "124", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Marvinbryantia"]}}, {"id": "125", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "126", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "127", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "128", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "129", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "130", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "131", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "132", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "133", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "134", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "135", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "136", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "137", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "138", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "139", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "140", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "141", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "142", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "143", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "144", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "145", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "146", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "147", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "148", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "149", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "150", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "151", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "152", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "153", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "154", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "155", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "156", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "157", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "158", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "159", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "160", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "161", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "162", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "163", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "164", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "165", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "166", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "167", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "168", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "169", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "170", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "171", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "172", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "173", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "174", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "175", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "176", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "177", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "178", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "179", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "180", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "181", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "182", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "183", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "184", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "185", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "186", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "187", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "188", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "189", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "190", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "191", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "192", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "193", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "194", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "195", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Acetanaerobacterium"]}}, {"id": "196", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "197", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "198", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "199", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "200", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "201", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Butyricimonas"]}}, {"id": "202", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "203", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "204", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "205", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "206", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "207", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "208", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "209", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "210", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "211", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "212", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "213", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "214", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "215", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "216", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "217", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "218", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "219", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "220", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "221", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "222", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "223", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "224", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "225", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "226", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "227", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "228", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "229", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "230", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "231", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "232", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "233", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "234", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "235", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "236", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "237", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "238", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "239", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "240", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "241", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "242", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "243", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "244", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "245", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "246", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "247", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "248", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "249", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "250", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "251", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "252", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "253", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "254", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "255", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "256", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "257", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "258", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "259", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "260", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Prevotellaceae"]}}, {"id": "261", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "262", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "263", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "264", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "265", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "266", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales"]}}, {"id": "267", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria"]}}, {"id": "268", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "269", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "270", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Ruminococcus"]}}, {"id": "271", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "272", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "273", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "274", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Asaccharobacter"]}}, {"id": "275", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "276", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "277", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "278", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "279", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "280", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "281", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "282", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "283", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "284", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "285", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "286", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "287", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "288", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "289", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "290", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "291", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "292", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "293", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "294", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "295", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "296", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "297", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "298", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "299", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "300", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "301", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "302", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "303", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "304", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Epsilonproteobacteria", "Campylobacterales", "Helicobacteraceae", "Helicobacter"]}}, {"id": "305", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "306", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "307", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "308", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "309", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "310", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "311", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "312", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Carnobacteriaceae"]}}, {"id": "313", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "314", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "315", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "316", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "317", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "318", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "319", "metadata": {"taxonomy": ["Bacteria", "Verrucomicrobia", "Verrucomicrobiae", "Verrucomicrobiales", "Verrucomicrobiaceae", "Akkermansia"]}}, {"id": "320", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "321", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "322", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "323", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "324", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "325", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "326", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "327", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "328", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "329", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "330", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "331", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "332", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "333", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "334", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "335", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "336", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "337", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "338", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "339", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "340", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "341", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "342", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "343", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "344", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "345", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "346", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "347", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "348", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "349", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "350", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "351", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "352", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "353", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "354", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "355", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "356", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII", "Anaerovorax"]}}, {"id": "357", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII"]}}, {"id": "358", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "359", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "360", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "361", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "362", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Clostridiaceae", "Clostridium"]}}, {"id": "363", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "364", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "365", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "366", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "367", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "368", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "369", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "370", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "371", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "372", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "373", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "374", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "375", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "376", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "377", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "378", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "379", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "380", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "381", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "382", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "383", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "384", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "385", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "386", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "387", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "388", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "389", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "390", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "391", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "392", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "393", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "394", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "395", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "396", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "397", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "398", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "399", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "400", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "401", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "402", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "403", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "404", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "405", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "406", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "407", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "408", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "409", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "410", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Turicibacter"]}}, {"id": "411", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "412", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "413", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "414", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "415", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "416", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "417", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "418", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}], "format": "Biological Observation Matrix 1.0.0", "data": [[0, 0, 1.0], [1, 1, 1.0], [3, 2, 1.0], [4, 3, 1.0], [5, 0, 1.0], [6, 4, 1.0], [8, 0, 1.0], [8, 1, 1.0], [8, 4, 1.0], [9, 5, 1.0], [11, 1, 1.0], [12, 6, 1.0], [13, 4, 1.0], [13, 6, 1.0], [14, 2, 1.0], [15, 7, 1.0], [17, 8, 1.0], [20, 8, 1.0], [21, 3, 1.0], [21, 4, 1.0], [22, 7, 1.0], [24, 1, 2.0], [25, 3, 1.0], [26, 1, 1.0], [28, 0, 1.0], [29, 8, 1.0], [30, 1, 1.0], [31, 8, 2.0], [32, 1, 1.0], [32, 3, 1.0], [34, 2, 1.0], [36, 7, 1.0], [37, 3, 1.0], [38, 7, 1.0], [39, 7, 2.0], [40, 6, 1.0], [41, 3, 1.0], [41, 7, 2.0], [42, 4, 1.0], [43, 7, 1.0], [45, 4, 9.0], [45, 5, 7.0], [46, 0, 4.0], [46, 1, 2.0], [46, 8, 4.0], [48, 7, 1.0], [49, 5, 1.0], [50, 4, 1.0], [51, 5, 1.0], [53, 3, 1.0], [53, 6, 1.0], [54, 0, 13.0], [54, 1, 7.0], [54, 3, 1.0], [54, 8, 3.0], [55, 5, 1.0], [56, 0, 3.0], [56, 1, 1.0], [56, 3, 2.0], [56, 4, 1.0], [56, 6, 2.0], [56, 7, 5.0], [56, 8, 1.0], [58, 0, 1.0], [59, 0, 1.0], [59, 2, 8.0], [59, 3, 2.0], [59, 5, 18.0], [61, 2, 1.0], [63, 2, 1.0], [65, 7, 1.0], [66, 1, 1.0], [67, 3, 1.0], [68, 3, 1.0], [70, 7, 1.0], [72, 0, 1.0], [72, 1, 1.0], [72, 8, 2.0], [73, 8, 2.0], [74, 0, 1.0], [74, 1, 3.0], [74, 5, 1.0], [74, 7, 1.0], [74, 8, 1.0], [75, 7, 3.0], [76, 4, 1.0], [77, 0, 1.0], [77, 1, 1.0], [82, 0, 8.0], [82, 1, 1.0], [82, 3, 1.0], [82, 8, 1.0], [84, 2, 1.0], [85, 3, 1.0], [87, 3, 1.0], [89, 1, 1.0], [90, 2, 2.0], [90, 6, 2.0], [91, 2, 1.0], [93, 2, 2.0], [93, 3, 1.0], [93, 6, 2.0], [95, 4, 1.0], [96, 0, 1.0], [97, 8, 1.0], [98, 7, 1.0], [99, 1, 1.0], [101, 7, 1.0], [102, 0, 1.0], [104, 5, 2.0], [106, 3, 1.0], [108, 8, 1.0], [109, 8, 1.0], [113, 5, 1.0], [115, 0, 1.0], [118, 3, 1.0], [119, 2, 1.0], [120, 1, 1.0], [120, 8, 1.0], [121, 6, 1.0], [122, 6, 1.0], [123, 4, 1.0], [123, 6, 2.0], [125, 4, 1.0], [126, 1, 1.0], [126, 2, 1.0], [127, 7, 1.0], [129, 4, 2.0], [129, 6, 2.0], [130, 5, 1.0], [133, 4, 1.0], [134, 1, 1.0], [136, 1, 1.0], [136, 4, 1.0], [138, 8, 1.0], [143, 7, 1.0], [144, 2, 1.0], [146, 3, 2.0], [148, 3, 2.0], [148, 4, 4.0], [148, 6, 3.0], [151, 0, 2.0], [151, 1, 5.0], [153, 5, 1.0], [154, 0, 1.0], [155, 8, 1.0], [156, 3, 1.0], [160, 7, 1.0], [161, 6, 2.0], [163, 0, 1.0], [164, 0, 1.0], [165, 2, 8.0], [165, 4, 8.0], [166, 2, 3.0], [166, 4, 2.0], [166, 5, 1.0], [169, 2, 4.0], [169, 4, 1.0], [169, 6, 2.0], [170, 5, 1.0], [172, 1, 1.0], [174, 5, 1.0], [177, 4, 1.0], [178, 8, 1.0], [179, 7, 1.0], [181, 5, 4.0], [181, 7, 1.0], [182, 5, 3.0], [183, 3, 1.0], [185, 7, 2.0], [187, 6, 1.0], [188, 0, 1.0], [188, 1, 1.0], [188, 3, 1.0], [188, 7, 1.0], [190, 1, 1.0], [191, 5, 1.0], [195, 2, 2.0], [198, 2, 1.0], [199, 7, 1.0], [201, 1, 1.0], [201, 8, 1.0], [202, 3, 1.0], [202, 6, 1.0], [203, 2, 5.0], [203, 4, 11.0], [204, 7, 1.0], [206, 2, 1.0], [207, 0, 1.0], [209, 2, 1.0], [211, 8, 6.0], [212, 3, 2.0], [213, 8, 1.0], [214, 4, 1.0], [214, 7, 1.0], [216, 2, 1.0], [217, 1, 3.0], [217, 5, 1.0], [218, 7, 1.0], [219, 2, 1.0], [220, 6, 1.0], [221, 3, 3.0], [223, 1, 1.0], [223, 2, 1.0], [223, 7, 2.0], [224, 0, 1.0], [225, 4, 1.0], [225, 6, 1.0], [226, 2, 1.0], [226, 4, 1.0], [227, 2, 1.0], [227, 3, 1.0], [227, 4, 1.0], [228, 3, 1.0], [228, 6, 2.0], [229, 4, 2.0], [230, 7, 1.0], [231, 7, 1.0], [232, 3, 3.0], [232, 5, 8.0], [232, 7, 13.0], [235, 1, 1.0], [235, 8, 1.0], [236, 4, 1.0], [238, 1, 1.0], [240, 3, 1.0], [242, 8, 1.0], [244, 4, 1.0], [245, 7, 1.0], [246, 0, 2.0], [246, 1, 1.0], [246, 7, 5.0], [247, 1, 1.0], [247, 7, 1.0], [248, 7, 1.0], [251, 2, 1.0], [251, 4, 1.0], [253, 5, 1.0], [254, 3, 1.0], [255, 1, 1.0], [256, 3, 1.0], [258, 1, 1.0], [259, 2, 1.0], [263, 0, 1.0], [264, 2, 1.0], [265, 0, 1.0], [265, 8, 1.0], [267, 7, 1.0], [269, 0, 1.0], [270, 1, 1.0], [270, 4, 1.0], [271, 4, 1.0], [271, 6, 1.0], [272, 4, 1.0], [272, 6, 1.0], [273, 0, 1.0], [273, 3, 2.0], [273, 6, 2.0], [275, 2, 1.0], [278, 1, 1.0], [278, 7, 3.0], [280, 1, 1.0], [281, 6, 1.0], [282, 5, 1.0], [283, 8, 4.0], [284, 8, 1.0], [286, 5, 1.0], [287, 3, 1.0], [288, 2, 1.0], [288, 4, 1.0], [289, 6, 1.0], [292, 0, 1.0], [298, 1, 1.0], [298, 7, 1.0], [299, 6, 1.0], [300, 3, 1.0], [301, 2, 1.0], [303, 2, 1.0], [304, 5, 3.0], [304, 7, 2.0], [306, 2, 1.0], [306, 7, 3.0], [308, 7, 1.0], [310, 3, 1.0], [311, 1, 1.0], [312, 0, 1.0], [313, 1, 1.0], [314, 2, 2.0], [314, 3, 7.0], [314, 4, 6.0], [314, 5, 1.0], [314, 6, 7.0], [315, 1, 1.0], [316, 8, 1.0], [317, 8, 1.0], [318, 2, 1.0], [318, 4, 2.0], [323, 2, 1.0], [324, 0, 1.0], [325, 0, 1.0], [329, 4, 1.0], [330, 7, 1.0], [332, 2, 1.0], [334, 7, 1.0], [335, 2, 2.0], [337, 1, 1.0], [338, 1, 1.0], [339, 5, 2.0], [340, 1, 1.0], [341, 0, 1.0], [342, 0, 1.0], [342, 3, 1.0], [342, 5, 1.0], [342, 6, 1.0], [343, 0, 1.0], [343, 1, 1.0], [343, 2, 1.0], [345, 0, 1.0], [347, 0, 3.0], [347, 4, 1.0], [347, 5, 2.0], [347, 8, 1.0], [348, 7, 1.0], [349, 5, 3.0], [350, 1, 2.0], [350, 3, 4.0], [350, 6, 2.0], [351, 3, 1.0], [353, 5, 1.0], [354, 8, 1.0], [355, 3, 2.0], [355, 5, 2.0], [357, 8, 1.0], [358, 1, 1.0], [359, 5, 1.0], [362, 6, 1.0], [362, 8, 2.0], [364, 8, 1.0], [365, 8, 1.0], [370, 1, 2.0], [370, 2, 1.0], [370, 3, 3.0], [370, 4, 1.0], [370, 7, 1.0], [372, 3, 1.0], [373, 1, 1.0], [375, 7, 1.0], [377, 4, 1.0], [378, 0, 3.0], [378, 1, 3.0], [378, 7, 3.0], [378, 8, 6.0], [379, 0, 2.0], [379, 1, 3.0], [379, 4, 2.0], [379, 6, 12.0], [379, 8, 9.0], [380, 2, 1.0], [382, 3, 1.0], [383, 6, 1.0], [384, 2, 1.0], [385, 2, 1.0], [385, 4, 1.0], [386, 2, 1.0], [387, 2, 1.0], [392, 2, 2.0], [392, 5, 1.0], [392, 6, 13.0], [392, 8, 2.0], [393, 0, 1.0], [393, 2, 1.0], [395, 3, 1.0], [396, 6, 1.0], [397, 0, 2.0], [397, 1, 1.0], [397, 2, 1.0], [397, 5, 4.0], [397, 7, 1.0], [400, 0, 2.0], [400, 2, 2.0], [400, 3, 1.0], [400, 5, 1.0], [400, 6, 2.0], [400, 8, 2.0], [402, 6, 1.0], [403, 4, 1.0], [404, 6, 1.0], [405, 3, 1.0], [406, 0, 1.0], [406, 1, 1.0], [406, 3, 2.0], [406, 6, 1.0], [406, 8, 1.0], [407, 8, 1.0], [408, 8, 2.0], [409, 0, 1.0], [410, 3, 6.0], [410, 8, 2.0], [411, 0, 1.0], [413, 0, 1.0], [414, 0, 1.0], [414, 1, 5.0], [414, 8, 4.0], [415, 6, 1.0], [416, 3, 3.0]], "columns": [{"id": "PC.636", "metadata": null}, {"id": "PC.635", "metadata": null}, {"id": "PC.356", "metadata": null}, {"id": "PC.481", "metadata": null}, {"id": "PC.354", "metadata": null}, {"id": "PC.593", "metadata": null}, {"id": "PC.355", "metadata": null}, {"id": "PC.607", "metadata": null}, {"id": "PC.634", "metadata": null}], "generated_by": "", "matrix_type": "sparse", "shape": [419, 9], "format_url": "http://biom-format.org", "date": "2012-10-30T17:33:56.944408", "type": "OTU table", "id": null, "matrix_element_type": "float"}"""
-expected_biom_object_d = """{"rows": [{"id": "0", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "1", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "2", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "3", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "4", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "5", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "6", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "7", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "8", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "9", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "10", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "11", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "12", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "13", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "14", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "15", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Streptococcaceae", "Streptococcus"]}}, {"id": "16", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "17", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "18", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "19", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "20", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "21", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "22", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "23", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "24", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "25", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "26", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "27", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "28", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "29", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "30", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "31", "metadata": {"taxonomy": ["Bacteria", "TM7", "TM7_genera_incertae_sedis"]}}, {"id": "32", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "33", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "34", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "35", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria"]}}, {"id": "36", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "37", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "38", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "39", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Olsenella"]}}, {"id": "40", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "41", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "42", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "43", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "44", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "45", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "46", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "47", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "48", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "49", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "50", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "51", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "52", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "53", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "54", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "55", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "56", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "57", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "58", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "59", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "60", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "61", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "62", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "63", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "64", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "65", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "66", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "67", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "68", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Dorea"]}}, {"id": "69", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "70", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "71", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "72", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "73", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "74", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "75", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "76", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Coprobacillus"]}}, {"id": "77", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "78", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "79", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "80", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "81", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "82", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "83", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "84", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "85", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "86", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "87", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "88", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "89", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "90", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "91", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "92", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "93", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "94", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "95", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "96", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "97", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "98", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "99", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "100", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "101", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "102", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "103", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "104", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "105", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "106", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "107", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "108", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "109", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "110", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "111", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "112", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "113", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "114", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "115", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "116", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "117", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "118", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "119", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "120", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "121", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "122", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "123", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "124", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Marvinbryantia"]}}, {"id": "125", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "126", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "127", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "128", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "129", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "130", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "131", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "132", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "133", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "134", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "135", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "136", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "137", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "138", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "139", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "140", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "141", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "142", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "143", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "144", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "145", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "146", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "147", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "148", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "149", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "150", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "151", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "152", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "153", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "154", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "155", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "156", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "157", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "158", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "159", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "160", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "161", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "162", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "163", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "164", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "165", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "166", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "167", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "168", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "169", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "170", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "171", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "172", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "173", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "174", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "175", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "176", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "177", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "178", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "179", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "180", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "181", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "182", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "183", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "184", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "185", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "186", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "187", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "188", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "189", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "190", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "191", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "192", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "193", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "194", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "195", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Acetanaerobacterium"]}}, {"id": "196", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "197", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "198", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "199", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "200", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "201", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Butyricimonas"]}}, {"id": "202", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "203", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "204", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "205", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "206", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "207", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "208", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "209", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "210", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "211", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "212", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "213", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "214", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "215", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "216", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "217", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "218", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "219", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "220", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "221", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "222", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "223", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "224", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "225", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "226", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "227", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "228", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "229", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "230", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "231", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "232", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "233", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "234", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "235", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "236", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "237", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "238", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "239", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "240", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "241", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "242", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "243", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "244", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "245", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "246", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "247", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "248", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "249", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "250", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "251", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "252", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "253", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "254", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "255", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "256", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "257", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "258", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "259", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "260", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Prevotellaceae"]}}, {"id": "261", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "262", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "263", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "264", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "265", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "266", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales"]}}, {"id": "267", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria"]}}, {"id": "268", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "269", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "270", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Ruminococcus"]}}, {"id": "271", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "272", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "273", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "274", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Asaccharobacter"]}}, {"id": "275", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "276", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "277", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "278", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "279", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "280", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "281", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "282", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "283", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "284", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "285", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "286", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "287", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "288", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "289", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "290", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "291", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "292", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "293", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "294", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "295", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "296", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "297", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "298", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "299", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "300", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "301", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "302", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "303", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "304", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Epsilonproteobacteria", "Campylobacterales", "Helicobacteraceae", "Helicobacter"]}}, {"id": "305", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "306", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "307", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "308", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "309", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "310", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "311", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "312", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Carnobacteriaceae"]}}, {"id": "313", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "314", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "315", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "316", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "317", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "318", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "319", "metadata": {"taxonomy": ["Bacteria", "Verrucomicrobia", "Verrucomicrobiae", "Verrucomicrobiales", "Verrucomicrobiaceae", "Akkermansia"]}}, {"id": "320", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "321", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "322", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "323", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "324", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "325", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "326", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "327", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "328", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "329", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "330", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "331", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "332", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "333", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "334", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "335", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "336", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "337", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "338", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "339", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "340", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "341", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "342", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "343", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "344", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "345", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "346", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "347", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "348", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "349", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "350", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "351", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "352", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "353", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "354", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "355", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "356", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII", "Anaerovorax"]}}, {"id": "357", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII"]}}, {"id": "358", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "359", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "360", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "361", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "362", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Clostridiaceae", "Clostridium"]}}, {"id": "363", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "364", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "365", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "366", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "367", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "368", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "369", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "370", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "371", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "372", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "373", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "374", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "375", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "376", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "377", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "378", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "379", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "380", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "381", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "382", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "383", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "384", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "385", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "386", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "387", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "388", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "389", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "390", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "391", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "392", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "393", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "394", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "395", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "396", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "397", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "398", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "399", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "400", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "401", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "402", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "403", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "404", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "405", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "406", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "407", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "408", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "409", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "410", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Turicibacter"]}}, {"id": "411", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "412", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "413", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "414", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "415", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "416", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "417", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "418", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}], "format": "Biological Observation Matrix 1.0.0", "data": [[2, 0, 1.0], [5, 0, 1.0], [5, 1, 1.0], [6, 4, 1.0], [8, 0, 1.0], [8, 1, 1.0], [10, 3, 1.0], [11, 1, 1.0], [11, 3, 1.0], [12, 6, 1.0], [13, 6, 1.0], [14, 1, 1.0], [15, 7, 1.0], [17, 8, 1.0], [18, 8, 1.0], [20, 8, 1.0], [21, 3, 1.0], [21, 4, 1.0], [23, 7, 1.0], [24, 1, 2.0], [25, 3, 1.0], [27, 7, 1.0], [28, 0, 1.0], [29, 8, 1.0], [31, 8, 1.0], [33, 8, 1.0], [34, 1, 1.0], [34, 2, 1.0], [36, 7, 1.0], [37, 3, 3.0], [39, 7, 2.0], [40, 6, 1.0], [41, 3, 1.0], [41, 7, 2.0], [43, 7, 1.0], [45, 4, 10.0], [45, 5, 8.0], [46, 0, 4.0], [46, 1, 2.0], [46, 7, 3.0], [46, 8, 4.0], [49, 5, 1.0], [50, 4, 1.0], [51, 5, 1.0], [52, 3, 1.0], [53, 1, 1.0], [53, 3, 2.0], [53, 6, 2.0], [54, 0, 28.0], [54, 1, 5.0], [54, 3, 1.0], [54, 8, 2.0], [55, 5, 1.0], [56, 0, 4.0], [56, 1, 3.0], [56, 2, 1.0], [56, 3, 1.0], [56, 5, 1.0], [56, 6, 1.0], [56, 7, 6.0], [56, 8, 2.0], [57, 5, 1.0], [58, 0, 1.0], [59, 0, 1.0], [59, 2, 9.0], [59, 3, 2.0], [59, 5, 16.0], [59, 6, 1.0], [61, 2, 1.0], [62, 7, 1.0], [63, 2, 1.0], [66, 1, 1.0], [67, 3, 1.0], [68, 3, 1.0], [69, 6, 1.0], [71, 6, 1.0], [72, 1, 2.0], [73, 8, 1.0], [74, 1, 3.0], [74, 5, 1.0], [74, 7, 2.0], [74, 8, 1.0], [75, 7, 3.0], [76, 4, 1.0], [77, 0, 1.0], [77, 1, 1.0], [81, 2, 1.0], [82, 0, 13.0], [82, 1, 1.0], [82, 3, 1.0], [82, 8, 1.0], [84, 2, 1.0], [85, 3, 1.0], [86, 3, 1.0], [87, 3, 1.0], [88, 5, 1.0], [89, 1, 1.0], [90, 0, 1.0], [90, 1, 2.0], [90, 2, 3.0], [90, 6, 4.0], [90, 7, 2.0], [91, 2, 1.0], [92, 2, 1.0], [93, 3, 5.0], [93, 4, 1.0], [93, 6, 3.0], [94, 2, 1.0], [95, 4, 1.0], [96, 0, 1.0], [97, 8, 1.0], [98, 7, 1.0], [99, 3, 1.0], [99, 8, 1.0], [100, 3, 1.0], [102, 0, 1.0], [104, 5, 2.0], [105, 6, 1.0], [106, 3, 1.0], [107, 6, 1.0], [108, 8, 5.0], [109, 8, 1.0], [110, 4, 1.0], [111, 7, 1.0], [114, 4, 1.0], [115, 0, 1.0], [116, 3, 1.0], [117, 4, 1.0], [117, 7, 1.0], [118, 3, 1.0], [119, 2, 1.0], [120, 8, 1.0], [121, 0, 1.0], [121, 6, 1.0], [122, 6, 1.0], [123, 4, 1.0], [124, 0, 1.0], [124, 6, 1.0], [125, 4, 1.0], [126, 1, 1.0], [126, 2, 1.0], [127, 7, 1.0], [129, 4, 1.0], [129, 6, 2.0], [130, 2, 1.0], [130, 6, 1.0], [131, 5, 1.0], [133, 4, 1.0], [134, 1, 1.0], [135, 2, 1.0], [136, 1, 1.0], [136, 4, 1.0], [137, 8, 1.0], [139, 4, 1.0], [140, 7, 1.0], [142, 1, 1.0], [143, 7, 1.0], [144, 2, 1.0], [146, 1, 1.0], [146, 3, 4.0], [148, 1, 2.0], [148, 3, 1.0], [148, 4, 4.0], [148, 6, 8.0], [149, 0, 1.0], [150, 1, 1.0], [151, 0, 1.0], [151, 1, 2.0], [151, 3, 1.0], [152, 2, 1.0], [153, 5, 1.0], [154, 0, 1.0], [155, 8, 1.0], [156, 1, 1.0], [156, 3, 1.0], [158, 1, 1.0], [159, 7, 1.0], [160, 7, 1.0], [161, 6, 1.0], [162, 6, 1.0], [163, 0, 1.0], [164, 1, 1.0], [165, 2, 10.0], [165, 3, 1.0], [165, 4, 13.0], [166, 2, 3.0], [166, 4, 3.0], [166, 5, 1.0], [167, 1, 1.0], [168, 5, 1.0], [169, 2, 5.0], [169, 4, 1.0], [169, 5, 1.0], [169, 6, 2.0], [170, 5, 1.0], [171, 7, 1.0], [172, 1, 1.0], [173, 0, 1.0], [174, 5, 1.0], [175, 8, 1.0], [176, 8, 1.0], [177, 5, 6.0], [178, 8, 1.0], [179, 7, 1.0], [181, 5, 6.0], [181, 7, 1.0], [182, 5, 4.0], [185, 7, 1.0], [186, 1, 1.0], [187, 6, 1.0], [188, 1, 1.0], [188, 3, 1.0], [188, 7, 1.0], [189, 5, 1.0], [191, 4, 1.0], [192, 2, 1.0], [193, 2, 1.0], [194, 2, 1.0], [195, 2, 2.0], [198, 2, 1.0], [198, 6, 1.0], [200, 7, 1.0], [201, 1, 3.0], [202, 3, 4.0], [202, 4, 1.0], [202, 6, 1.0], [203, 2, 9.0], [203, 4, 20.0], [203, 6, 1.0], [204, 7, 1.0], [207, 0, 1.0], [208, 0, 1.0], [209, 2, 1.0], [210, 3, 1.0], [211, 8, 5.0], [212, 3, 2.0], [213, 8, 1.0], [214, 7, 3.0], [215, 0, 1.0], [217, 1, 3.0], [217, 5, 2.0], [218, 7, 1.0], [219, 1, 1.0], [219, 2, 1.0], [220, 6, 1.0], [221, 3, 4.0], [223, 1, 1.0], [223, 2, 1.0], [223, 7, 1.0], [224, 0, 1.0], [225, 4, 1.0], [225, 6, 1.0], [226, 4, 1.0], [227, 2, 1.0], [227, 4, 1.0], [228, 6, 3.0], [229, 4, 2.0], [231, 7, 1.0], [232, 3, 4.0], [232, 4, 1.0], [232, 5, 14.0], [232, 7, 13.0], [233, 1, 1.0], [234, 0, 1.0], [235, 1, 1.0], [236, 4, 1.0], [237, 7, 1.0], [238, 1, 1.0], [239, 4, 1.0], [240, 3, 1.0], [242, 8, 1.0], [245, 7, 1.0], [246, 0, 1.0], [246, 7, 4.0], [247, 1, 1.0], [248, 7, 1.0], [249, 8, 1.0], [250, 5, 1.0], [252, 5, 1.0], [254, 3, 1.0], [255, 1, 1.0], [256, 3, 1.0], [257, 7, 1.0], [258, 1, 1.0], [260, 1, 1.0], [261, 3, 1.0], [263, 0, 1.0], [264, 2, 1.0], [265, 0, 1.0], [265, 8, 1.0], [266, 2, 1.0], [267, 7, 1.0], [270, 1, 2.0], [270, 4, 1.0], [271, 2, 1.0], [271, 4, 1.0], [272, 4, 1.0], [273, 0, 1.0], [273, 2, 2.0], [273, 4, 1.0], [273, 6, 3.0], [274, 0, 1.0], [275, 2, 2.0], [276, 7, 1.0], [278, 1, 3.0], [278, 7, 5.0], [280, 1, 1.0], [281, 6, 1.0], [282, 5, 1.0], [283, 8, 4.0], [284, 8, 1.0], [286, 5, 1.0], [288, 4, 1.0], [289, 6, 1.0], [290, 3, 1.0], [292, 0, 1.0], [293, 1, 1.0], [295, 3, 1.0], [296, 1, 1.0], [297, 1, 1.0], [298, 1, 1.0], [298, 7, 1.0], [299, 6, 1.0], [300, 3, 1.0], [301, 2, 1.0], [302, 7, 1.0], [303, 2, 1.0], [304, 5, 4.0], [304, 7, 2.0], [305, 7, 1.0], [306, 2, 1.0], [306, 4, 1.0], [306, 7, 5.0], [308, 7, 1.0], [309, 6, 1.0], [310, 3, 2.0], [311, 1, 1.0], [312, 0, 1.0], [313, 1, 1.0], [314, 2, 4.0], [314, 3, 10.0], [314, 4, 7.0], [314, 5, 2.0], [314, 6, 8.0], [315, 1, 1.0], [315, 8, 1.0], [317, 8, 1.0], [318, 2, 2.0], [318, 3, 1.0], [318, 4, 2.0], [323, 2, 1.0], [324, 0, 1.0], [325, 0, 1.0], [326, 4, 1.0], [327, 7, 1.0], [330, 7, 1.0], [331, 6, 1.0], [332, 2, 1.0], [332, 4, 1.0], [333, 2, 1.0], [335, 2, 1.0], [336, 7, 1.0], [339, 5, 1.0], [341, 0, 1.0], [342, 0, 2.0], [342, 3, 1.0], [342, 5, 1.0], [342, 6, 1.0], [343, 0, 1.0], [343, 1, 1.0], [343, 2, 1.0], [344, 1, 1.0], [345, 0, 1.0], [346, 8, 1.0], [347, 0, 1.0], [347, 4, 1.0], [347, 5, 2.0], [347, 8, 1.0], [348, 7, 1.0], [349, 5, 3.0], [350, 1, 1.0], [350, 3, 3.0], [350, 6, 2.0], [351, 3, 1.0], [353, 5, 1.0], [354, 8, 1.0], [355, 3, 1.0], [355, 4, 1.0], [355, 5, 1.0], [355, 6, 1.0], [356, 8, 1.0], [357, 7, 1.0], [358, 1, 1.0], [359, 5, 2.0], [363, 1, 1.0], [364, 8, 1.0], [365, 8, 1.0], [367, 6, 1.0], [368, 6, 1.0], [370, 1, 4.0], [370, 2, 1.0], [370, 3, 3.0], [370, 4, 1.0], [370, 6, 1.0], [370, 7, 2.0], [370, 8, 1.0], [372, 3, 2.0], [373, 1, 1.0], [374, 1, 1.0], [375, 7, 1.0], [377, 4, 1.0], [378, 0, 1.0], [378, 1, 4.0], [378, 7, 4.0], [378, 8, 7.0], [379, 0, 1.0], [379, 1, 2.0], [379, 3, 1.0], [379, 4, 2.0], [379, 6, 11.0], [379, 8, 19.0], [380, 2, 1.0], [381, 2, 1.0], [383, 6, 2.0], [384, 2, 1.0], [385, 4, 1.0], [386, 2, 1.0], [387, 1, 1.0], [387, 2, 1.0], [388, 2, 1.0], [390, 2, 1.0], [392, 2, 1.0], [392, 5, 1.0], [392, 6, 11.0], [392, 8, 1.0], [394, 2, 1.0], [396, 6, 2.0], [397, 0, 2.0], [397, 1, 1.0], [397, 2, 1.0], [397, 5, 3.0], [397, 6, 1.0], [397, 8, 1.0], [398, 7, 1.0], [399, 8, 1.0], [400, 0, 4.0], [400, 2, 2.0], [400, 3, 1.0], [400, 5, 2.0], [400, 6, 1.0], [400, 8, 3.0], [401, 8, 1.0], [404, 6, 1.0], [405, 3, 1.0], [406, 0, 1.0], [406, 1, 1.0], [406, 2, 1.0], [406, 3, 1.0], [406, 6, 1.0], [406, 8, 1.0], [408, 8, 3.0], [409, 0, 1.0], [410, 3, 7.0], [410, 8, 2.0], [411, 0, 1.0], [411, 6, 1.0], [412, 7, 1.0], [414, 0, 1.0], [414, 1, 6.0], [414, 8, 7.0], [415, 6, 1.0], [416, 2, 1.0], [416, 3, 3.0], [418, 0, 1.0]], "columns": [{"id": "PC.636", "metadata": null}, {"id": "PC.635", "metadata": null}, {"id": "PC.356", "metadata": null}, {"id": "PC.481", "metadata": null}, {"id": "PC.354", "metadata": null}, {"id": "PC.593", "metadata": null}, {"id": "PC.355", "metadata": null}, {"id": "PC.607", "metadata": null}, {"id": "PC.634", "metadata": null}], "generated_by": "", "matrix_type": "sparse", "shape": [419, 9], "format_url": "http://biom-format.org", "date": "2012-10-30T17:33:56.964655", "type": "OTU table", "id": null, "matrix_element_type": "float"}"""
-expected_biom_object_e = """{"rows": [{"id": "0", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "1", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "2", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "3", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "4", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "5", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "6", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "7", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "8", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "9", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "10", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "11", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "12", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "13", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "14", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "15", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Streptococcaceae", "Streptococcus"]}}, {"id": "16", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "17", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "18", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "19", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "20", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "21", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "22", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "23", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "24", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "25", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "26", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "27", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "28", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "29", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "30", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "31", "metadata": {"taxonomy": ["Bacteria", "TM7", "TM7_genera_incertae_sedis"]}}, {"id": "32", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "33", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "34", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "35", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria"]}}, {"id": "36", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "37", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "38", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "39", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Olsenella"]}}, {"id": "40", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "41", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "42", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "43", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "44", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "45", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "46", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "47", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "48", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "49", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "50", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "51", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "52", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "53", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "54", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "55", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "56", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "57", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "58", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "59", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "60", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "61", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "62", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "63", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "64", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "65", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "66", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "67", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "68", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Dorea"]}}, {"id": "69", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "70", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "71", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "72", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "73", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "74", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "75", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "76", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Coprobacillus"]}}, {"id": "77", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "78", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "79", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "80", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "81", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "82", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "83", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "84", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "85", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "86", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "87", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "88", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "89", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "90", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "91", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "92", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "93", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "94", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "95", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "96", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "97", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "98", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "99", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "100", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "101", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "102", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "103", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "104", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "105", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "106", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "107", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "108", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "109", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "110", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "111", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "112", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "113", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "114", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "115", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "116", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "117", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "118", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "119", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "120", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "121", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "122", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "123", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "124", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Marvinbryantia"]}}, {"id": "125", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "126", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "127", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "128", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "129", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "130", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "131", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "132", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "133", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "134", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "135", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "136", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "137", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "138", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "139", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "140", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "141", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "142", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "143", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "144", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "145", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "146", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "147", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "148", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "149", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "150", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "151", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "152", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "153", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "154", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "155", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "156", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "157", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "158", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "159", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "160", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "161", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "162", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "163", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "164", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "165", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "166", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "167", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "168", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "169", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "170", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "171", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "172", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "173", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "174", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "175", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "176", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "177", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "178", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "179", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "180", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "181", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "182", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "183", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "184", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "185", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "186", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "187", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "188", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "189", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "190", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "191", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "192", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "193", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "194", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "195", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Acetanaerobacterium"]}}, {"id": "196", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "197", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "198", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "199", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "200", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "201", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Butyricimonas"]}}, {"id": "202", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "203", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "204", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "205", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "206", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "207", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "208", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "209", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "210", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "211", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "212", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "213", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "214", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "215", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "216", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "217", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "218", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "219", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "220", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "221", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "222", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "223", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "224", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "225", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "226", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "227", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "228", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "229", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "230", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "231", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "232", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "233", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "234", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "235", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "236", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "237", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "238", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "239", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "240", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "241", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "242", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "243", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "244", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "245", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "246", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "247", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "248", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "249", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "250", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "251", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "252", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "253", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "254", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "255", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "256", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "257", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "258", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "259", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "260", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Prevotellaceae"]}}, {"id": "261", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "262", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "263", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "264", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "265", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "266", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales"]}}, {"id": "267", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria"]}}, {"id": "268", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "269", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "270", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Ruminococcus"]}}, {"id": "271", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "272", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "273", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "274", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Asaccharobacter"]}}, {"id": "275", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "276", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "277", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "278", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "279", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "280", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "281", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "282", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "283", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "284", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "285", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "286", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "287", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "288", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "289", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "290", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "291", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "292", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "293", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "294", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "295", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "296", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "297", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "298", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "299", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "300", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "301", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "302", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "303", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "304", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Epsilonproteobacteria", "Campylobacterales", "Helicobacteraceae", "Helicobacter"]}}, {"id": "305", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "306", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "307", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "308", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "309", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "310", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "311", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "312", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Carnobacteriaceae"]}}, {"id": "313", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "314", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "315", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "316", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "317", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "318", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "319", "metadata": {"taxonomy": ["Bacteria", "Verrucomicrobia", "Verrucomicrobiae", "Verrucomicrobiales", "Verrucomicrobiaceae", "Akkermansia"]}}, {"id": "320", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "321", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "322", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "323", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "324", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "325", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "326", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "327", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "328", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "329", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "330", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "331", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "332", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "333", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "334", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "335", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "336", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "337", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "338", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "339", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "340", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "341", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "342", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "343", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "344", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "345", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "346", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "347", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "348", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "349", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "350", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "351", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "352", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "353", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "354", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "355", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "356", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII", "Anaerovorax"]}}, {"id": "357", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII"]}}, {"id": "358", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "359", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "360", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "361", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "362", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Clostridiaceae", "Clostridium"]}}, {"id": "363", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "364", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "365", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "366", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "367", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "368", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "369", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "370", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "371", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "372", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "373", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "374", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "375", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "376", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "377", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "378", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "379", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "380", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "381", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "382", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "383", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "384", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "385", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "386", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "387", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "388", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "389", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "390", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "391", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "392", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "393", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "394", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "395", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "396", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "397", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "398", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "399", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "400", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "401", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "402", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "403", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "404", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "405", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "406", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "407", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "408", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "409", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "410", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Turicibacter"]}}, {"id": "411", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "412", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "413", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "414", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "415", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "416", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "417", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "418", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}], "format": "Biological Observation Matrix 1.0.0", "data": [[1, 1, 1.0], [2, 0, 1.0], [3, 2, 1.0], [4, 3, 1.0], [5, 0, 1.0], [5, 1, 1.0], [6, 4, 1.0], [8, 0, 1.0], [8, 4, 1.0], [9, 5, 1.0], [10, 3, 1.0], [11, 3, 1.0], [12, 6, 1.0], [13, 4, 2.0], [14, 1, 1.0], [14, 2, 1.0], [15, 7, 1.0], [16, 1, 1.0], [17, 8, 1.0], [18, 8, 1.0], [19, 2, 1.0], [20, 8, 1.0], [21, 3, 1.0], [23, 7, 1.0], [24, 1, 2.0], [25, 3, 1.0], [26, 1, 1.0], [27, 7, 2.0], [28, 0, 1.0], [29, 8, 1.0], [30, 1, 1.0], [31, 8, 2.0], [32, 1, 1.0], [32, 3, 1.0], [33, 8, 1.0], [34, 1, 1.0], [34, 2, 1.0], [35, 1, 1.0], [37, 3, 2.0], [38, 7, 1.0], [39, 7, 2.0], [40, 6, 1.0], [41, 3, 1.0], [41, 7, 1.0], [42, 3, 1.0], [43, 7, 1.0], [45, 4, 10.0], [45, 5, 10.0], [46, 0, 5.0], [46, 1, 2.0], [46, 7, 3.0], [46, 8, 5.0], [47, 3, 1.0], [48, 7, 1.0], [49, 5, 1.0], [50, 4, 1.0], [51, 5, 1.0], [52, 3, 1.0], [53, 1, 1.0], [53, 3, 2.0], [53, 6, 1.0], [54, 0, 29.0], [54, 1, 9.0], [54, 3, 1.0], [54, 8, 2.0], [55, 5, 1.0], [56, 0, 4.0], [56, 1, 2.0], [56, 2, 1.0], [56, 4, 1.0], [56, 5, 1.0], [56, 6, 3.0], [56, 7, 9.0], [56, 8, 1.0], [57, 5, 1.0], [58, 0, 1.0], [59, 0, 1.0], [59, 1, 1.0], [59, 2, 8.0], [59, 3, 1.0], [59, 4, 1.0], [59, 5, 18.0], [60, 3, 1.0], [62, 7, 1.0], [64, 6, 1.0], [68, 3, 1.0], [69, 6, 1.0], [70, 7, 1.0], [71, 6, 1.0], [72, 0, 2.0], [72, 1, 1.0], [72, 8, 1.0], [73, 0, 1.0], [73, 8, 2.0], [74, 0, 1.0], [74, 1, 3.0], [74, 5, 2.0], [74, 7, 2.0], [74, 8, 1.0], [75, 7, 4.0], [76, 4, 1.0], [77, 0, 1.0], [77, 1, 2.0], [78, 1, 1.0], [79, 4, 1.0], [80, 2, 1.0], [81, 2, 1.0], [82, 0, 14.0], [82, 1, 1.0], [82, 3, 1.0], [82, 8, 1.0], [83, 7, 1.0], [84, 2, 1.0], [85, 3, 1.0], [87, 3, 1.0], [88, 5, 1.0], [89, 1, 1.0], [90, 0, 1.0], [90, 1, 1.0], [90, 2, 3.0], [90, 5, 1.0], [90, 6, 4.0], [90, 7, 1.0], [91, 2, 1.0], [93, 2, 2.0], [93, 3, 6.0], [93, 4, 1.0], [93, 6, 3.0], [94, 2, 1.0], [95, 4, 2.0], [96, 0, 1.0], [97, 8, 1.0], [98, 7, 1.0], [99, 1, 1.0], [99, 8, 2.0], [100, 3, 1.0], [101, 7, 1.0], [102, 0, 1.0], [104, 3, 1.0], [104, 5, 4.0], [105, 6, 1.0], [106, 3, 1.0], [108, 8, 5.0], [110, 4, 1.0], [111, 7, 1.0], [112, 4, 1.0], [113, 5, 1.0], [114, 4, 1.0], [115, 0, 1.0], [116, 2, 1.0], [116, 3, 1.0], [117, 3, 1.0], [117, 4, 1.0], [117, 7, 1.0], [118, 3, 1.0], [119, 2, 1.0], [120, 1, 1.0], [120, 8, 2.0], [121, 0, 1.0], [121, 6, 1.0], [122, 6, 1.0], [123, 6, 2.0], [124, 0, 1.0], [124, 6, 1.0], [125, 4, 1.0], [127, 7, 1.0], [128, 4, 1.0], [129, 2, 2.0], [129, 4, 2.0], [129, 6, 2.0], [130, 2, 1.0], [130, 5, 1.0], [130, 6, 1.0], [131, 5, 1.0], [132, 5, 1.0], [133, 4, 1.0], [134, 1, 1.0], [135, 2, 1.0], [137, 8, 1.0], [138, 8, 1.0], [139, 4, 1.0], [140, 7, 1.0], [141, 3, 1.0], [143, 7, 1.0], [144, 2, 1.0], [145, 1, 1.0], [146, 1, 1.0], [146, 3, 5.0], [148, 1, 2.0], [148, 3, 1.0], [148, 4, 3.0], [148, 6, 7.0], [151, 0, 2.0], [151, 1, 5.0], [151, 3, 1.0], [153, 5, 1.0], [154, 0, 1.0], [155, 8, 1.0], [156, 3, 1.0], [158, 1, 1.0], [159, 7, 1.0], [160, 7, 2.0], [161, 6, 2.0], [163, 0, 1.0], [163, 1, 1.0], [164, 1, 1.0], [165, 2, 12.0], [165, 3, 1.0], [165, 4, 14.0], [165, 6, 1.0], [166, 2, 4.0], [166, 4, 5.0], [166, 5, 2.0], [167, 1, 1.0], [168, 5, 1.0], [169, 2, 4.0], [169, 4, 2.0], [169, 6, 3.0], [170, 5, 1.0], [171, 7, 1.0], [172, 1, 1.0], [173, 0, 1.0], [174, 5, 1.0], [175, 0, 1.0], [175, 8, 1.0], [176, 8, 1.0], [177, 4, 1.0], [177, 5, 8.0], [178, 8, 2.0], [179, 7, 1.0], [180, 3, 1.0], [181, 5, 8.0], [181, 7, 1.0], [182, 0, 2.0], [182, 5, 3.0], [183, 3, 1.0], [184, 3, 1.0], [185, 7, 2.0], [186, 1, 1.0], [187, 6, 1.0], [188, 0, 1.0], [188, 1, 1.0], [188, 3, 1.0], [188, 7, 1.0], [189, 5, 1.0], [190, 1, 1.0], [191, 4, 1.0], [191, 5, 1.0], [192, 2, 1.0], [193, 2, 1.0], [194, 2, 1.0], [195, 2, 2.0], [196, 2, 1.0], [197, 2, 1.0], [198, 2, 1.0], [198, 6, 1.0], [199, 7, 1.0], [200, 7, 1.0], [201, 1, 2.0], [201, 8, 1.0], [202, 3, 4.0], [202, 4, 1.0], [202, 7, 1.0], [203, 2, 8.0], [203, 4, 23.0], [203, 6, 1.0], [204, 7, 1.0], [205, 1, 1.0], [206, 2, 1.0], [207, 0, 1.0], [208, 0, 1.0], [209, 2, 2.0], [210, 3, 1.0], [211, 8, 10.0], [212, 3, 2.0], [213, 8, 1.0], [214, 4, 1.0], [214, 7, 4.0], [215, 0, 1.0], [216, 2, 1.0], [217, 1, 4.0], [217, 5, 2.0], [218, 1, 1.0], [218, 7, 2.0], [219, 1, 1.0], [219, 2, 2.0], [220, 6, 1.0], [221, 3, 4.0], [222, 3, 1.0], [223, 1, 1.0], [223, 2, 1.0], [224, 0, 1.0], [225, 3, 1.0], [225, 4, 1.0], [225, 6, 2.0], [226, 4, 1.0], [227, 2, 1.0], [227, 3, 1.0], [227, 4, 1.0], [228, 4, 1.0], [228, 6, 3.0], [229, 4, 2.0], [231, 7, 2.0], [232, 3, 4.0], [232, 4, 1.0], [232, 5, 12.0], [232, 7, 17.0], [233, 1, 1.0], [234, 0, 1.0], [235, 1, 1.0], [235, 8, 2.0], [236, 3, 1.0], [236, 4, 1.0], [238, 1, 1.0], [239, 4, 1.0], [240, 3, 1.0], [243, 1, 1.0], [244, 4, 1.0], [245, 7, 1.0], [246, 0, 2.0], [246, 1, 2.0], [246, 7, 5.0], [247, 7, 1.0], [248, 7, 1.0], [249, 7, 1.0], [249, 8, 1.0], [250, 5, 1.0], [251, 2, 1.0], [251, 4, 1.0], [252, 5, 1.0], [253, 5, 1.0], [255, 1, 1.0], [256, 3, 2.0], [257, 7, 1.0], [258, 1, 1.0], [259, 2, 1.0], [260, 1, 1.0], [262, 4, 1.0], [263, 0, 1.0], [264, 2, 1.0], [265, 0, 1.0], [265, 8, 1.0], [267, 7, 1.0], [268, 5, 1.0], [268, 6, 1.0], [269, 0, 1.0], [270, 1, 2.0], [270, 4, 1.0], [271, 4, 1.0], [271, 6, 1.0], [272, 6, 1.0], [273, 0, 1.0], [273, 2, 3.0], [273, 3, 1.0], [273, 4, 1.0], [273, 6, 5.0], [274, 0, 1.0], [275, 2, 2.0], [276, 7, 1.0], [277, 2, 1.0], [278, 1, 2.0], [278, 7, 5.0], [279, 3, 1.0], [280, 1, 1.0], [282, 5, 1.0], [283, 8, 4.0], [284, 6, 1.0], [284, 8, 1.0], [285, 8, 1.0], [286, 5, 1.0], [287, 3, 1.0], [288, 2, 2.0], [290, 3, 1.0], [292, 0, 2.0], [294, 7, 1.0], [295, 3, 1.0], [296, 1, 1.0], [297, 1, 1.0], [298, 1, 1.0], [298, 7, 1.0], [299, 6, 1.0], [300, 3, 1.0], [301, 2, 1.0], [302, 7, 1.0], [304, 5, 5.0], [305, 7, 1.0], [306, 2, 2.0], [306, 4, 1.0], [306, 7, 4.0], [307, 1, 1.0], [308, 7, 1.0], [309, 6, 1.0], [310, 3, 2.0], [311, 1, 1.0], [313, 1, 1.0], [314, 2, 4.0], [314, 3, 12.0], [314, 4, 8.0], [314, 5, 2.0], [314, 6, 11.0], [315, 0, 1.0], [315, 8, 1.0], [316, 8, 1.0], [317, 8, 1.0], [318, 2, 1.0], [318, 3, 1.0], [318, 4, 2.0], [319, 8, 1.0], [320, 3, 1.0], [321, 2, 1.0], [322, 7, 1.0], [323, 2, 1.0], [324, 0, 1.0], [325, 0, 1.0], [326, 2, 1.0], [326, 4, 1.0], [327, 7, 1.0], [328, 7, 1.0], [329, 4, 1.0], [330, 7, 1.0], [331, 6, 1.0], [332, 2, 1.0], [332, 4, 1.0], [333, 2, 1.0], [334, 7, 1.0], [335, 2, 2.0], [336, 7, 1.0], [337, 1, 1.0], [339, 5, 1.0], [340, 1, 1.0], [341, 0, 1.0], [342, 0, 3.0], [342, 5, 1.0], [342, 6, 1.0], [343, 0, 1.0], [343, 2, 1.0], [344, 1, 1.0], [346, 8, 1.0], [347, 0, 2.0], [347, 4, 1.0], [347, 5, 2.0], [347, 8, 1.0], [348, 7, 1.0], [349, 5, 2.0], [350, 1, 1.0], [350, 3, 6.0], [350, 6, 2.0], [351, 3, 1.0], [352, 3, 1.0], [353, 5, 1.0], [354, 8, 1.0], [355, 3, 1.0], [355, 4, 1.0], [355, 5, 2.0], [355, 6, 1.0], [356, 8, 1.0], [357, 7, 1.0], [357, 8, 1.0], [358, 1, 1.0], [359, 5, 1.0], [359, 8, 1.0], [360, 1, 1.0], [361, 1, 1.0], [362, 8, 2.0], [363, 1, 1.0], [364, 8, 1.0], [365, 8, 1.0], [366, 6, 1.0], [367, 6, 1.0], [368, 6, 1.0], [369, 7, 1.0], [370, 1, 4.0], [370, 2, 2.0], [370, 3, 3.0], [370, 4, 1.0], [370, 6, 2.0], [370, 7, 2.0], [370, 8, 1.0], [371, 1, 1.0], [372, 3, 2.0], [373, 1, 1.0], [374, 1, 1.0], [376, 8, 1.0], [377, 4, 1.0], [378, 0, 2.0], [378, 1, 5.0], [378, 7, 3.0], [378, 8, 8.0], [379, 0, 3.0], [379, 1, 4.0], [379, 3, 1.0], [379, 4, 2.0], [379, 6, 16.0], [379, 8, 15.0], [380, 2, 1.0], [381, 2, 1.0], [382, 3, 1.0], [383, 6, 2.0], [383, 7, 1.0], [384, 2, 1.0], [385, 4, 1.0], [387, 1, 1.0], [387, 2, 1.0], [388, 2, 1.0], [389, 2, 1.0], [391, 8, 1.0], [392, 2, 2.0], [392, 5, 1.0], [392, 6, 15.0], [392, 8, 2.0], [393, 0, 1.0], [393, 2, 1.0], [394, 2, 1.0], [396, 2, 1.0], [396, 6, 1.0], [397, 0, 3.0], [397, 1, 1.0], [397, 2, 2.0], [397, 5, 6.0], [397, 7, 1.0], [398, 7, 1.0], [399, 8, 2.0], [400, 0, 3.0], [400, 2, 2.0], [400, 3, 1.0], [400, 5, 3.0], [400, 6, 2.0], [400, 8, 2.0], [401, 8, 1.0], [402, 6, 1.0], [403, 4, 1.0], [405, 3, 1.0], [406, 0, 1.0], [406, 1, 1.0], [406, 2, 1.0], [406, 3, 1.0], [406, 6, 2.0], [406, 8, 1.0], [407, 8, 1.0], [408, 8, 4.0], [409, 0, 1.0], [410, 3, 7.0], [410, 8, 1.0], [411, 0, 1.0], [411, 6, 1.0], [413, 0, 1.0], [414, 0, 1.0], [414, 1, 7.0], [414, 8, 7.0], [415, 6, 1.0], [416, 2, 1.0], [416, 3, 3.0], [418, 0, 1.0]], "columns": [{"id": "PC.636", "metadata": null}, {"id": "PC.635", "metadata": null}, {"id": "PC.356", "metadata": null}, {"id": "PC.481", "metadata": null}, {"id": "PC.354", "metadata": null}, {"id": "PC.593", "metadata": null}, {"id": "PC.355", "metadata": null}, {"id": "PC.607", "metadata": null}, {"id": "PC.634", "metadata": null}], "generated_by": "", "matrix_type": "sparse", "shape": [419, 9], "format_url": "http://biom-format.org", "date": "2012-10-30T17:33:56.984100", "type": "OTU table", "id": null, "matrix_element_type": "float"}"""
-expected_biom_object_f = """{"rows": [{"id": "0", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "1", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "2", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "3", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "4", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "5", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "6", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "7", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "8", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "9", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "10", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "11", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "12", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "13", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "14", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "15", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Streptococcaceae", "Streptococcus"]}}, {"id": "16", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "17", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "18", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "19", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "20", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "21", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "22", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "23", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "24", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "25", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "26", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "27", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "28", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "29", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "30", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "31", "metadata": {"taxonomy": ["Bacteria", "TM7", "TM7_genera_incertae_sedis"]}}, {"id": "32", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "33", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "34", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "35", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria"]}}, {"id": "36", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "37", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "38", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "39", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Olsenella"]}}, {"id": "40", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "41", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "42", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "43", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "44", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "45", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "46", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "47", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "48", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "49", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "50", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "51", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "52", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "53", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "54", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "55", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "56", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "57", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "58", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "59", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "60", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "61", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "62", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "63", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "64", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "65", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "66", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "67", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "68", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Dorea"]}}, {"id": "69", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "70", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "71", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "72", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "73", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "74", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "75", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "76", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Coprobacillus"]}}, {"id": "77", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "78", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "79", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "80", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "81", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "82", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "83", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "84", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "85", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "86", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "87", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "88", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "89", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "90", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "91", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "92", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "93", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "94", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "95", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "96", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "97", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "98", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "99", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "100", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "101", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "102", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "103", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "104", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "105", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "106", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "107", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "108", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "109", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "110", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "111", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "112", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "113", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "114", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "115", "metadata": {"taxonomy": ["Bacteria", "Deferribacteres", "Deferribacteres", "Deferribacterales", "Deferribacteraceae", "Mucispirillum"]}}, {"id": "116", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "117", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "118", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "119", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "120", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "121", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "122", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "123", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "124", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Marvinbryantia"]}}, {"id": "125", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "126", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "127", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "128", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "129", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "130", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "131", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "132", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "133", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "134", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "135", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "136", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "137", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "138", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "139", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "140", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "141", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "142", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "143", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "144", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "145", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "146", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "147", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "148", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "149", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "150", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "151", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "152", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "153", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "154", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "155", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "156", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "157", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "158", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "159", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "160", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "161", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "162", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "163", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "164", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "165", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "166", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "167", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "168", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "169", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "170", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "171", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "172", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "173", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "174", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "175", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "176", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "177", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "178", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "179", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "180", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "181", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "182", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "183", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "184", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "185", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "186", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "187", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "188", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "189", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "190", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "191", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "192", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "193", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "194", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "195", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Acetanaerobacterium"]}}, {"id": "196", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "197", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "198", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "199", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "200", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "201", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Butyricimonas"]}}, {"id": "202", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "203", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "204", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "205", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "206", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "207", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "208", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "209", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "210", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "211", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "212", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "213", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "214", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "215", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "216", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "217", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "218", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "219", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "220", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "221", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "222", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "223", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "224", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "225", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "226", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "227", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "228", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "229", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "230", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "231", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "232", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "233", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "234", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "235", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "236", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "237", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "238", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "239", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "240", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "241", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "242", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "243", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "244", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "245", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "246", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "247", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "248", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "249", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "250", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "251", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "252", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "253", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "254", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "255", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "256", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "257", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "258", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "259", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "260", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Prevotellaceae"]}}, {"id": "261", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "262", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "263", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "264", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "265", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "266", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales"]}}, {"id": "267", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria"]}}, {"id": "268", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "269", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "270", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Ruminococcus"]}}, {"id": "271", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "272", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "273", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "274", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae", "Asaccharobacter"]}}, {"id": "275", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "276", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "277", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "278", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "279", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "280", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "281", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "282", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "283", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "284", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "285", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "286", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "287", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "288", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "289", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "290", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "291", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "292", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Bacillales", "Staphylococcaceae", "Staphylococcus"]}}, {"id": "293", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "294", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "295", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "296", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "297", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "298", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "299", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "300", "metadata": {"taxonomy": ["Bacteria", "Actinobacteria", "Actinobacteria", "Coriobacteriales", "Coriobacteriaceae"]}}, {"id": "301", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "302", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "303", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "304", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Epsilonproteobacteria", "Campylobacterales", "Helicobacteraceae", "Helicobacter"]}}, {"id": "305", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "306", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "307", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "308", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "309", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "310", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "311", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "312", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Carnobacteriaceae"]}}, {"id": "313", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "314", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "315", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "316", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "317", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "318", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "319", "metadata": {"taxonomy": ["Bacteria", "Verrucomicrobia", "Verrucomicrobiae", "Verrucomicrobiales", "Verrucomicrobiaceae", "Akkermansia"]}}, {"id": "320", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "321", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "322", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "323", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "324", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "325", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "326", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "327", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "328", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "329", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "330", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "331", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "332", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "333", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "334", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "335", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "336", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "337", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "338", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "339", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "340", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "341", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "342", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "343", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "344", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "345", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "346", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia"]}}, {"id": "347", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "348", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "349", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "350", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "351", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "352", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "353", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "354", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "355", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Bacilli", "Lactobacillales", "Lactobacillaceae", "Lactobacillus"]}}, {"id": "356", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII", "Anaerovorax"]}}, {"id": "357", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIII"]}}, {"id": "358", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "359", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "360", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "361", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "362", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Clostridiaceae", "Clostridium"]}}, {"id": "363", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "364", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "365", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "366", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "367", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "368", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "369", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "370", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "371", "metadata": {"taxonomy": ["Bacteria", "Proteobacteria", "Deltaproteobacteria"]}}, {"id": "372", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "373", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "374", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "375", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "376", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae", "Roseburia"]}}, {"id": "377", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "378", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Rikenellaceae", "Alistipes"]}}, {"id": "379", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Bacteroidaceae", "Bacteroides"]}}, {"id": "380", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "381", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "382", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "383", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "384", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae", "Oscillibacter"]}}, {"id": "385", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "386", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "387", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "388", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "389", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Incertae Sedis XIV", "Blautia"]}}, {"id": "390", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "391", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "392", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "393", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Ruminococcaceae"]}}, {"id": "394", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "395", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "396", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "397", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "398", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "399", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes", "Bacteroidia", "Bacteroidales", "Porphyromonadaceae", "Parabacteroides"]}}, {"id": "400", "metadata": {"taxonomy": ["Bacteria", "Bacteroidetes"]}}, {"id": "401", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "402", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "403", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "404", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "405", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "406", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "407", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "408", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "409", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "410", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Erysipelotrichi", "Erysipelotrichales", "Erysipelotrichaceae", "Turicibacter"]}}, {"id": "411", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "412", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "413", "metadata": {"taxonomy": ["Bacteria", "Firmicutes"]}}, {"id": "414", "metadata": {"taxonomy": ["Bacteria"]}}, {"id": "415", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "416", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}, {"id": "417", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales"]}}, {"id": "418", "metadata": {"taxonomy": ["Bacteria", "Firmicutes", "Clostridia", "Clostridiales", "Lachnospiraceae"]}}], "format": "Biological Observation Matrix 1.0.0", "data": [[0, 0, 1.0], [1, 1, 1.0], [2, 0, 1.0], [3, 2, 1.0], [4, 3, 1.0], [5, 0, 1.0], [6, 4, 1.0], [7, 3, 1.0], [8, 0, 1.0], [8, 1, 1.0], [8, 2, 1.0], [8, 4, 1.0], [9, 5, 1.0], [10, 3, 1.0], [11, 1, 1.0], [11, 3, 1.0], [12, 6, 1.0], [13, 4, 2.0], [13, 6, 1.0], [14, 1, 1.0], [14, 2, 1.0], [15, 7, 1.0], [16, 1, 1.0], [17, 8, 1.0], [18, 8, 1.0], [19, 2, 1.0], [20, 8, 1.0], [21, 3, 1.0], [21, 4, 1.0], [22, 7, 1.0], [23, 7, 1.0], [24, 1, 2.0], [25, 3, 1.0], [26, 1, 1.0], [27, 7, 2.0], [28, 0, 1.0], [29, 8, 1.0], [30, 1, 1.0], [31, 8, 2.0], [32, 1, 1.0], [32, 3, 1.0], [33, 8, 1.0], [34, 1, 1.0], [34, 2, 1.0], [35, 1, 1.0], [36, 7, 1.0], [37, 3, 3.0], [38, 7, 1.0], [39, 7, 2.0], [40, 6, 1.0], [41, 3, 1.0], [41, 7, 2.0], [42, 3, 1.0], [42, 4, 1.0], [43, 7, 1.0], [44, 5, 1.0], [45, 4, 15.0], [45, 5, 9.0], [46, 0, 6.0], [46, 1, 1.0], [46, 7, 3.0], [46, 8, 2.0], [47, 3, 1.0], [48, 7, 1.0], [49, 5, 1.0], [50, 4, 1.0], [51, 5, 1.0], [52, 3, 1.0], [53, 1, 1.0], [53, 3, 1.0], [53, 6, 2.0], [54, 0, 33.0], [54, 1, 9.0], [54, 3, 1.0], [54, 8, 3.0], [55, 5, 1.0], [56, 0, 5.0], [56, 1, 4.0], [56, 2, 1.0], [56, 3, 2.0], [56, 4, 1.0], [56, 5, 1.0], [56, 6, 3.0], [56, 7, 8.0], [56, 8, 2.0], [57, 5, 1.0], [58, 0, 1.0], [59, 0, 1.0], [59, 1, 1.0], [59, 2, 10.0], [59, 3, 2.0], [59, 4, 2.0], [59, 5, 24.0], [59, 6, 1.0], [60, 3, 1.0], [61, 2, 1.0], [62, 7, 1.0], [63, 2, 1.0], [64, 6, 1.0], [65, 7, 1.0], [66, 1, 1.0], [67, 3, 1.0], [68, 3, 1.0], [69, 6, 1.0], [70, 7, 1.0], [72, 0, 2.0], [72, 1, 3.0], [72, 8, 2.0], [73, 0, 1.0], [73, 8, 2.0], [74, 0, 1.0], [74, 1, 4.0], [74, 5, 2.0], [74, 7, 2.0], [74, 8, 1.0], [75, 7, 5.0], [76, 4, 1.0], [77, 0, 2.0], [77, 1, 2.0], [78, 1, 1.0], [79, 4, 1.0], [80, 2, 1.0], [81, 2, 1.0], [82, 0, 19.0], [82, 1, 2.0], [82, 3, 1.0], [82, 8, 1.0], [83, 7, 1.0], [84, 2, 1.0], [85, 3, 1.0], [86, 3, 1.0], [87, 3, 1.0], [88, 5, 1.0], [89, 1, 1.0], [90, 0, 1.0], [90, 1, 2.0], [90, 2, 4.0], [90, 5, 1.0], [90, 6, 4.0], [90, 7, 2.0], [91, 2, 1.0], [92, 2, 1.0], [93, 2, 2.0], [93, 3, 6.0], [93, 4, 1.0], [93, 6, 4.0], [95, 4, 2.0], [96, 0, 1.0], [97, 8, 1.0], [98, 7, 1.0], [99, 1, 1.0], [99, 3, 1.0], [99, 8, 3.0], [100, 3, 1.0], [101, 7, 1.0], [102, 0, 1.0], [103, 0, 1.0], [104, 3, 1.0], [104, 5, 3.0], [105, 6, 1.0], [106, 3, 1.0], [107, 6, 1.0], [108, 8, 4.0], [109, 8, 1.0], [110, 4, 1.0], [111, 7, 1.0], [113, 5, 1.0], [114, 4, 1.0], [115, 0, 1.0], [116, 2, 1.0], [116, 3, 1.0], [117, 3, 1.0], [117, 4, 1.0], [118, 3, 1.0], [119, 2, 1.0], [120, 1, 1.0], [120, 8, 2.0], [121, 0, 1.0], [121, 6, 1.0], [122, 6, 1.0], [123, 2, 1.0], [123, 4, 1.0], [123, 6, 3.0], [124, 0, 1.0], [124, 6, 1.0], [125, 4, 1.0], [126, 1, 1.0], [126, 2, 1.0], [127, 7, 1.0], [128, 4, 1.0], [129, 2, 2.0], [129, 4, 2.0], [129, 6, 2.0], [130, 2, 1.0], [130, 5, 1.0], [130, 6, 1.0], [131, 5, 1.0], [132, 5, 1.0], [133, 4, 1.0], [134, 1, 1.0], [135, 2, 1.0], [135, 4, 1.0], [136, 1, 1.0], [136, 4, 1.0], [137, 8, 1.0], [138, 8, 1.0], [139, 4, 1.0], [140, 7, 1.0], [141, 3, 1.0], [142, 1, 1.0], [143, 7, 1.0], [144, 2, 1.0], [145, 1, 1.0], [146, 1, 1.0], [146, 3, 6.0], [147, 7, 1.0], [148, 1, 2.0], [148, 3, 2.0], [148, 4, 4.0], [148, 6, 9.0], [149, 0, 1.0], [150, 1, 1.0], [151, 0, 2.0], [151, 1, 5.0], [151, 3, 1.0], [151, 8, 1.0], [152, 2, 1.0], [153, 5, 1.0], [154, 0, 1.0], [155, 8, 1.0], [156, 1, 1.0], [156, 3, 1.0], [157, 8, 1.0], [158, 1, 1.0], [160, 7, 2.0], [161, 6, 2.0], [162, 6, 1.0], [163, 0, 1.0], [163, 1, 1.0], [164, 0, 1.0], [165, 2, 13.0], [165, 3, 1.0], [165, 4, 14.0], [165, 6, 1.0], [166, 2, 3.0], [166, 4, 5.0], [166, 5, 2.0], [167, 1, 1.0], [168, 5, 1.0], [169, 2, 8.0], [169, 4, 2.0], [169, 5, 1.0], [169, 6, 3.0], [170, 5, 1.0], [171, 7, 1.0], [173, 0, 1.0], [174, 5, 1.0], [175, 0, 1.0], [175, 8, 1.0], [176, 8, 1.0], [177, 4, 1.0], [177, 5, 9.0], [178, 8, 2.0], [179, 7, 1.0], [180, 3, 1.0], [181, 5, 7.0], [181, 7, 1.0], [182, 0, 2.0], [182, 5, 4.0], [183, 3, 1.0], [184, 3, 1.0], [185, 7, 2.0], [186, 1, 1.0], [187, 6, 1.0], [188, 0, 1.0], [188, 1, 1.0], [188, 3, 1.0], [188, 7, 1.0], [189, 5, 1.0], [190, 1, 1.0], [191, 4, 1.0], [191, 5, 1.0], [192, 2, 1.0], [193, 2, 1.0], [194, 2, 1.0], [195, 2, 2.0], [196, 2, 1.0], [197, 2, 1.0], [198, 6, 2.0], [199, 7, 1.0], [200, 7, 1.0], [201, 1, 3.0], [202, 3, 5.0], [202, 4, 2.0], [202, 6, 1.0], [202, 7, 1.0], [203, 2, 10.0], [203, 4, 27.0], [203, 6, 1.0], [204, 7, 1.0], [205, 1, 1.0], [207, 0, 1.0], [208, 0, 1.0], [209, 2, 2.0], [210, 3, 1.0], [211, 8, 13.0], [212, 3, 2.0], [213, 8, 1.0], [214, 4, 1.0], [214, 7, 4.0], [215, 0, 1.0], [216, 2, 1.0], [217, 1, 5.0], [217, 5, 2.0], [218, 7, 1.0], [219, 1, 1.0], [219, 2, 1.0], [220, 6, 1.0], [221, 3, 3.0], [222, 3, 1.0], [223, 1, 1.0], [223, 2, 1.0], [223, 7, 1.0], [224, 0, 1.0], [225, 3, 1.0], [225, 4, 2.0], [225, 6, 2.0], [226, 2, 1.0], [226, 4, 1.0], [227, 2, 1.0], [227, 3, 1.0], [227, 4, 1.0], [228, 3, 1.0], [228, 4, 1.0], [228, 6, 4.0], [229, 4, 3.0], [230, 7, 1.0], [231, 7, 2.0], [232, 3, 5.0], [232, 4, 1.0], [232, 5, 16.0], [232, 7, 19.0], [233, 1, 1.0], [234, 0, 1.0], [235, 1, 1.0], [235, 8, 2.0], [236, 3, 1.0], [236, 4, 1.0], [237, 7, 1.0], [238, 1, 1.0], [239, 4, 1.0], [240, 3, 1.0], [242, 8, 1.0], [243, 1, 1.0], [244, 4, 1.0], [245, 7, 1.0], [246, 0, 1.0], [246, 1, 2.0], [246, 7, 7.0], [247, 1, 1.0], [247, 7, 1.0], [248, 7, 1.0], [249, 7, 1.0], [249, 8, 1.0], [250, 5, 1.0], [251, 2, 1.0], [251, 4, 1.0], [252, 5, 1.0], [253, 5, 1.0], [254, 3, 1.0], [255, 1, 1.0], [256, 3, 2.0], [257, 3, 1.0], [257, 7, 1.0], [258, 1, 1.0], [259, 2, 1.0], [260, 1, 1.0], [261, 3, 1.0], [262, 4, 1.0], [263, 0, 1.0], [265, 0, 1.0], [265, 8, 1.0], [266, 2, 1.0], [267, 7, 1.0], [268, 5, 1.0], [268, 6, 1.0], [269, 0, 1.0], [270, 1, 1.0], [270, 4, 1.0], [271, 2, 1.0], [271, 4, 1.0], [271, 6, 1.0], [272, 4, 1.0], [272, 6, 1.0], [273, 0, 1.0], [273, 2, 3.0], [273, 3, 2.0], [273, 4, 1.0], [273, 6, 5.0], [274, 0, 1.0], [275, 2, 2.0], [276, 7, 1.0], [277, 2, 1.0], [278, 1, 3.0], [278, 7, 6.0], [279, 3, 1.0], [280, 1, 1.0], [281, 6, 1.0], [282, 5, 1.0], [283, 8, 5.0], [284, 6, 1.0], [285, 8, 1.0], [286, 5, 1.0], [287, 3, 1.0], [288, 2, 2.0], [288, 4, 1.0], [289, 6, 1.0], [290, 3, 1.0], [291, 7, 1.0], [292, 0, 2.0], [294, 7, 1.0], [295, 3, 1.0], [296, 1, 1.0], [297, 1, 1.0], [298, 1, 1.0], [298, 7, 1.0], [300, 3, 1.0], [301, 2, 1.0], [302, 7, 1.0], [303, 2, 2.0], [304, 5, 5.0], [304, 7, 1.0], [305, 7, 1.0], [306, 2, 2.0], [306, 4, 1.0], [306, 7, 6.0], [307, 1, 1.0], [308, 7, 1.0], [309, 6, 1.0], [310, 3, 2.0], [311, 1, 1.0], [312, 0, 1.0], [313, 1, 1.0], [314, 2, 5.0], [314, 3, 11.0], [314, 4, 9.0], [314, 5, 2.0], [314, 6, 12.0], [315, 0, 1.0], [315, 1, 1.0], [315, 8, 1.0], [316, 8, 1.0], [317, 8, 1.0], [318, 2, 2.0], [318, 3, 1.0], [318, 4, 2.0], [319, 8, 1.0], [320, 3, 1.0], [321, 2, 1.0], [322, 7, 1.0], [323, 2, 1.0], [324, 0, 1.0], [325, 0, 1.0], [326, 2, 1.0], [328, 7, 1.0], [329, 4, 1.0], [330, 7, 1.0], [331, 6, 1.0], [332, 2, 1.0], [332, 4, 1.0], [333, 2, 1.0], [334, 7, 1.0], [335, 2, 2.0], [336, 7, 1.0], [337, 1, 1.0], [338, 1, 1.0], [339, 5, 2.0], [340, 1, 1.0], [341, 0, 1.0], [342, 0, 2.0], [342, 3, 1.0], [342, 5, 1.0], [342, 6, 1.0], [343, 0, 2.0], [343, 1, 1.0], [343, 2, 1.0], [344, 1, 1.0], [345, 0, 1.0], [346, 8, 1.0], [347, 0, 2.0], [347, 4, 1.0], [347, 5, 2.0], [347, 8, 2.0], [348, 7, 1.0], [349, 5, 3.0], [350, 1, 2.0], [350, 3, 7.0], [350, 6, 2.0], [351, 3, 1.0], [352, 3, 1.0], [353, 5, 1.0], [354, 8, 1.0], [355, 3, 1.0], [355, 4, 1.0], [355, 5, 4.0], [355, 6, 1.0], [356, 8, 1.0], [357, 7, 1.0], [357, 8, 1.0], [358, 1, 1.0], [359, 5, 1.0], [359, 8, 1.0], [360, 1, 1.0], [361, 1, 1.0], [362, 6, 1.0], [362, 8, 3.0], [363, 1, 1.0], [364, 8, 1.0], [365, 8, 1.0], [366, 6, 1.0], [367, 6, 1.0], [368, 6, 1.0], [369, 7, 1.0], [370, 1, 5.0], [370, 2, 2.0], [370, 3, 4.0], [370, 4, 1.0], [370, 6, 2.0], [370, 7, 5.0], [370, 8, 1.0], [371, 1, 1.0], [372, 3, 2.0], [373, 1, 1.0], [374, 1, 1.0], [375, 7, 1.0], [376, 8, 1.0], [377, 4, 1.0], [378, 0, 3.0], [378, 1, 5.0], [378, 7, 4.0], [378, 8, 9.0], [379, 0, 4.0], [379, 1, 4.0], [379, 3, 1.0], [379, 4, 2.0], [379, 6, 17.0], [379, 8, 21.0], [380, 2, 1.0], [381, 2, 1.0], [382, 3, 1.0], [383, 6, 2.0], [383, 7, 1.0], [385, 2, 1.0], [385, 4, 1.0], [386, 2, 1.0], [387, 2, 1.0], [388, 2, 1.0], [389, 2, 1.0], [390, 2, 1.0], [391, 8, 1.0], [392, 2, 2.0], [392, 5, 2.0], [392, 6, 17.0], [392, 8, 2.0], [393, 0, 1.0], [393, 2, 1.0], [395, 3, 1.0], [396, 2, 1.0], [396, 6, 2.0], [397, 0, 3.0], [397, 1, 1.0], [397, 2, 2.0], [397, 5, 9.0], [397, 6, 1.0], [397, 7, 1.0], [397, 8, 1.0], [398, 7, 1.0], [399, 8, 2.0], [400, 0, 3.0], [400, 2, 3.0], [400, 5, 4.0], [400, 6, 1.0], [400, 8, 5.0], [402, 6, 1.0], [403, 4, 1.0], [404, 6, 1.0], [405, 3, 1.0], [406, 0, 1.0], [406, 1, 1.0], [406, 2, 1.0], [406, 3, 2.0], [406, 6, 2.0], [406, 8, 1.0], [407, 8, 1.0], [408, 8, 4.0], [409, 0, 1.0], [410, 3, 9.0], [410, 8, 3.0], [411, 0, 1.0], [411, 6, 1.0], [412, 7, 1.0], [413, 0, 1.0], [414, 0, 2.0], [414, 1, 10.0], [414, 8, 7.0], [415, 6, 1.0], [416, 2, 1.0], [416, 3, 3.0], [417, 6, 1.0], [418, 0, 1.0]], "columns": [{"id": "PC.636", "metadata": null}, {"id": "PC.635", "metadata": null}, {"id": "PC.356", "metadata": null}, {"id": "PC.481", "metadata": null}, {"id": "PC.354", "metadata": null}, {"id": "PC.593", "metadata": null}, {"id": "PC.355", "metadata": null}, {"id": "PC.607", "metadata": null}, {"id": "PC.634", "metadata": null}], "generated_by": "", "matrix_type": "sparse", "shape": [419, 9], "format_url": "http://biom-format.org", "date": "2012-10-30T17:33:57.005005", "type": "OTU table", "id": null, "matrix_element_type": "float"}"""
-
-expected_alpha_rarefactions_a = {
-'PD_whole_tree':
-(['', 'sequences per sample', 'iteration', 'PC.636', 'PC.635', 'PC.356', 'PC.481', 'PC.354', 'PC.593', 'PC.355', 'PC.607', 'PC.634'], [],
-['alpha_rare_35_0', 'alpha_rare_61_0', 'alpha_rare_87_0', 'alpha_rare_113_0', 'alpha_rare_139_0'],
-[[35.0, 0.0, 0.0, 0.35141, 0.0, 0.0, 0.0, 0.39377, 0.0, 0.43807, 0.50754],
-[61.0, 0.0, 0.24824, 0.82451, 0.31106, 0.31106, 0.71268, 0.0, 0.74307, 1.09737, 0.24824],
-[87.0, 0.0, 0.45215, 0.40482, 0.49359, 0.31106, 0.59119, 0.39377, 0.47893, 0.88743, 0.54092],
-[113.0, 0.0, 0.45215, 0.96624, 0.31106, 0.42776, 0.49456, 0.39377, 0.74307, 1.2611, 0.59404],
-[139.0, 0.0, 0.45215, 1.12877, 0.49359, 0.43955, 0.85626, 0.39377, 0.74307, 1.41118, 0.80022]]),
-
-'observed_species':
-(['', 'sequences per sample', 'iteration', 'PC.636', 'PC.635', 'PC.356', 'PC.481', 'PC.354', 'PC.593', 'PC.355', 'PC.607', 'PC.634'], [],
-['alpha_rare_35_0', 'alpha_rare_61_0', 'alpha_rare_87_0', 'alpha_rare_113_0', 'alpha_rare_139_0'],
-[[35.0, 0.0, 22.0, 29.0, 25.0, 28.0, 22.0, 18.0, 24.0, 25.0, 26.0],
-[61.0, 0.0, 30.0, 43.0, 41.0, 43.0, 35.0, 26.0, 32.0, 41.0, 32.0],
-[87.0, 0.0, 49.0, 56.0, 53.0, 52.0, 45.0, 38.0, 39.0, 51.0, 44.0],
-[113.0, 0.0, 53.0, 71.0, 65.0, 62.0, 49.0, 41.0, 53.0, 64.0, 51.0],
-[139.0, 0.0, 60.0, 86.0, 79.0, 79.0, 62.0, 46.0, 59.0, 76.0, 61.0]]),
-
-'chao1':
-(['', 'sequences per sample', 'iteration', 'PC.636', 'PC.635', 'PC.356', 'PC.481', 'PC.354', 'PC.593', 'PC.355', 'PC.607', 'PC.634'], [],
-['alpha_rare_35_0', 'alpha_rare_61_0', 'alpha_rare_87_0', 'alpha_rare_113_0', 'alpha_rare_139_0'],
-[[35.0, 0.0, 60.25, 104.0, 50.5, 97.0, 52.0, 31.75, 75.0, 120.0, 57.6666666667],
-[61.0, 0.0, 68.5, 118.428571429, 173.0, 113.857142857, 129.5, 60.0, 124.0, 140.2, 109.0],
-[87.0, 0.0, 127.75, 179.0, 155.5, 111.5, 164.0, 98.0, 64.0909090909, 174.5, 91.25],
-[113.0, 0.0, 196.5, 208.8, 277.5, 203.428571429, 166.166666667, 83.8571428571, 116.0, 184.111111111, 125.375],
-[139.0, 0.0, 155.666666667, 324.333333333, 193.0, 250.1, 182.111111111, 100.0, 114.5, 289.875, 131.909090909]])
-}
-
-expected_alpha_rarefactions_b = {
-'PD_whole_tree':
-(['', 'sequences per sample', 'iteration', 'PC.636', 'PC.635', 'PC.356', 'PC.481', 'PC.354', 'PC.593', 'PC.355', 'PC.607', 'PC.634'], [],
-['alpha_rare_35_0', 'alpha_rare_35_1', 'alpha_rare_35_2', 'alpha_rare_61_0', 'alpha_rare_61_1', 'alpha_rare_61_2', 'alpha_rare_87_0', 'alpha_rare_87_1', 'alpha_rare_87_2', 'alpha_rare_113_0', 'alpha_rare_113_1', 'alpha_rare_113_2', 'alpha_rare_139_0', 'alpha_rare_139_1', 'alpha_rare_139_2'],
-[[35.0, 0.0, 0.24824, 0.53921, 0.0, 0.0, 0.4106, 0.0, 0.0, 0.78967, 0.23966],
-[35.0, 1.0, 0.0, 0.53921, 0.0, 0.0, 0.39881, 0.0, 0.43302, 0.43821, 0.33474],
-[35.0, 2.0, 0.24824, 0.0, 0.35141, 0.0, 0.31106, 0.0, 0.0, 0.92879, 0.43529],
-[61.0, 0.0, 0.24824, 0.40482, 0.49359, 0.0, 0.45136, 0.39377, 0.43302, 0.76935, 0.24824],
-[61.0, 1.0, 0.24824, 0.69579, 0.31106, 0.31106, 0.51412, 0.0, 0.0, 0.43807, 0.24824],
-[61.0, 2.0, 0.45215, 0.69319, 0.35141, 0.0, 0.0, 0.0, 0.74307, 1.16541, 0.24824],
-[87.0, 0.0, 0.45215, 0.89779, 0.0, 0.0, 0.84447, 0.39377, 0.47893, 1.05013, 0.80022],
-[87.0, 1.0, 0.24824, 0.98092, 0.35141, 0.31106, 0.56434, 0.39377, 0.74307, 0.50576, 0.54092],
-[87.0, 2.0, 0.45215, 0.84364, 0.49359, 0.31106, 0.84447, 0.39377, 0.47893, 1.16541, 0.33474],
-[113.0, 0.0, 0.45215, 1.06032, 0.49359, 0.42776, 0.73149, 0.0, 0.74307, 1.41118, 0.45442],
-[113.0, 1.0, 0.45215, 0.89779, 0.35141, 0.43955, 0.7629, 0.39377, 0.74307, 1.28333, 0.80022],
-[113.0, 2.0, 0.45215, 0.96624, 0.49359, 0.42776, 0.79425, 0.0, 0.43302, 1.41118, 0.71372],
-[139.0, 0.0, 0.24824, 0.96624, 0.49359, 0.42776, 0.57613, 0.39377, 0.74307, 1.41118, 0.80022],
-[139.0, 1.0, 0.45215, 1.12877, 0.49359, 0.43955, 0.85626, 0.39377, 0.74307, 1.31519, 0.80022],
-[139.0, 2.0, 0.45215, 1.12877, 0.49359, 0.43955, 0.85626, 0.39377, 0.74307, 1.41118, 0.80022]]),
-
-'observed_species': (['', 'sequences per sample', 'iteration', 'PC.636', 'PC.635', 'PC.356', 'PC.481', 'PC.354', 'PC.593', 'PC.355', 'PC.607', 'PC.634'], [],
-['alpha_rare_35_0', 'alpha_rare_35_1', 'alpha_rare_35_2', 'alpha_rare_61_0', 'alpha_rare_61_1', 'alpha_rare_61_2', 'alpha_rare_87_0', 'alpha_rare_87_1', 'alpha_rare_87_2', 'alpha_rare_113_0', 'alpha_rare_113_1', 'alpha_rare_113_2', 'alpha_rare_139_0', 'alpha_rare_139_1', 'alpha_rare_139_2'],
-[[35.0, 0.0, 23.0, 28.0, 30.0, 30.0, 21.0, 20.0, 22.0, 24.0, 25.0],
-[35.0, 1.0, 22.0, 30.0, 25.0, 32.0, 17.0, 20.0, 23.0, 21.0, 23.0],
-[35.0, 2.0, 19.0, 29.0, 27.0, 30.0, 19.0, 20.0, 19.0, 28.0, 26.0],
-[61.0, 0.0, 31.0, 48.0, 44.0, 37.0, 40.0, 25.0, 34.0, 40.0, 38.0],
-[61.0, 1.0, 34.0, 48.0, 46.0, 43.0, 35.0, 27.0, 36.0, 38.0, 31.0],
-[61.0, 2.0, 34.0, 42.0, 44.0, 40.0, 33.0, 26.0, 32.0, 41.0, 38.0],
-[87.0, 0.0, 43.0, 61.0, 52.0, 58.0, 45.0, 37.0, 47.0, 52.0, 48.0],
-[87.0, 1.0, 41.0, 59.0, 58.0, 54.0, 42.0, 34.0, 45.0, 49.0, 41.0],
-[87.0, 2.0, 45.0, 58.0, 57.0, 61.0, 40.0, 33.0, 42.0, 50.0, 49.0],
-[113.0, 0.0, 54.0, 74.0, 67.0, 63.0, 50.0, 39.0, 52.0, 65.0, 51.0],
-[113.0, 1.0, 52.0, 72.0, 69.0, 71.0, 53.0, 38.0, 54.0, 62.0, 51.0],
-[113.0, 2.0, 52.0, 73.0, 63.0, 68.0, 51.0, 41.0, 51.0, 66.0, 53.0],
-[139.0, 0.0, 59.0, 87.0, 79.0, 79.0, 58.0, 43.0, 59.0, 73.0, 61.0],
-[139.0, 1.0, 60.0, 88.0, 78.0, 78.0, 62.0, 47.0, 57.0, 73.0, 58.0],
-[139.0, 2.0, 60.0, 86.0, 78.0, 79.0, 62.0, 47.0, 58.0, 77.0, 61.0]]),
-
-'chao1': (['', 'sequences per sample', 'iteration', 'PC.636', 'PC.635', 'PC.356', 'PC.481', 'PC.354', 'PC.593', 'PC.355', 'PC.607', 'PC.634'], [],
-['alpha_rare_35_0', 'alpha_rare_35_1', 'alpha_rare_35_2', 'alpha_rare_61_0', 'alpha_rare_61_1', 'alpha_rare_61_2', 'alpha_rare_87_0', 'alpha_rare_87_1', 'alpha_rare_87_2', 'alpha_rare_113_0', 'alpha_rare_113_1', 'alpha_rare_113_2', 'alpha_rare_139_0', 'alpha_rare_139_1', 'alpha_rare_139_2'],
-[[35.0, 0.0, 43.0, 91.25, 111.25, 147.0, 61.0, 42.75, 52.0, 87.3333333333, 72.5],
-[35.0, 1.0, 107.5, 111.25, 67.75, 133.5, 33.5, 72.5, 74.0, 56.0, 50.2],
-[35.0, 2.0, 124.0, 84.2, 73.2, 80.0, 124.0, 46.25, 45.0, 78.6, 78.5],
-[61.0, 0.0, 59.875, 263.25, 210.5, 71.5, 227.0, 55.0, 80.0, 102.142857143, 101.0],
-[61.0, 1.0, 223.0, 159.428571429, 202.0, 136.5, 122.75, 61.0, 76.625, 96.0, 69.0],
-[61.0, 2.0, 88.1666666667, 112.857142857, 201.5, 127.0, 108.0, 43.5, 132.0, 129.0, 85.25],
-[87.0, 0.0, 97.375, 169.1, 126.0, 163.111111111, 202.5, 76.4285714286, 109.333333333, 175.5, 174.0],
-[87.0, 1.0, 118.5, 435.0, 144.0, 171.142857143, 182.25, 47.6, 150.6, 160.0, 71.6666666667],
-[87.0, 2.0, 144.166666667, 212.428571429, 339.0, 181.111111111, 205.333333333, 103.0, 108.428571429, 120.0, 111.333333333],
-[113.0, 0.0, 151.5, 416.2, 226.375, 192.375, 145.142857143, 81.1666666667, 100.0, 182.6, 126.428571429],
-[113.0, 1.0, 147.142857143, 328.666666667, 206.8, 230.0, 135.333333333, 93.2, 111.272727273, 191.375, 97.5],
-[113.0, 2.0, 152.428571429, 309.142857143, 157.090909091, 174.909090909, 138.875, 122.25, 84.2142857143, 196.666666667, 152.166666667],
-[139.0, 0.0, 150.111111111, 332.666666667, 206.153846154, 201.769230769, 158.333333333, 77.5, 114.5, 183.5, 178.142857143],
-[139.0, 1.0, 160.333333333, 315.8, 174.25, 223.090909091, 203.0, 94.25, 106.583333333, 238.0, 141.25],
-[139.0, 2.0, 201.428571429, 300.5, 170.8125, 216.75, 203.0, 94.25, 106.461538462, 267.111111111, 139.0]])
-}
 
 if __name__ == "__main__":
     main()
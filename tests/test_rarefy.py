@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+from cogent.util.unit_test import TestCase, main
+from numpy import array
+from scipy.sparse import csr_matrix
+
+from evident.rarefy import (nested_rarefactions, rarefy, rarefy_iterations,
+    split_iterations)
+
+class TopLevelTests(TestCase):
+
+    def setUp(self):
+        self.counts = csr_matrix(array([[5, 0, 3, 2],
+                                        [1, 1, 0, 0],
+                                        [0, 10, 10, 0]]))
+
+    def test_rarefy(self):
+        "test the samples are rarefied to depth without replacement"
+        rarefied, kept = rarefy(self.counts, 4, seed=0)
+        self.assertEqual(kept.tolist(), [0, 2])
+        self.assertEqual(rarefied.shape, (2, 4))
+        dense = rarefied.toarray()
+        self.assertEqual(dense.sum(1).tolist(), [4, 4])
+        self.assertTrue((dense <= self.counts.toarray()[kept]).all())
+
+        # depth of a whole sample keeps it as is
+        rarefied, kept = rarefy(self.counts, 10, seed=0)
+        self.assertEqual(kept.tolist(), [0, 2])
+        self.assertEqual(rarefied.toarray()[0].tolist(), [5, 0, 3, 2])
+
+    def test_rarefy_small_samples(self):
+        "test the samples with fewer sequences than depth can be kept"
+        rarefied, kept = rarefy(self.counts, 4, seed=0,
+            include_small_samples=True)
+        self.assertEqual(kept.tolist(), [0, 1, 2])
+        self.assertEqual(rarefied.toarray()[1].tolist(), [1, 1, 0, 0])
+        self.assertEqual(rarefied.toarray()[[0, 2]].tolist(),
+            rarefy(self.counts, 4, seed=0)[0].toarray().tolist())
+
+    def test_rarefy_seed(self):
+        "test the same seed gives the same rarefaction"
+        first = rarefy(self.counts, 6, seed=7)[0].toarray()
+        self.assertEqual(first.tolist(),
+            rarefy(self.counts, 6, seed=7)[0].toarray().tolist())
+
+    def test_rarefy_iterations(self):
+        "test the iterations are stacked and follow the hypergeometric mean"
+        counts = array([[50, 30, 20, 0, 100]])
+        stacked, kept = rarefy_iterations(counts, 20, 5000, seed=0)
+        self.assertEqual(stacked.shape, (5000, 5))
+        self.assertEqual(kept.tolist(), [0])
+        self.assertTrue((stacked.toarray().sum(1) == 20).all())
+        self.assertFloatEqual(stacked.toarray().mean(0), [5, 3, 2, 0, 10],
+            eps=0.1)
+
+        stacked, kept = rarefy_iterations(self.counts, 4, 3, seed=1)
+        iterations = split_iterations(stacked, 3)
+        self.assertEqual(len(iterations), 3)
+        for rarefied in iterations:
+            self.assertEqual(rarefied.shape, (2, 4))
+            self.assertEqual(rarefied.toarray().sum(1).tolist(), [4, 4])
+        self.assertEqual(stacked.toarray().tolist(), rarefy_iterations(
+            self.counts, 4, 3, seed=1)[0].toarray().tolist())
+
+    def test_nested_rarefactions(self):
+        "test the shallower depths are contained in the deeper ones"
+        rarefactions = nested_rarefactions(self.counts, [3, 6, 9], 2, seed=0)
+        self.assertEqual([(d, i) for d, i, r, k in rarefactions],
+            [(3, 0), (3, 1), (6, 0), (6, 1), (9, 0), (9, 1)])
+        by_depth = dict([((d, i), (r.toarray(), k.tolist()))
+            for d, i, r, k in rarefactions])
+        self.assertEqual(by_depth[(3, 0)][1], [0, 2])
+        self.assertEqual(by_depth[(9, 1)][1], [0, 2])
+        for iteration in [0, 1]:
+            previous = None
+            for depth in [3, 6, 9]:
+                rarefied, kept = by_depth[(depth, iteration)]
+                self.assertEqual(rarefied.sum(1).tolist(), [depth, depth])
+                self.assertTrue((rarefied <= self.counts.toarray()[kept]).all())
+                if previous is not None:
+                    self.assertTrue((previous <= rarefied).all())
+                previous = rarefied
+
+        # samples are only rarefied to the depths they have
+        rarefactions = nested_rarefactions(self.counts, [2, 5], 1, seed=0)
+        self.assertEqual([k.tolist() for d, i, r, k in rarefactions],
+            [[0, 1, 2], [0, 2]])
+
+    def test_nested_rarefactions_mean(self):
+        "test every depth follows the hypergeometric mean"
+        counts = array([[50, 30, 20, 0, 100]])
+        rarefactions = nested_rarefactions(counts, [20, 100], 1000, seed=1)
+        for depth, expected in [(20, [5, 3, 2, 0, 10]),
+                                (100, [25, 15, 10, 0, 50])]:
+            rarefied = array([r.toarray()[0] for d, i, r, k in rarefactions
+                if d == depth])
+            self.assertFloatEqual(rarefied.mean(0), expected, eps=0.1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+from os import listdir
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from cogent.util.unit_test import TestCase, main
+
+from biom.parse import parse_biom_table
+from biom.exception import TableException
+from evident.study import (StudyBundle, get_study_table, is_study_bundle,
+    write_study_bundle)
+from evident.subsampling import select_samples
+from evident.util import biom_table_to_csr
+
+class TopLevelTests(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = mkdtemp()
+        self.bundle_dir = join(self.tmp_dir, 'study_bundle')
+        self.biom_table = parse_biom_table(biom_string)
+        self.map_headers = ['SampleID', 'HOST_SUBJECT_ID', 'Description']
+        self.map_data = [['S1', 'A', 'fine sand'], ['S2', 'A', 'fine sand'],
+            ['S3', 'B', 'clay'], ['S4', 'B', 'fine sand']]
+        write_study_bundle(self.bundle_dir, self.biom_table, self.map_data,
+            self.map_headers)
+
+    def tearDown(self):
+        rmtree(self.tmp_dir)
+
+    def test_bundle(self):
+        "test the bundle has the counts, ids and mapping file of the study"
+        self.assertTrue(is_study_bundle(self.bundle_dir))
+        self.assertFalse(is_study_bundle(self.bundle_dir + '_missing'))
+
+        bundle = StudyBundle(self.bundle_dir)
+        # the counts are read-only views of the memory-mapped files
+        for values in [bundle.counts.data, bundle.counts.indices,
+                       bundle.counts.indptr]:
+            self.assertFalse(values.flags.owndata)
+            self.assertFalse(values.flags.writeable)
+        counts, sample_ids, otu_ids = biom_table_to_csr(bundle)
+        exp_counts, exp_sample_ids, exp_otu_ids = biom_table_to_csr(
+            self.biom_table)
+        self.assertEqual(counts.toarray().tolist(),
+            exp_counts.toarray().tolist())
+        self.assertEqual(sample_ids, exp_sample_ids)
+        self.assertEqual(otu_ids, exp_otu_ids)
+        self.assertEqual(bundle.mapping_file(), (self.map_data,
+            self.map_headers))
+
+    def test_biom_table(self):
+        "test the tables of the bundle are the filtered tables"
+        bundle = StudyBundle(self.bundle_dir)
+        self.assertEqual(bundle.biom_table([1, 3]),
+            self.biom_table.filterSamples(lambda v,id,md: id in ['S2', 'S4']))
+        # the last OTU is not in S1
+        self.assertEqual(bundle.biom_table([0]),
+            self.biom_table.filterSamples(lambda v,id,md: id == 'S1'))
+        self.assertRaises(TableException, bundle.biom_table, [])
+
+        # the selections are repeated on the bundle
+        chosen, table, selection = select_samples(self.map_data,
+            self.map_headers, bundle, 3, 'HOST_SUBJECT_ID', 2, 1, seed=1,
+            selection=True)
+        self.assertEqual(selection.filter(bundle), table)
+        self.assertEqual(selection.rarefied(bundle)[1:],
+            selection.rarefied(self.biom_table)[1:])
+
+        # select_samples gets the same samples from the bundle
+        for seed in range(5):
+            self.assertEqual(select_samples(self.map_data, self.map_headers,
+                bundle, 3, 'HOST_SUBJECT_ID', 2, 1, seed=seed),
+                select_samples(self.map_data, self.map_headers,
+                self.biom_table, 3, 'HOST_SUBJECT_ID', 2, 1, seed=seed))
+
+    def test_get_study_table(self):
+        "test the bundles are loaded once and the biom files without them"
+        study_fp = join(self.tmp_dir, 'study')
+        bundle = get_study_table(study_fp)
+        self.assertTrue(isinstance(bundle, StudyBundle))
+        self.assertTrue(get_study_table(study_fp) is bundle)
+
+        other_fp = join(self.tmp_dir, 'other')
+        open(other_fp + '.biom', 'w').write(biom_string)
+        self.assertEqual(get_study_table(other_fp), self.biom_table)
+
+    def test_rewrite_bundle(self):
+        "test a bundle is replaced without changing the loaded one"
+        study_fp = join(self.tmp_dir, 'study')
+        bundle = get_study_table(study_fp)
+        # S1 is dropped, the arrays have other sizes
+        other_table = self.biom_table.filterSamples(lambda v,id,md: id != 'S1')
+        write_study_bundle(self.bundle_dir, other_table, self.map_data[1:],
+            self.map_headers)
+        self.assertEqual(listdir(self.tmp_dir), ['study_bundle'])
+
+        # the memory-mapped arrays still have the previous bundle
+        self.assertEqual(bundle.SampleIds, ['S1', 'S2', 'S3', 'S4'])
+        self.assertEqual(biom_table_to_csr(bundle)[0].toarray().tolist(),
+            biom_table_to_csr(self.biom_table)[0].toarray().tolist())
+
+        # the new bundle is loaded
+        new_bundle = get_study_table(study_fp)
+        self.assertFalse(new_bundle is bundle)
+        self.assertEqual(new_bundle.SampleIds, ['S2', 'S3', 'S4'])
+        self.assertEqual(new_bundle.biom_table([0, 1, 2]), other_table)
+        self.assertTrue(get_study_table(study_fp) is new_bundle)
+
+biom_string = '{"rows": [{"id": "1", "metadata": null}, {"id": "2", "metadata": null}, {"id": "3", "metadata": null}], "format": "Biological Observation Matrix 1.0.0", "data": [[0, 0, 4.0], [0, 2, 1.0], [1, 0, 2.0], [1, 1, 5.0], [1, 3, 3.0], [2, 1, 1.0], [2, 2, 6.0], [2, 3, 2.0]], "columns": [{"id": "S1", "metadata": null}, {"id": "S2", "metadata": null}, {"id": "S3", "metadata": null}, {"id": "S4", "metadata": null}], "generated_by": "test_biom", "matrix_type": "sparse", "shape": [3, 4], "format_url": "http://biom-format.org", "date": "2013-04-01T10:00:00.000000", "type": "OTU table", "id": null, "matrix_element_type": "float"}'
+
+if __name__ == "__main__":
+    main()
@@ -13,11 +13,15 @@ __status__ = "Development"
 
 
 from cogent.util.unit_test import TestCase, main
+from numpy import array
+from numpy.random import RandomState
 from qiime.util import get_qiime_temp_dir, get_tmp_filename
 
 from biom.parse import parse_biom_table
 from biom.exception import TableException
-from evident.subsampling import select_samples
+from evident.rarefy import rarefy_biom_table
+from evident.subsampling import (select_samples, Selection,
+    _stratified_order)
 
 class TopLevelTests(TestCase):
     
@@ -33,6 +37,8 @@ class TopLevelTests(TestCase):
                                 ['S7', 'C', 'candler fine sand'],
                                 ['S8', 'C', 'candler fine sand']]
         self.expected_biom_string = output_biom_string_a
+        self.subject_of_sample = dict([(row[0], row[1])
+            for row in self.mapping_file_data])
 
     def test_select_samples(self):
 
@@ -50,6 +56,105 @@ class TopLevelTests(TestCase):
                 self.mapping_file_data, self.mapping_file_headers, 
                 self.biom_object, 200, 'HOST_SUBJECT_ID', 1, 1)
 
+    def test_select_samples_rarefied(self):
+        "the rarefied table is the rarefaction of the chosen samples"
+        out_chosen_samples, out_biom_table, out_rarefied = select_samples(\
+            self.mapping_file_data, self.mapping_file_headers, self.biom_object,\
+            20, 'HOST_SUBJECT_ID', 2, 1, rarefied=True, seed=3)
+
+        # one sample of A and one of C, the only subjects with 20 sequences
+        self.assertEqual(len(out_chosen_samples), 2)
+        self.assertTrue('S2' in out_chosen_samples)
+        self.assertTrue('S7' in out_chosen_samples or
+            'S8' in out_chosen_samples)
+        self.assertEqual(sorted(out_biom_table.SampleIds),
+            sorted(out_chosen_samples))
+
+        counts, sample_ids, otu_ids = out_rarefied
+        exp_counts, exp_sample_ids, exp_otu_ids = rarefy_biom_table(
+            out_biom_table, 20, 3)
+        self.assertEqual(sample_ids, exp_sample_ids)
+        self.assertEqual(otu_ids, exp_otu_ids)
+        self.assertEqual(counts.toarray().tolist(),
+            exp_counts.toarray().tolist())
+        self.assertEqual(counts.sum(1).tolist(), [[20]]*2)
+
+    def test_select_samples_seed(self):
+        "the same seed chooses the same samples"
+        for seed in range(10):
+            first = select_samples(self.mapping_file_data,
+                self.mapping_file_headers, self.biom_object, 1,
+                'HOST_SUBJECT_ID', 2, 2, seed=seed)[0]
+            second = select_samples(self.mapping_file_data,
+                self.mapping_file_headers, self.biom_object, 1,
+                'HOST_SUBJECT_ID', 2, 2, seed=seed)[0]
+            self.assertEqual(first, second)
+            # two subjects, grouped, with two samples each
+            subjects = [self.subject_of_sample[s] for s in first]
+            self.assertEqual(len(set(subjects)), 2)
+            self.assertEqual(subjects[0], subjects[1])
+            self.assertEqual(subjects[2], subjects[3])
+
+    def test_select_samples_stratify(self):
+        "the subjects are taken from each value of the category in turn"
+        headers = self.mapping_file_headers + ['SOIL']
+        data = [row + [soil] for row, soil in zip(self.mapping_file_data,
+            ['dry', 'dry', 'dry', 'wet', 'wet', 'wet', 'dry', 'dry'])]
+        for seed in range(10):
+            chosen = select_samples(data, headers, self.biom_object, 1,
+                'HOST_SUBJECT_ID', 2, 1, seed=seed, stratify='SOIL')[0]
+            # B is the only wet subject
+            self.assertEqual(len([s for s in chosen if s in
+                ['S4', 'S5', 'S6']]), 1)
+
+    def test_stratified_order(self):
+        "each turn takes one of each stratum, in its own random order"
+        candidates = array([10, 11, 12, 13, 14, 15])
+        strata = array([0, 0, 1, 1, 2, 2])
+        same_order = 0
+        for seed in range(20):
+            order = _stratified_order(candidates, strata, RandomState(seed))
+            self.assertEqual(sorted(order.tolist()), candidates.tolist())
+            turns = [[(c - 10)//2 for c in order[:3]],
+                [(c - 10)//2 for c in order[3:]]]
+            self.assertEqual(sorted(turns[0]), [0, 1, 2])
+            self.assertEqual(sorted(turns[1]), [0, 1, 2])
+            same_order += turns[0] == turns[1]
+        self.assertTrue(same_order < 20)
+        self.assertEqual(_stratified_order(candidates[:0], strata[:0],
+            RandomState(0)).tolist(), [])
+
+    def test_select_samples_selection(self):
+        "the selection identifies and repeats the choice"
+        chosen, table, selection = select_samples(self.mapping_file_data,
+            self.mapping_file_headers, self.biom_object, 1, 'HOST_SUBJECT_ID',
+            2, 2, seed=7, selection=True)
+        self.assertTrue(isinstance(selection, Selection))
+        self.assertEqual(selection.seed, 7)
+        self.assertEqual(sorted(selection.sample_ids(self.biom_object)),
+            sorted(chosen))
+        self.assertEqual(selection.filter(self.biom_object), table)
+
+        again = select_samples(self.mapping_file_data,
+            self.mapping_file_headers, self.biom_object, 1, 'HOST_SUBJECT_ID',
+            2, 2, seed=7, selection=True)[2]
+        self.assertEqual(again.key(), selection.key())
+        other = select_samples(self.mapping_file_data,
+            self.mapping_file_headers, self.biom_object, 1, 'HOST_SUBJECT_ID',
+            2, 1, seed=7, selection=True)[2]
+        self.assertNotEqual(other.key(), selection.key())
+
+        # the rarefied table is rebuilt from the selection
+        rarefied, selection = select_samples(self.mapping_file_data,
+            self.mapping_file_headers, self.biom_object, 20,
+            'HOST_SUBJECT_ID', 2, 1, rarefied=True, seed=3,
+            selection=True)[2:]
+        counts, sample_ids, otu_ids = selection.rarefied(self.biom_object)
+        self.assertEqual(sample_ids, rarefied[1])
+        self.assertEqual(otu_ids, rarefied[2])
+        self.assertEqual(counts.toarray().tolist(),
+            rarefied[0].toarray().tolist())
+
 input_biom_string = '{"rows": [{"id": "1", "metadata": null}, {"id": "2", "metadata": null}, {"id": "3", "metadata": null}, {"id": "4", "metadata": null}, {"id": "5", "metadata": null}, {"id": "6", "metadata": null}, {"id": "7", "metadata": null}, {"id": "8", "metadata": null}, {"id": "9", "metadata": null}, {"id": "10", "metadata": null}], "format": "Biological Observation Matrix 1.0.0", "data": [[0, 6, 14.0], [1, 3, 1.0], [1, 7, 5.0], [2, 4, 1.0], [2, 6, 4.0], [2, 7, 4.0], [4, 0, 4.0], [4, 1, 12.0], [4, 2, 4.0], [4, 3, 1.0], [4, 4, 1.0], [4, 5, 8.0], [4, 6, 8.0], [4, 7, 1.0], [5, 1, 11.0], [5, 2, 2.0], [5, 3, 2.0], [5, 4, 1.0], [5, 5, 4.0], [5, 6, 8.0], [5, 7, 22.0], [6, 1, 3.0], [6, 4, 2.0], [6, 5, 3.0], [6, 6, 4.0], [6, 7, 4.0], [7, 0, 2.0], [8, 0, 5.0], [8, 4, 1.0], [8, 6, 4.0], [8, 7, 1.0], [9, 6, 1.0]], "columns": [{"id": "S1", "metadata": null}, {"id": "S2", "metadata": null}, {"id": "S3", "metadata": null}, {"id": "S4", "metadata": null}, {"id": "S5", "metadata": null}, {"id": "S6", "metadata": null}, {"id": "S7", "metadata": null}, {"id": "S8", "metadata": null}], "generated_by": "BIOM-Format 1.0.0-dev", "matrix_type": "sparse", "shape": [10, 8], "format_url": "http://biom-format.org", "date": "2012-09-26T11:10:15.531807", "type": "OTU table", "id": null, "matrix_element_type": "float"}'
 output_biom_string_a = '{"rows": [{"id": "1", "metadata": null}, {"id": "2", "metadata": null}, {"id": "3", "metadata": null}, {"id": "4", "metadata": null}, {"id": "5", "metadata": null}, {"id": "6", "metadata": null}, {"id": "7", "metadata": null}, {"id": "8", "metadata": null}, {"id": "9", "metadata": null}, {"id": "10", "metadata": null}], "format": "Biological Observation Matrix 1.0.0", "data": [[0, 0, 14.0], [2, 0, 4.0], [4, 0, 8.0], [5, 0, 8.0], [6, 0, 4.0], [8, 0, 4.0], [9, 0, 1.0]], "columns": [{"id": "S7", "metadata": null}], "generated_by": "test_biom", "matrix_type": "sparse", "shape": [10, 1], "format_url": "http://biom-format.org", "date": "2012-09-27T15:52:08.334245", "type": "OTU table", "id": null, "matrix_element_type": "float"}'
 
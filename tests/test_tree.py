@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+from os import listdir
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from cogent.util.unit_test import TestCase, main
+from cogent.parse.tree import DndParser
+from numpy import array, bincount, logical_or
+from scipy.sparse import csr_matrix
+
+from evident.alpha import faith_pd
+from evident.tree import (ArrayTree, tree_to_arrays, as_array_tree,
+    array_tree_dir, get_study_tree, get_tree, is_array_tree_dir)
+from evident.unifrac import unweighted_unifrac
+
+class TopLevelTests(TestCase):
+
+    def setUp(self):
+        self.newick = ('(((O1:0.06,O2:0.1)A:0.031,(O3:0.001,O4:0.01)B:0.2)'
+            'AB:0.4,((O5:0.03,O6:0.02)C:0.13,(O7:0.01,O8:0.005)D:0.1)CD:0.3)'
+            'root;')
+        self.tree = DndParser(self.newick)
+
+    def test_tree_to_arrays(self):
+        "test the postorder encoding of a tree"
+        obs = tree_to_arrays(self.tree)
+        self.assertEqual(len(obs), 15)
+        self.assertEqual(obs.parents.tolist(), [2, 2, 6, 5, 5, 6, 14, 9, 9,
+            13, 12, 12, 13, 14, -1])
+        self.assertFloatEqual(obs.lengths, [0.06, 0.1, 0.031, 0.001, 0.01,
+            0.2, 0.4, 0.03, 0.02, 0.13, 0.01, 0.005, 0.1, 0.3, 0])
+        self.assertEqual(obs.tip_names, ['O1', 'O2', 'O3', 'O4', 'O5', 'O6',
+            'O7', 'O8'])
+        self.assertEqual(obs.tips.tolist(), [0, 1, 3, 4, 7, 8, 10, 11])
+        self.assertEqual(obs.tip_nodes(['O8', 'O1']).tolist(), [11, 0])
+        self.assertRaises(ValueError, obs.tip_nodes, ['O1', 'O9'])
+
+    def test_propagate(self):
+        "test accumulating values from the tips to the root"
+        array_tree = tree_to_arrays(self.tree)
+        tips = array_tree.tip_nodes(['O1', 'O2', 'O4', 'O7'])
+        counts = array_tree.propagate(tips, array([1, 2, 3, 4]))
+        self.assertEqual(counts.tolist(), [1, 2, 3, 0, 3, 3, 6, 0, 0, 0, 4, 0,
+            4, 4, 10])
+
+        presence = array([[True, False], [False, False], [True, True],
+            [False, True]])
+        obs = array_tree.propagate(tips, presence, logical_or)
+        self.assertEqual(obs[:,0].tolist(), [True, False, True, False, True,
+            True, True, False, False, False, False, False, False, False, True])
+        self.assertEqual(obs[:,1].tolist(), [False, False, False, False, True,
+            True, True, False, False, False, True, False, True, True, True])
+
+        # inactive nodes don't pass their values to their parents
+        active = counts > 0
+        active[13] = False
+        obs = array_tree.propagate(tips, array([1, 2, 3, 4]), active=active)
+        self.assertEqual(obs[13], 4)
+        self.assertEqual(obs[14], 6)
+
+    def test_ancestors(self):
+        "test the paths from the tips to the root"
+        tree = tree_to_arrays(self.tree)
+        obs = tree.ancestors(tree.tip_nodes(['O2', 'O5']))
+        self.assertEqual(obs.shape, (15, 2))
+        self.assertEqual(obs[:, 0].nonzero()[0].tolist(), [1, 2, 6, 14])
+        self.assertEqual(obs[:, 1].nonzero()[0].tolist(), [7, 9, 13, 14])
+
+    def test_as_array_tree(self):
+        "test the conversion is cached per tree object"
+        array_tree = as_array_tree(self.tree)
+        self.assertTrue(isinstance(array_tree, ArrayTree))
+        self.assertTrue(as_array_tree(self.tree) is array_tree)
+        self.assertTrue(as_array_tree(array_tree) is array_tree)
+
+    def test_save_load(self):
+        "test the saved tree is loaded memory-mapped and gives the same values"
+        tmp_dir = mkdtemp()
+        try:
+            array_tree = tree_to_arrays(self.tree)
+            tree_dir = join(tmp_dir, 'tree')
+            self.assertFalse(is_array_tree_dir(tree_dir))
+            array_tree.save(tree_dir)
+            self.assertTrue(is_array_tree_dir(tree_dir))
+
+            loaded = ArrayTree.load(tree_dir)
+            self.assertFalse(loaded.parents.flags.writeable)
+            self.assertEqual(loaded.parents.tolist(),
+                array_tree.parents.tolist())
+            self.assertFloatEqual(loaded.lengths, array_tree.lengths)
+            self.assertEqual(loaded.tip_names, array_tree.tip_names)
+            self.assertEqual(loaded.tip_nodes(['O8', 'O1']).tolist(), [11, 0])
+
+            tips = loaded.tip_nodes(['O1', 'O2', 'O4', 'O7'])
+            self.assertEqual(loaded.propagate(tips, array([1, 2, 3,
+                4])).tolist(), array_tree.propagate(tips, array([1, 2, 3,
+                4])).tolist())
+            counts = array([[1, 0, 2, 0, 0, 0, 0, 1], [0, 3, 0, 0, 1, 1, 0, 0],
+                [0, 0, 0, 4, 0, 0, 2, 0]])
+            otu_ids = ['O%d' % i for i in range(1, 9)]
+            self.assertFloatEqual(unweighted_unifrac(counts, otu_ids, loaded),
+                unweighted_unifrac(counts, otu_ids, self.tree))
+        finally:
+            rmtree(tmp_dir)
+
+    def test_get_tree(self):
+        "test the trees are loaded once, from the arrays if converted"
+        tmp_dir = mkdtemp()
+        try:
+            tree_fp = join(tmp_dir, 'small.tre')
+            open(tree_fp, 'w').write(self.newick)
+            self.assertEqual(array_tree_dir(tree_fp), join(tmp_dir,
+                'small_arrays'))
+
+            parsed = get_tree(tree_fp)
+            self.assertEqual(parsed.parents.tolist(),
+                tree_to_arrays(self.tree).parents.tolist())
+            self.assertTrue(get_tree(tree_fp) is parsed)
+
+            other_fp = join(tmp_dir, 'other.tre')
+            open(other_fp, 'w').write('(X:1.0,Y:2.0)root;')
+            tree_to_arrays(self.tree).save(array_tree_dir(other_fp))
+            # the converted arrays are used instead of the Newick file
+            converted = get_tree(other_fp)
+            self.assertEqual(converted.tip_names,
+                ['O1', 'O2', 'O3', 'O4', 'O5', 'O6', 'O7', 'O8'])
+
+            # converting the tree again replaces the arrays, the loaded tree
+            # keeps the previous ones and the new ones are loaded
+            tree_to_arrays(self.tree).shear(['O1', 'O2']).save(
+                array_tree_dir(other_fp))
+            self.assertEqual(sorted(listdir(tmp_dir)), ['other.tre',
+                'other_arrays', 'small.tre'])
+            self.assertEqual(converted.lengths.tolist(),
+                tree_to_arrays(self.tree).lengths.tolist())
+            self.assertEqual(get_tree(other_fp).tip_names, ['O1', 'O2'])
+        finally:
+            rmtree(tmp_dir)
+
+    def test_shear(self):
+        "test the sheared tree gives the same diversity as the full tree"
+        array_tree = tree_to_arrays(self.tree)
+        sheared = array_tree.shear(['O7', 'O1', 'O2', 'O5', 'missing'])
+        self.assertEqual(sheared.tip_names, ['O1', 'O2', 'O5', 'O7'])
+        # AB, C and D are left with one child, their branches are added to
+        # the ones of A, O5 and O7
+        self.assertEqual(sheared.parents.tolist(), [2, 2, 6, 5, 5, 6, -1])
+        self.assertFloatEqual(sheared.lengths, [0.06, 0.1, 0.431, 0.16, 0.11,
+            0.3, 0.0])
+        self.assertEqual(bincount(sheared.parents[:-1]).tolist(),
+            [0, 0, 2, 0, 0, 2, 2])
+
+        # the OTUs of the study are the tips of its tree
+        counts = array([[1, 2, 0, 1], [0, 3, 1, 0], [0, 0, 0, 2],
+            [0, 0, 1, 4]])
+        otu_ids = ['O1', 'O2', 'O5', 'O7']
+        self.assertFloatEqual(unweighted_unifrac(counts, otu_ids, sheared),
+            unweighted_unifrac(counts, otu_ids, self.tree))
+        self.assertFloatEqual(faith_pd(csr_matrix(counts), otu_ids, sheared),
+            faith_pd(csr_matrix(counts), otu_ids, self.tree))
+        self.assertRaises(ValueError, array_tree.shear, ['missing'])
+
+    def test_get_study_tree(self):
+        "test the tree of a study is loaded, or the full tree without it"
+        tmp_dir = mkdtemp()
+        try:
+            tree_fp = join(tmp_dir, 'full.tre')
+            open(tree_fp, 'w').write(self.newick)
+            tree_dir = join(tmp_dir, 'study_tree')
+            self.assertTrue(get_study_tree(tree_dir, tree_fp) is
+                get_tree(tree_fp))
+
+            tree_to_arrays(self.tree).shear(['O3', 'O4']).save(tree_dir)
+            study_tree = get_study_tree(tree_dir, tree_fp)
+            self.assertEqual(study_tree.tip_names, ['O3', 'O4'])
+            self.assertTrue(get_study_tree(tree_dir, tree_fp) is study_tree)
+
+            # the study is processed again
+            tree_to_arrays(self.tree).shear(['O5', 'O6', 'O7']).save(tree_dir)
+            self.assertEqual(study_tree.tip_names, ['O3', 'O4'])
+            self.assertEqual(get_study_tree(tree_dir, tree_fp).tip_names,
+                ['O5', 'O6', 'O7'])
+        finally:
+            rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
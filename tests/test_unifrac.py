@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# File created on 18 Oct 2026
+from __future__ import division
+
+__author__ = "e-vident Development Team"
+__copyright__ = "Copyright 2013, The Evident Project"
+__credits__ = ["e-vident Development Team"]
+__license__ = "GPL"
+__version__ = ".9-dev"
+__maintainer__ = "Antonio Gonzalez"
+__email__ = "antgonza@gmail.com"
+__status__ = "Development"
+
+from cogent.util.unit_test import TestCase, main
+from cogent.parse.tree import DndParser
+from numpy import array
+from numpy.random import RandomState
+from scipy.sparse import csr_matrix
+
+from biom.table import SparseOTUTable, table_factory
+from qiime.beta_diversity import single_object_beta
+from qiime.parse import parse_distmat
+from evident.unifrac import unweighted_unifrac
+
+class TopLevelTests(TestCase):
+
+    def setUp(self):
+        self.tree = DndParser('(((O1:0.06,O2:0.1)A:0.031,(O3:0.001,O4:0.01)'
+            'B:0.2)AB:0.4,((O5:0.03,O6:0.02)C:0.13,(O7:0.01,O8:0.005)D:0.1)'
+            'CD:0.3)root;')
+        self.otu_ids = ['O1', 'O2', 'O3', 'O5', 'O8']
+        self.counts = array([[10, 3, 0, 0, 0],
+                             [4, 0, 1, 0, 0],
+                             [0, 0, 0, 7, 0]])
+
+    def test_unweighted_unifrac(self):
+        "test the distances between all samples"
+        exp = array([[0, 0.38005050505050503, 1],
+                     [0.38005050505050503, 0, 1],
+                     [1, 1, 0]])
+        obs = unweighted_unifrac(self.counts, self.otu_ids, self.tree)
+        self.assertFloatEqual(obs, exp)
+        # sparse counts, condensed output
+        obs = unweighted_unifrac(csr_matrix(self.counts), self.otu_ids,
+            self.tree, condensed=True)
+        self.assertFloatEqual(obs, [0.38005050505050503, 1, 1])
+
+    def test_unweighted_unifrac_root(self):
+        "test the branches above the observed OTUs are used, as in QIIME"
+        counts = array([[10, 3, 0, 0, 0],
+                        [4, 0, 0, 0, 0]])
+        obs = unweighted_unifrac(counts, self.otu_ids, self.tree)
+        self.assertFloatEqual(obs, [[0, 0.1/0.591], [0.1/0.591, 0]])
+
+        # the branch above the root is not part of the tree, as in faith_pd
+        tree = DndParser(str(self.tree).replace('root;', 'root:0.5;'))
+        self.assertEqual(tree.Length, 0.5)
+        self.assertFloatEqual(unweighted_unifrac(self.counts, self.otu_ids,
+            tree), unweighted_unifrac(self.counts, self.otu_ids, self.tree))
+
+    def test_unweighted_unifrac_qiime(self):
+        "test the distances are the ones of QIIME on random tables"
+        random = RandomState(0)
+        otu_ids = ['O%d' % i for i in range(40)]
+        for i in range(30):
+            tree = DndParser(random_newick(otu_ids, random))
+            counts = random.poisson(1, (6, 40)) * (random.rand(6, 40) < 0.3)
+            counts = counts[counts.sum(1) > 0]
+            sample_ids = ['S%d' % j for j in range(len(counts))]
+            biom_table = table_factory(counts.T, sample_ids, otu_ids,
+                constructor=SparseOTUTable)
+            exp = parse_distmat(single_object_beta(biom_table,
+                'unweighted_unifrac', tree))[1]
+            self.assertFloatEqual(unweighted_unifrac(counts, otu_ids, tree),
+                exp)
+
+    def test_unweighted_unifrac_missing_otu(self):
+        "test observed OTUs that are not in the tree raise an error"
+        self.counts[1][4] = 1
+        self.assertRaises(ValueError, unweighted_unifrac, self.counts,
+            ['O1', 'O2', 'O3', 'O5', 'O9'], self.tree)
+
+def random_newick(tip_names, random):
+    """Return a random binary tree of tip_names with random branch lengths"""
+    nodes = ['%s:%.3f' % (name, random.rand()) for name in tip_names]
+    for i in range(len(tip_names) - 1):
+        first, second = sorted(random.choice(len(nodes), 2, replace=False))
+        child = nodes.pop(second)
+        nodes.append('(%s,%s)N%d:%.3f' % (nodes.pop(first), child, i,
+            random.rand()))
+    return nodes[0].rsplit(':', 1)[0] + ';'
+
+
+if __name__ == "__main__":
+    main()
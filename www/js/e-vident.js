@@ -84,6 +84,8 @@ function disableInterface() {
         $("#sampleslider").slider("disable");
         $("#sequenceslider").slider("disable");
         $("#iterationslider").slider("disable");
+        document.getElementById('seed').disabled = true;
+        document.getElementById('stratify').disabled = true;
         document.getElementById('optimize').disabled = true;
         $("#columns").css("color",'#ccc');
         for(i=0; i< document.visualizations.length; i++){
@@ -96,6 +98,8 @@ function enableInterface() {
         $("#sampleslider").slider("enable");
         $("#sequenceslider").slider("enable");
         $("#iterationslider").slider("enable");
+        document.getElementById('seed').disabled = false;
+        document.getElementById('stratify').disabled = false;
         document.getElementById('optimize').disabled = false;
         $("#columns").css("color",'#000');
         for(i=0; i< document.visualizations.length; i++){
@@ -107,20 +111,14 @@ function enableInterface() {
 
 function toggleSliders() {
     var studyname = document.getElementById('studycombobox')[document.getElementById('studycombobox').selectedIndex].value;
-    var lines = studydata[studyname][1].split('?');
-    //first line is a header
-    lines.shift();
-    slidervals = [];
-
-    for(var i=0; i < lines.length; i++)
-    {
-        slidervals.push(lines[i].split('\t'));
-    }
+    //min and max sequences per sample of the study, what is available at
+    //each depth is queried when the sequences slider changes
+    slidervals = [studydata[studyname][1], studydata[studyname][2]];
     
     if(document.visualizations[0].checked)
     {        
         var seqs = parseInt(demodata[studyname]);     
-        $("#sequenceslider").slider('option','max', parseInt(slidervals[slidervals.length-1][0]));
+        $("#sequenceslider").slider('option','max', slidervals[1]);
         $("#sequenceslider").slider('option','value', seqs);
         if(seqs == 0)
             document.getElementById('sequences').innerHTML = 'N/A'
@@ -137,8 +135,8 @@ function toggleSliders() {
         $("#sequenceslider").slider("enable");
         $("#iterationslider").slider("enable");
         
-        $("#sequenceslider").slider('option','max', parseInt(slidervals[slidervals.length-1][0]));
-        $("#sequenceslider").slider('option','value', parseInt(slidervals[0][0]));
+        $("#sequenceslider").slider('option','max', slidervals[1]);
+        $("#sequenceslider").slider('option','value', slidervals[0]);
     }
 }
 
@@ -162,8 +160,8 @@ function studyChanged() {
         
     }
     else {    
-        $("#sequenceslider").slider('option','max', parseInt(slidervals[slidervals.length-1][0]));
-        $("#sequenceslider").slider('option','value', parseInt(slidervals[0][0]));
+        $("#sequenceslider").slider('option','max', slidervals[1]);
+        $("#sequenceslider").slider('option','value', slidervals[0]);
     }
     toggleSliders();
 }
@@ -233,6 +231,9 @@ $(function(){
                         samples:  $("#sampleslider").slider("value"),
                         sequences: $("#sequenceslider").slider("value"),
                         iterations: $("#iterationslider").slider("value"),
+                        //the same seed and parameters choose the same samples
+                        seed: parseInt(document.getElementById('seed').value) || 0,
+                        stratify: document.getElementById('stratify').value,
                         demo: document.visualizations[0].checked,
                         pcoa: document.visualizations[1].checked,
                         alpha_stddev: document.visualizations[2].checked,
@@ -320,28 +321,31 @@ function seqsChanged(ui) {
 	document.getElementById('sequences').innerHTML = ui.value+"/"+$("#sequenceslider").slider('option','max');
 	
 	var numseqs = ui.value;
-	var seqsindex = 0;
-	
-	//figure out the highest index of seqs per sample
-	//that the current number falls under
-    for(var i = 0; i < slidervals.length; i++)
-    {
-        if(numseqs < slidervals[i][0])
-        {
-            seqsindex = Math.max(i-1,0); //make sure not to get -1
-            break;
-        }
-        if(numseqs == slidervals[i][0])
-        {
-            seqsindex = i;
-            break;
-        }
-    }
+	var studyname = document.getElementById('studycombobox')[document.getElementById('studycombobox').selectedIndex].value;
+	if(studyname == '')
+	    return;
 	
+	//the subjects, samples and columns available at this number of seqs
+	//per sample come from the index of the study; the slider can move
+	//before the response arrives, only the current value is shown
+    $.ajax({ url: 'lib.psp',
+                data: {fn: 'querySelectors', study: studyname, sequences: numseqs},
+                success: function(response) {
+                    if(numseqs == $("#sequenceslider").slider("value"))
+                        selectorsChanged(response);
+                }});
+}
+
+//function called with the selectors available at a number of sequences
+function selectorsChanged(response) {
+    var selectors = eval('('+response+')');
+    if(selectors == null)
+        return;
+    
 	//max number of subjects and samples corresponds to number of
 	//seqs per sample
-    var maxsubs = slidervals[seqsindex][1];
-    var maxsamps = slidervals[seqsindex][2];
+    var maxsubs = selectors['subjects'];
+    var maxsamps = selectors['samples'];
     
     //annoying hack to make the slider look right when the max
     //is 1
@@ -379,22 +383,23 @@ function seqsChanged(ui) {
     $("#sampleslider").slider('option','max', maxsamps);
     $("#sampleslider").slider('option','value', maxsamps);
     
-    //need to figure out the metadata columns for the current
-    //number of seqs per sample
-    columnsIndex = seqsindex;
-    for(columnsIndex = seqsindex; columnsIndex >= 0; columnsIndex--)
-    {
-        if(slidervals[columnsIndex][3] != 'None')
-            break;
-    }
-    
-    validColumns = slidervals[columnsIndex][3].split(',').sort();
+    validColumns = selectors['columns'].sort();
     //build a list of valid columns
     var columnsHTML = "<ul>";
     for(var i = 0; i < validColumns.length; i++)
         columnsHTML += "<li>"+validColumns[i]+"</li>";
     columnsHTML += "</ul>";
     document.getElementById("columns").innerHTML = columnsHTML;
+
+    //the subjects can be stratified by any of the valid columns, the
+    //current choice is kept if it's still valid
+    var stratify = document.getElementById('stratify').value;
+    var stratifyHTML = '<option value=\"\">None</option>';
+    for(var i = 0; i < validColumns.length; i++)
+        stratifyHTML += '<option value=\"'+validColumns[i]+'\">'+validColumns[i]+'</option>';
+    document.getElementById('stratify').innerHTML = stratifyHTML;
+    if($.inArray(stratify, validColumns) != -1)
+        document.getElementById('stratify').value = stratify;
 }
 
 //jquery to activate the sequences slider